@@ -1,7 +1,10 @@
 import click
-from .cli import grp
+from .cli import GLOBAL_OPTIONS, grp, main
+
 # from .utils import Config
 
 
-multi_group = click.CommandCollection(sources=[grp])
+multi_group = click.CommandCollection(
+    sources=[grp], params=GLOBAL_OPTIONS, callback=main
+)
 # config = Config()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from proglog import ProgressBarLogger
+
+from . import exceptions
+from .utils import config
+
+
+EXECUTOR_WORKERS_DEFAULT = 8
+CONFIG_EXECUTOR_WORKERS = "executor_workers"
+"""Threads running blocking work (downloads, encodes) for async callers."""
+
+_cancel = contextvars.ContextVar("cancel", default=None)
+"""Cancellation flag (threading.Event) of the work running in this thread."""
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def executor() -> Executor:
+    """Shared executor for blocking work (created on first use)."""
+
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.get(
+                    CONFIG_EXECUTOR_WORKERS, EXECUTOR_WORKERS_DEFAULT
+                ),
+                thread_name_prefix="autocontent",
+            )
+    return _executor
+
+
+def cancellable() -> bool:
+    """Whether current work was started by run (and may be cancelled)."""
+
+    return _cancel.get() is not None
+
+
+def checkpoint(*_) -> None:
+    """Abort current work if its caller was cancelled or timed out.
+
+    Accepts (and ignores) arguments, so it can be used as a callback/hook.
+    """
+
+    flag = _cancel.get()
+    if flag is not None and flag.is_set():
+        raise exceptions.OperationCancelled()
+
+
+class CheckpointLogger(ProgressBarLogger):
+    """moviepy (proglog) logger checking for cancellation on progress updates."""
+
+    def callback(self, **changes) -> None:
+        checkpoint()
+
+    def bars_callback(self, bar, attr, value, old_value=None) -> None:
+        checkpoint()
+
+
+async def run(
+    func: Callable,
+    *args,
+    timeout: float | None = None,
+    pool: Executor | None = None,
+    **kwargs,
+) -> Any:
+    """Run blocking function in an executor without blocking the event loop.
+
+    On cancellation or timeout the work is flagged, downloads and encodes stop
+    at their next progress update (checkpoint) with OperationCancelled.
+
+    - func (callable): blocking function
+    - timeout (float | None, optional (None)): seconds to wait for the result
+        (asyncio.TimeoutError is raised after)
+    - pool (Executor | None, optional (executor())): executor to use
+    """
+
+    flag = threading.Event()
+
+    def call() -> Any:
+        token = _cancel.set(flag)
+        try:
+            checkpoint()  # cancelled while queued
+            return func(*args, **kwargs)
+        finally:
+            _cancel.reset(token)
+
+    future = asyncio.get_running_loop().run_in_executor(pool or executor(), call)
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        flag.set()
+        raise
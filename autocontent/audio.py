@@ -0,0 +1,725 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from . import exceptions, ffmpeg, profiling, utils
+from .profiling import CAT_AUDIO
+
+
+PCM_FPS = 16000
+PCM_DTYPE = np.float32
+PCM_FORMAT = "f32le"
+"""Cached analysis PCM parameters (mono, float32, little-endian)."""
+
+ENVELOPE_BASE = 0.01
+ENVELOPE_LEVELS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
+"""Loudness envelope pyramid window sizes (seconds, multiples of the base)."""
+
+MODE_FIXED = "fixed"
+MODE_ADAPTIVE = "adaptive"
+MODE_TRANSCRIPT = "transcript"
+MODES = [MODE_FIXED, MODE_ADAPTIVE, MODE_TRANSCRIPT]
+"""Silence detection modes (absolute threshold, relative to noise floor,
+derived from transcript cues)."""
+
+ADAPTIVE_OPEN_DB = 12.0
+ADAPTIVE_CLOSE_DB = 6.0
+ADAPTIVE_HEADROOM_DB = 6.0
+ADAPTIVE_MIN_GAP = 0.3
+HISTOGRAM_MIN_DB = -100.0
+HISTOGRAM_BIN_DB = 1.0
+"""Adaptive detection defaults: speech starts this much above the noise floor,
+ends when it drops below the lower threshold, shorter pauses are kept."""
+
+TRANSCRIPT_MIN_GAP = 0.3
+REFINE_SEARCH = 0.3
+"""Transcript mode defaults: shorter pauses between cues are kept, boundaries
+are refined within this many seconds around cue edges."""
+
+SIDECAR_PCM = "pcm"
+SIDECAR_ENVELOPE = "env.npz"
+"""Sidecar file kinds for decoded audio and its loudness envelope."""
+
+
+def pcm_path(source: Path | str) -> Path:
+    """Decoded audio sidecar location (next to the source)."""
+
+    return utils.sidecar_path(source, SIDECAR_PCM)
+
+
+def _meta_path(source: Path | str) -> Path:
+    return utils.sidecar_path(source, f"{SIDECAR_PCM}.json")
+
+
+@profiling.timed("decode_pcm", CAT_AUDIO)
+def decode_pcm(source: Path | str, fps: int = PCM_FPS) -> Path:
+    """Decode audio track of a media file into mono PCM sidecar file.
+
+    - source (Path | str): audio/video file
+    - fps (int, optional (PCM_FPS)): sample rate
+    """
+
+    source = Path(source).absolute()
+    target = pcm_path(source)
+    fd, partial = tempfile.mkstemp(
+        prefix=f"{target.name}.", suffix=".part", dir=target.parent
+    )
+    os.close(fd)
+    partial = Path(partial)
+
+    try:
+        ffmpeg.run(
+            "-y",
+            "-i",
+            str(source),
+            "-vn",
+            "-ac",
+            "1",
+            "-ar",
+            str(fps),
+            "-f",
+            PCM_FORMAT,
+            str(partial),
+        )
+        partial.replace(target)
+    except exceptions.VideoException as e:
+        raise exceptions.VideoException(f"Unable to decode audio of {source}: {e}")
+    finally:
+        partial.unlink(missing_ok=True)
+
+    with open(_meta_path(source), "w") as f:
+        json.dump({"fps": fps, "source": utils.file_signature(source)}, f)
+
+    return target
+
+
+def cached_pcm(source: Path | str, fps: int = PCM_FPS) -> np.memmap | None:
+    """Memory-map decoded PCM if it is cached and up to date (no decoding)."""
+
+    source = Path(source).absolute()
+    target, meta_file = pcm_path(source), _meta_path(source)
+    if not (target.is_file() and meta_file.is_file()):
+        return None
+
+    with open(meta_file) as f:
+        meta = json.load(f)
+    if meta != {"fps": fps, "source": utils.file_signature(source)}:
+        return None
+
+    if not target.stat().st_size:
+        return np.zeros(0, dtype=PCM_DTYPE)
+
+    return np.memmap(target, dtype=PCM_DTYPE, mode="r")
+
+
+def load_pcm(
+    source: Path | str, fps: int = PCM_FPS, force: bool | None = False
+) -> np.memmap:
+    """Memory-map decoded mono PCM of a media file (decoding it once if needed).
+
+    Cache is invalidated when source file size/modification time changes.
+
+    - source (Path | str): audio/video file
+    - fps (int, optional (PCM_FPS)): sample rate
+    - force (bool | None, optional (False)): decode even if cached
+    """
+
+    samples = None if force else cached_pcm(source, fps)
+    if samples is None:
+        decode_pcm(source, fps=fps)
+        samples = cached_pcm(source, fps)
+
+    return samples
+
+
+@profiling.timed("read_pcm", CAT_AUDIO)
+def read_pcm(
+    source: Path | str, start: float, duration: float, fps: int = PCM_FPS
+) -> np.ndarray:
+    """Decode a short fragment of audio (cached PCM is sliced when available).
+
+    - source (Path | str): audio/video file
+    - start (float): fragment start (seconds)
+    - duration (float): fragment length (seconds)
+    - fps (int, optional (PCM_FPS)): sample rate
+    """
+
+    start = max(start, 0)
+    samples = cached_pcm(source, fps)
+    if samples is not None:
+        first = int(round(start * fps))
+        return np.asarray(samples[first : first + int(round(duration * fps))])
+
+    result = ffmpeg.run(
+        "-ss",
+        f"{start:.3f}",
+        "-t",
+        f"{duration:.3f}",
+        "-i",
+        str(Path(source).absolute()),
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(fps),
+        "-f",
+        PCM_FORMAT,
+        "-",
+    )
+    return np.frombuffer(result.stdout, dtype=PCM_DTYPE)
+
+
+def window_peaks(samples: np.ndarray, fps: int, window_size: float) -> np.ndarray:
+    """Maximum absolute amplitude per consecutive window (incomplete tail dropped).
+
+    - samples (np.ndarray): mono samples
+    - fps (int): sample rate
+    - window_size (float): window length in seconds
+    """
+
+    width = int(round(window_size * fps))
+    if width < 1:
+        raise exceptions.ValidationError("Invalid window size", window_size)
+
+    count = len(samples) // width
+    if not count:
+        return np.zeros(0, dtype=PCM_DTYPE)
+
+    return np.abs(samples[: count * width].reshape(count, width)).max(axis=1)
+
+
+def speaking_intervals(
+    silent: np.ndarray, window_size: float, ease_in: float
+) -> list[list[float]]:
+    """Turn per-window silence flags into merged (start, end) speaking intervals.
+
+    An interval is closed when speech turns into silence, speech running
+    until the very end is not included.
+
+    - silent (np.ndarray): boolean silence flag per window
+    - window_size (float): window length in seconds
+    - ease_in (float): seconds of padding added around speaking intervals
+    """
+
+    silent = np.asarray(silent, dtype=bool)
+    if len(silent) < 2:
+        return []
+
+    starts = np.flatnonzero(silent[:-1] & ~silent[1:]) + 1
+    ends = np.flatnonzero(~silent[:-1] & silent[1:]) + 1
+    if not silent[0]:
+        starts = np.concatenate([[0], starts])
+
+    pairs = zip(starts[: len(ends)].tolist(), ends.tolist())
+    return merge_intervals(
+        ([start * window_size, end * window_size] for start, end in pairs), ease_in
+    )
+
+
+def merge_intervals(intervals, ease_in: float = 0) -> list[list[float]]:
+    """Pad sorted (start, end) intervals and merge the overlapping ones.
+
+    - intervals (Iterable[list[float]]): sorted speaking intervals
+    - ease_in (float, optional (0)): seconds of padding added around intervals
+    """
+
+    merged = []
+    for start, end in intervals:
+        interval = [start - ease_in, end + ease_in]
+        # With tiny windows, this can sometimes overlap the previous one, so merge.
+        if merged and merged[-1][1] > interval[0]:
+            merged[-1][1] = max(merged[-1][1], interval[1])
+        else:
+            merged.append(interval)
+
+    return merged
+
+
+def to_db(amplitude: np.ndarray) -> np.ndarray:
+    """Amplitude to dBFS (clipped at HISTOGRAM_MIN_DB)."""
+
+    amplitude = np.maximum(np.asarray(amplitude, dtype=np.float64), 1e-10)
+    return np.maximum(20 * np.log10(amplitude), HISTOGRAM_MIN_DB)
+
+
+def noise_floor(peaks: np.ndarray) -> float:
+    """Estimate noise floor (dBFS) from window amplitude histogram.
+
+    Takes the most populated 1 dB bin among the quieter half of the windows.
+    """
+
+    levels = to_db(peaks)
+    if not len(levels):
+        return HISTOGRAM_MIN_DB
+
+    quiet = levels[levels <= np.median(levels)]
+    bins = np.arange(HISTOGRAM_MIN_DB, 0 + HISTOGRAM_BIN_DB, HISTOGRAM_BIN_DB)
+    counts, edges = np.histogram(quiet, bins=bins)
+    top = int(np.argmax(counts))
+    return float((edges[top] + edges[top + 1]) / 2)
+
+
+def hysteresis(
+    levels: np.ndarray, open_threshold: float, close_threshold: float
+) -> np.ndarray:
+    """Speaking flags: on above open threshold, off below close threshold,
+    unchanged in between (vectorized, starts silent)."""
+
+    marks = np.zeros(len(levels), dtype=np.int8)
+    marks[levels >= open_threshold] = 1
+    marks[levels < close_threshold] = -1
+
+    # carry the last decisive mark forward
+    decided = np.where(marks != 0, np.arange(len(marks)), -1)
+    last = np.maximum.accumulate(decided) if len(marks) else decided
+    return (last >= 0) & (marks[np.maximum(last, 0)] == 1)
+
+
+def fill_gaps(speaking: np.ndarray, max_gap: int) -> np.ndarray:
+    """Mark silent runs shorter than max_gap windows between speech as speaking."""
+
+    speaking = np.asarray(speaking, dtype=bool).copy()
+    if max_gap < 1 or not speaking.any():
+        return speaking
+
+    edges = np.diff(speaking.astype(np.int8))
+    gap_starts = np.flatnonzero(edges == -1) + 1
+    gap_ends = np.flatnonzero(edges == 1) + 1
+    gap_ends = gap_ends[gap_ends > gap_starts[0]] if len(gap_starts) else gap_ends
+
+    for start, end in zip(gap_starts, gap_ends):
+        if end - start < max_gap:
+            speaking[start:end] = True
+
+    return speaking
+
+
+def adaptive_silence(
+    peaks: np.ndarray,
+    window_size: float,
+    open_db: float = ADAPTIVE_OPEN_DB,
+    close_db: float = ADAPTIVE_CLOSE_DB,
+    min_gap: float = ADAPTIVE_MIN_GAP,
+) -> np.ndarray:
+    """Silence flags relative to estimated noise floor (with hysteresis).
+
+    Thresholds are capped below loud windows (95th percentile minus
+    ADAPTIVE_HEADROOM_DB), so recordings without pauses are kept.
+
+    - peaks (np.ndarray): maximum amplitude per window
+    - window_size (float): window length in seconds
+    - open_db (float, optional (ADAPTIVE_OPEN_DB)): speech start, dB above floor
+    - close_db (float, optional (ADAPTIVE_CLOSE_DB)): speech end, dB above floor
+    - min_gap (float, optional (ADAPTIVE_MIN_GAP)): (in seconds) shorter
+        pauses are not cut
+    """
+
+    levels = to_db(peaks)
+    if not len(levels):
+        return np.zeros(0, dtype=bool)
+
+    floor = noise_floor(peaks)
+    ceiling = float(np.percentile(levels, 95)) - ADAPTIVE_HEADROOM_DB
+    open_threshold = min(floor + open_db, ceiling)
+    close_threshold = open_threshold - (open_db - close_db)
+
+    speaking = hysteresis(levels, open_threshold, close_threshold)
+    return ~fill_gaps(speaking, int(round(min_gap / window_size)))
+
+
+def silent_windows(
+    peaks: np.ndarray,
+    window_size: float,
+    volume_threshold: float,
+    mode: str = MODE_FIXED,
+) -> np.ndarray:
+    """Silence flags per window for a detection mode.
+
+    - peaks (np.ndarray): maximum amplitude per window
+    - window_size (float): window length in seconds
+    - volume_threshold (float): absolute threshold (MODE_FIXED only)
+    - mode (str, optional (MODE_FIXED)): detection mode
+    """
+
+    if mode == MODE_FIXED:
+        return peaks < volume_threshold
+    if mode == MODE_ADAPTIVE:
+        return adaptive_silence(peaks, window_size)
+    if mode == MODE_TRANSCRIPT:
+        raise exceptions.ValidationError(
+            "Transcript mode works on transcripts, see transcript_speaking", mode
+        )
+
+    raise exceptions.ValidationError("Unknown silence detection mode", mode)
+
+
+@profiling.timed("find_speaking_pcm", CAT_AUDIO)
+def find_speaking(
+    samples: np.ndarray,
+    fps: int = PCM_FPS,
+    window_size: float = 0.1,
+    volume_threshold: float = 0.01,
+    ease_in: float = 0.25,
+    mode: str = MODE_FIXED,
+) -> list[list[float]]:
+    """Find non-silent parts of decoded audio (vectorized Video.find_speaking).
+
+    - samples (np.ndarray): mono samples
+    - fps (int, optional (PCM_FPS)): sample rate
+    - window_size (float, optional (0.1)): (in seconds) hunt for silence in
+        windows of this size
+    - volume_threshold (float, optional (0.01)): volume below this threshold is
+        considered to be silence
+    - ease_in (float, optional (0.25)): (in seconds) add this much silence around
+        speaking intervals
+    - mode (str, optional (MODE_FIXED)): detection mode (see MODES)
+    """
+
+    peaks = window_peaks(samples, fps, window_size)
+    silent = silent_windows(peaks, window_size, volume_threshold, mode)
+    return speaking_intervals(silent, window_size, ease_in)
+
+
+def kept_duration(intervals: list[list[float]], duration: float) -> float:
+    """Total length of (possibly eased out of bounds) intervals within media."""
+
+    return sum(max(min(end, duration) - max(start, 0), 0) for start, end in intervals)
+
+
+class Envelope:
+    """Multi-resolution loudness envelope (min/max/RMS per window and level).
+
+    Built once per source from the decoded PCM, lets any multiple of the base
+    window be evaluated without touching the samples.
+
+    - fps (int): sample rate of analysed audio
+    - duration (float): audio length in seconds
+    - levels (dict[float, dict[str, np.ndarray]]): window size -> min/max/rms
+    """
+
+    STATS = ("min", "max", "rms")
+
+    def __init__(
+        self, fps: int, duration: float, levels: dict[float, dict[str, np.ndarray]]
+    ) -> Envelope:
+        self.fps = fps
+        self.duration = duration
+        self.levels = dict(sorted(levels.items()))
+        self.base = min(self.levels)
+
+    @staticmethod
+    def aggregate(stats: dict[str, np.ndarray], factor: int) -> dict[str, np.ndarray]:
+        """Merge every `factor` consecutive windows (incomplete tail dropped)."""
+
+        count = len(stats["max"]) // factor
+        grouped = {
+            k: v[: count * factor].reshape(count, factor) for k, v in stats.items()
+        }
+        return {
+            "min": grouped["min"].min(axis=1),
+            "max": grouped["max"].max(axis=1),
+            "rms": np.sqrt(np.mean(np.square(grouped["rms"]), axis=1)),
+        }
+
+    @classmethod
+    @profiling.timed("envelope_build", CAT_AUDIO)
+    def build(
+        cls,
+        samples: np.ndarray,
+        fps: int = PCM_FPS,
+        levels: tuple[float] = ENVELOPE_LEVELS,
+    ) -> Envelope:
+        """Compute envelope pyramid in a single pass over the samples.
+
+        - samples (np.ndarray): mono samples
+        - fps (int, optional (PCM_FPS)): sample rate
+        - levels (tuple[float], optional (ENVELOPE_LEVELS)): window sizes,
+            multiples of the smallest one
+        """
+
+        base = min(levels)
+        width = int(round(base * fps))
+        count = len(samples) // width
+        windows = np.asarray(samples[: count * width], dtype=np.float32)
+        windows = windows.reshape(count, width)
+
+        if count:
+            stats = {
+                "min": windows.min(axis=1),
+                "max": windows.max(axis=1),
+                "rms": np.sqrt(np.mean(np.square(windows), axis=1)),
+            }
+        else:
+            stats = {stat: np.zeros(0, dtype=np.float32) for stat in cls.STATS}
+
+        envelope = cls(fps, len(samples) / fps, {base: stats})
+        for window_size in sorted(levels):
+            if window_size != base:
+                envelope.levels[window_size] = cls.aggregate(
+                    stats, envelope.factor(window_size)
+                )
+
+        return envelope
+
+    @classmethod
+    def load(cls, source: Path | str, force: bool | None = False) -> Envelope:
+        """Envelope of a media file, cached next to it (built from load_pcm).
+
+        - source (Path | str): audio/video file
+        - force (bool | None, optional (False)): rebuild even if cached
+        """
+
+        source = Path(source).absolute()
+        target = utils.sidecar_path(source, SIDECAR_ENVELOPE)
+        signature = json.dumps(utils.file_signature(source))
+
+        if not force and target.is_file():
+            with np.load(target) as data:
+                if str(data["signature"]) == signature:
+                    return cls.from_arrays(data)
+
+        envelope = cls.build(load_pcm(source, force=force))
+        envelope.save(target, signature)
+        return envelope
+
+    @classmethod
+    def from_arrays(cls, data) -> Envelope:
+        """Restore envelope from saved arrays."""
+
+        sizes = data["levels"].tolist()
+        return cls(
+            int(data["fps"]),
+            float(data["duration"]),
+            {
+                size: {stat: data[f"{stat}_{i}"] for stat in cls.STATS}
+                for i, size in enumerate(sizes)
+            },
+        )
+
+    def save(self, path: Path | str, signature: str = "") -> Path:
+        """Write envelope to .npz file."""
+
+        arrays = {
+            f"{stat}_{i}": stats[stat]
+            for i, stats in enumerate(self.levels.values())
+            for stat in self.STATS
+        }
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                levels=np.array(list(self.levels)),
+                fps=self.fps,
+                duration=self.duration,
+                signature=signature,
+                **arrays,
+            )
+
+        return Path(path)
+
+    def factor(self, window_size: float) -> int:
+        """Window size in base windows, raises ValidationError if not a multiple."""
+
+        factor = round(window_size / self.base)
+        if factor < 1 or not np.isclose(factor * self.base, window_size):
+            raise exceptions.ValidationError(
+                f"Window size must be a multiple of {self.base}", window_size
+            )
+        return factor
+
+    def supports(self, window_size: float) -> bool:
+        """Whether window size can be evaluated from this envelope."""
+
+        try:
+            self.factor(window_size)
+        except exceptions.ValidationError:
+            return False
+        return True
+
+    def level(self, window_size: float) -> dict[str, np.ndarray]:
+        """Min/max/RMS per window (aggregated from the closest finer level)."""
+
+        factor = self.factor(window_size)
+        for size in reversed(self.levels):
+            ratio = round(size / self.base)
+            if factor % ratio == 0:
+                if ratio == factor:
+                    return self.levels[size]
+                return self.aggregate(self.levels[size], factor // ratio)
+
+    def peaks(self, window_size: float) -> np.ndarray:
+        """Maximum absolute amplitude per window (as in window_peaks)."""
+
+        stats = self.level(window_size)
+        return np.maximum(stats["max"], -stats["min"])
+
+    def find_speaking(
+        self,
+        window_size: float = 0.1,
+        volume_threshold: float = 0.01,
+        ease_in: float = 0.25,
+        mode: str = MODE_FIXED,
+    ) -> list[list[float]]:
+        """Find non-silent parts (same results as find_speaking on the samples)."""
+
+        peaks = self.peaks(window_size)
+        silent = silent_windows(peaks, window_size, volume_threshold, mode)
+        return speaking_intervals(silent, window_size, ease_in)
+
+
+def detect_speaking(
+    source: Path | str,
+    window_size: float = 0.1,
+    volume_threshold: float = 0.01,
+    ease_in: float = 0.25,
+    mode: str = MODE_FIXED,
+) -> list[list[float]]:
+    """Find non-silent parts of a media file using cached envelope or PCM.
+
+    - source (Path | str): audio/video file
+    - window_size (float, optional (0.1)): (in seconds) silence detection window
+    - volume_threshold (float, optional (0.01)): silence volume threshold
+    - ease_in (float, optional (0.25)): (in seconds) padding around speech
+    - mode (str, optional (MODE_FIXED)): detection mode (see MODES)
+    """
+
+    envelope = Envelope.load(source)
+    if envelope.supports(window_size):
+        return envelope.find_speaking(window_size, volume_threshold, ease_in, mode)
+
+    return find_speaking(
+        load_pcm(source), PCM_FPS, window_size, volume_threshold, ease_in, mode
+    )
+
+
+def preview(
+    source: Path | str,
+    window_sizes: list[float],
+    volume_thresholds: list[float],
+    eases: list[float],
+) -> list[dict]:
+    """Kept/cut durations for a grid of silence detection parameters.
+
+    - source (Path | str): audio/video file
+    - window_sizes (list[float]): window sizes (multiples of ENVELOPE_BASE)
+    - volume_thresholds (list[float]): volume thresholds
+    - eases (list[float]): ease-in paddings
+    """
+
+    envelope = Envelope.load(source)
+    rows = []
+    for window_size in window_sizes:
+        peaks = envelope.peaks(window_size)
+        for volume_threshold in volume_thresholds:
+            silent = peaks < volume_threshold
+            for ease_in in eases:
+                intervals = speaking_intervals(silent, window_size, ease_in)
+                kept = kept_duration(intervals, envelope.duration)
+                rows.append(
+                    {
+                        "window_size": window_size,
+                        "volume_threshold": volume_threshold,
+                        "ease_in": ease_in,
+                        "intervals": len(intervals),
+                        "kept": kept,
+                        "ratio": kept / envelope.duration if envelope.duration else 0,
+                    }
+                )
+
+    return rows
+
+
+def cue_intervals(
+    records: list[dict], min_gap: float = TRANSCRIPT_MIN_GAP
+) -> list[list[float]]:
+    """Speaking intervals implied by transcript cues (start/duration).
+
+    - records (list[dict]): transcript records
+    - min_gap (float, optional (TRANSCRIPT_MIN_GAP)): (in seconds) shorter
+        pauses between cues are kept
+    """
+
+    if not records:
+        return []
+
+    starts = np.array([r["start"] for r in records], dtype=float)
+    ends = starts + np.array([r["duration"] for r in records], dtype=float)
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], np.maximum.accumulate(ends[order])
+
+    # a new interval begins where the pause after everything before is long enough
+    breaks = np.flatnonzero(starts[1:] - ends[:-1] >= min_gap) + 1
+    first = np.concatenate([[0], breaks])
+    last = np.concatenate([breaks - 1, [len(starts) - 1]])
+
+    return [[float(starts[a]), float(ends[b])] for a, b in zip(first, last)]
+
+
+def refine_intervals(
+    source: Path | str,
+    intervals: list[list[float]],
+    volume_threshold: float = 0.05,
+    search: float = REFINE_SEARCH,
+    window_size: float = ENVELOPE_BASE,
+) -> list[list[float]]:
+    """Snap interval edges to actual speech onset/offset near them.
+
+    Only fragments around the edges are read. Edges without any loud window
+    in range are left as they are.
+
+    - source (Path | str): audio/video file
+    - intervals (list[list[float]]): speaking intervals
+    - volume_threshold (float, optional (0.05)): silence volume threshold
+    - search (float, optional (REFINE_SEARCH)): (in seconds) search range
+    - window_size (float, optional (ENVELOPE_BASE)): detection window
+    """
+
+    def loud(edge):
+        offset = max(edge - search, 0)
+        samples = read_pcm(source, offset, edge + search - offset)
+        windows = np.flatnonzero(
+            window_peaks(samples, PCM_FPS, window_size) >= volume_threshold
+        )
+        return offset, windows
+
+    refined = []
+    for start, end in intervals:
+        offset, windows = loud(start)
+        if len(windows):
+            start = offset + windows[0] * window_size
+        offset, windows = loud(end)
+        if len(windows):
+            end = offset + (windows[-1] + 1) * window_size
+        refined.append([float(start), float(max(end, start))])
+
+    return refined
+
+
+@profiling.timed("transcript_speaking", CAT_AUDIO)
+def transcript_speaking(
+    records: list[dict],
+    source: Path | str | None = None,
+    volume_threshold: float = 0.05,
+    ease_in: float = 0.25,
+    min_gap: float = TRANSCRIPT_MIN_GAP,
+) -> list[list[float]]:
+    """Find speaking intervals from transcript (same format as find_speaking).
+
+    - records (list[dict]): transcript records
+    - source (Path | str | None, optional (None)): media file to refine cue
+        edges against (no audio is read if omitted)
+    - volume_threshold (float, optional (0.05)): silence volume threshold
+    - ease_in (float, optional (0.25)): (in seconds) padding around speech
+    - min_gap (float, optional (TRANSCRIPT_MIN_GAP)): (in seconds) shorter
+        pauses between cues are kept
+    """
+
+    intervals = cue_intervals(records, min_gap=min_gap)
+    if source is not None:
+        intervals = refine_intervals(source, intervals, volume_threshold)
+
+    return merge_intervals(intervals, ease_in)
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from moviepy.editor import AudioFileClip
+
+from . import audio, exceptions, server, synthetic, utils
+from .subs import FMT_JSON, FMT_SRT, Subs
+from .video import ENCODE_PROFILES, FMT_MP4, Video
+
+
+BENCH_DIR = utils.ROOT_DIR / "bench"
+FIXTURES_DIR = BENCH_DIR / "fixtures"
+OUTPUT_DIR = BENCH_DIR / "output"
+RESULTS_FILE = BENCH_DIR / "results.jsonl"
+"""Benchmark file locations."""
+
+DURATION_DEFAULT = 30.0
+CUES_DEFAULT = 5000
+REPEAT_DEFAULT = 3
+"""Default benchmark fixture sizes and repetitions."""
+
+REGRESSION_THRESHOLD = 1.1
+"""Slowdown ratio reported as regression."""
+
+CASES = {}
+"""Registered benchmark cases (name -> callable(fixtures))."""
+
+
+def case(name: str) -> Callable[[Callable], Callable]:
+    """Register benchmark case."""
+
+    def decorator(func):
+        CASES[name] = func
+        return func
+
+    return decorator
+
+
+class Fixtures:
+    """Lazily generated (and cached on disk) synthetic inputs.
+
+    - duration (float, optional (DURATION_DEFAULT)): media length in seconds
+    - cues (int, optional (CUES_DEFAULT)): transcript record count
+    - directory (Path, optional (FIXTURES_DIR)): fixture cache location
+    """
+
+    def __init__(
+        self,
+        duration: float = DURATION_DEFAULT,
+        cues: int = CUES_DEFAULT,
+        directory: Path = FIXTURES_DIR,
+    ) -> Fixtures:
+        self.duration = float(duration)
+        self.cues = int(cues)
+        self.directory = Path(directory)
+
+    def _cached(self, name: str, build: Callable[[Path], Path]) -> Path:
+        path = self.directory / name
+        if not path.is_file():
+            build(path)
+        return path
+
+    @property
+    def audio(self) -> Path:
+        """Tone/silence patterned audio file."""
+
+        return self._cached(
+            f"{synthetic.SYNTHETIC_VIDEO_ID}-{self.duration:g}s.mp3",
+            lambda p: synthetic.write_audio(p, self.duration),
+        )
+
+    @property
+    def video(self) -> Path:
+        """Test pattern video file (with tone/silence patterned audio)."""
+
+        return self._cached(
+            f"{synthetic.SYNTHETIC_VIDEO_ID}-{self.duration:g}s.{FMT_MP4}",
+            lambda p: synthetic.write_video(p, self.duration),
+        )
+
+    @property
+    def transcript(self) -> Path:
+        """Transcript JSON file."""
+
+        return self._cached(
+            f"{synthetic.SYNTHETIC_VIDEO_ID}-{self.cues}cues.{FMT_JSON}",
+            lambda p: synthetic.write_transcript(p, self.cues),
+        )
+
+    def output(self, name: str) -> Path:
+        """Benchmark output file location."""
+
+        return OUTPUT_DIR / f"{synthetic.SYNTHETIC_VIDEO_ID}-{name}.{FMT_MP4}"
+
+
+# --- Cases ---
+@case("find_speaking")
+def bench_find_speaking(fixtures: Fixtures) -> None:
+    with AudioFileClip(str(fixtures.audio)) as clip:
+        Video.find_speaking(clip, window_size=0.1, volume_threshold=0.05)
+
+
+@case("find_speaking_pcm")
+def bench_find_speaking_pcm(fixtures: Fixtures) -> None:
+    audio.find_speaking(
+        audio.load_pcm(fixtures.audio), window_size=0.1, volume_threshold=0.05
+    )
+
+
+@case("cut_silence")
+def bench_cut_silence(fixtures: Fixtures) -> None:
+    Video(filepath=fixtures.video).cut_silence(
+        output_file=fixtures.output("cleaned"), force=True
+    )
+
+
+@case("clip")
+def bench_clip(fixtures: Fixtures) -> None:
+    Video(filepath=fixtures.video).clip(
+        fixtures.duration / 4,
+        fixtures.duration * 3 / 4,
+        output_file=fixtures.output("clip"),
+        force=True,
+    )
+
+
+def bench_clip_profile(profile: str) -> Callable[[Fixtures], None]:
+    def bench(fixtures: Fixtures) -> None:
+        Video(filepath=fixtures.video).clip(
+            0,
+            fixtures.duration,
+            output_file=fixtures.output(f"clip-{profile}"),
+            force=True,
+            profile=profile,
+        )
+
+    return bench
+
+
+for _profile in ENCODE_PROFILES:
+    case(f"clip_{_profile}")(bench_clip_profile(_profile))
+
+
+@case("clip_many")
+def bench_clip_many(fixtures: Fixtures) -> None:
+    quarter = fixtures.duration / 4
+    cuts = [
+        {"t1": i * quarter, "t2": (i + 1) * quarter, "name": f"many{i}"}
+        for i in range(4)
+    ]
+    Video(filepath=fixtures.video).clip_many(cuts, output_dir=OUTPUT_DIR, force=True)
+
+
+@case("modify_speed")
+def bench_modify_speed(fixtures: Fixtures) -> None:
+    Video(filepath=fixtures.video).modify_speed(
+        factor=2.0, output_file=fixtures.output("spd"), force=True
+    )
+
+
+@case("subs_load")
+def bench_subs_load(fixtures: Fixtures) -> None:
+    Subs.load_subtitiles(fixtures.transcript)
+
+
+@case("subs_cut")
+def bench_subs_cut(fixtures: Fixtures) -> None:
+    subs = Subs(filepath=fixtures.transcript, sanitize=False)
+    end = subs.transcript[-1]["start"]
+    subs.cut(end / 4, end * 3 / 4)
+
+
+@case("format_srt")
+def bench_format_srt(fixtures: Fixtures) -> None:
+    Subs.format_srt(Subs.load_subtitiles(fixtures.transcript))
+
+
+def chunk_params(fixtures: Fixtures, name: str) -> dict:
+    return {
+        "source": str(fixtures.transcript),
+        "t1": 0,
+        "t2": 60,
+        "fmt": FMT_SRT,
+        "output_file": str(OUTPUT_DIR / f"{synthetic.SYNTHETIC_VIDEO_ID}-{name}.srt"),
+        "force": True,
+    }
+
+
+@case("request_cli")
+def bench_request_cli(fixtures: Fixtures) -> None:
+    params = chunk_params(fixtures, "cli")
+    subprocess.run(
+        [sys.executable, str(utils.ROOT_DIR / "toolset.py"), "--progress", "off"]
+        + ["chunk", "-s", params["source"], "-a", "0", "-b", "60", "-t", FMT_SRT]
+        + ["-o", params["output_file"], "--force"],
+        check=True,
+        capture_output=True,
+    )
+
+
+_server = None
+"""Benchmark API server (started on first use)."""
+
+
+@case("request_server")
+def bench_request_server(fixtures: Fixtures) -> None:
+    global _server
+    if _server is None:
+        _server = server.start((server.HOST_DEFAULT, 0))
+    server.request(_server.url, server.OP_CHUNK, chunk_params(fixtures, "server"))
+
+
+# --- Runner ---
+def git_revision() -> str:
+    """Current commit hash (or "unknown" outside of a git checkout)."""
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=utils.ROOT_DIR,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def measure(func: Callable[[], None], repeat: int = REPEAT_DEFAULT) -> dict:
+    """Time repeated function calls (seconds)."""
+
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+
+    return {"min": min(runs), "median": statistics.median(runs), "runs": runs}
+
+
+def run(
+    names: list[str] | None = None,
+    fixtures: Fixtures | None = None,
+    repeat: int = REPEAT_DEFAULT,
+) -> dict:
+    """Run benchmark cases, outputs result record.
+
+    - names (list[str] | None, optional (None)): cases to run (all by default)
+    - fixtures (Fixtures | None, optional (None)): inputs (default sizes)
+    - repeat (int, optional (REPEAT_DEFAULT)): repetitions per case
+    """
+
+    fixtures = fixtures or Fixtures()
+    names = names or list(CASES)
+    unknown = set(names) - set(CASES)
+    if unknown:
+        raise exceptions.ValidationError(
+            msg=f"Unknown benchmark cases: {', '.join(sorted(unknown))}"
+        )
+
+    results = {}
+    for name in names:
+        CASES[name](fixtures)  # warmup (also generates fixtures)
+        results[name] = measure(lambda: CASES[name](fixtures), repeat=repeat)
+
+    return {
+        "revision": git_revision(),
+        "timestamp": time.time(),
+        "duration": fixtures.duration,
+        "cues": fixtures.cues,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def save(record: dict, path: Path = RESULTS_FILE) -> Path:
+    """Append result record to results file."""
+
+    utils.ensure_folder(path)
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+    return path
+
+
+def load(path: Path = RESULTS_FILE) -> list[dict]:
+    """Read all stored result records."""
+
+    if not Path(path).is_file():
+        return []
+
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find(revision: str, records: list[dict], like: dict | None = None) -> dict | None:
+    """Latest record of a revision (with the same fixture sizes as `like`)."""
+
+    for record in reversed(records):
+        if not record["revision"].startswith(revision):
+            continue
+        if like and (record["duration"], record["cues"]) != (
+            like["duration"],
+            like["cues"],
+        ):
+            continue
+        return record
+
+    return None
+
+
+def compare(base: dict, head: dict) -> list[dict]:
+    """Per-case comparison of two result records (by minimal run time)."""
+
+    rows = []
+    for name, result in head["results"].items():
+        if name not in base["results"]:
+            continue
+        before, after = base["results"][name]["min"], result["min"]
+        ratio = after / before if before else float("inf")
+        rows.append(
+            {
+                "name": name,
+                "base": before,
+                "head": after,
+                "ratio": ratio,
+                "regression": ratio > REGRESSION_THRESHOLD,
+            }
+        )
+
+    return rows
@@ -2,9 +2,27 @@ from pathlib import Path
 
 import click
 
-from . import utils
+from . import audio as audio_module, bench as bench_module
+from . import (
+    jobs as jobs_module,
+    pipeline as pipeline_module,
+    profiling,
+    progress,
+    server as server_module,
+    utils,
+)
+from .edl import EDL, FMT_EDL
+from .state import STATE_PENDING, StateStore
 from .subs import FMT_JSON, FMT_SRT, FMT_TXT, FORMATS_SUB, Subs
-from .video import AUDIO_BITRATE_DEFAULT, FMT_MP4, Video, VideoImporter
+from .video import (
+    AUDIO_BITRATE_DEFAULT,
+    AUDIO_MODE_TRANSCODE,
+    AUDIO_MODES,
+    ENCODE_PROFILES,
+    FMT_MP4,
+    Video,
+    VideoImporter,
+)
 
 
 # --- Templates ---
@@ -33,6 +51,25 @@ def opts_video_id_url(method):
     return method
 
 
+opt_encode_profile = click.option(
+    "--encode_profile",
+    required=False,
+    default=None,
+    type=click.Choice(list(ENCODE_PROFILES)),
+    help="Encode profile (speed/quality trade-off), config default if omitted",
+)
+"""Click option template for encode profile."""
+
+
+opt_proxy = click.option(
+    "--proxy",
+    is_flag=True,
+    default=False,
+    help="Preview: edit low resolution proxy (result goes to the proxy directory)",
+)
+"""Click option template for proxy preview."""
+
+
 def opts_output_force(method):
     """Click options template for output/force args."""
 
@@ -146,18 +183,7 @@ def chunk(source, t1, t2, fmt, shift, output, force):
     force (bool): overwrite output file?
     """
 
-    source = Path(source).absolute()
-    t1 = utils.parse_time_value(t1)
-    t2 = utils.parse_time_value(t2)
-
-    original = Subs(filepath=source)
-    target_file = original.derive_chunk_filename(t1, t2, fmt, target_file=output)
-    subs = original.cut(t1, t2)
-
-    if shift:
-        subs.shift_left()
-
-    subs.save(target_file, fmt=fmt, force=force)
+    target_file = Subs.save_chunk(source, t1, t2, fmt, shift, output, force)
     click.echo(f"Wrote to: {target_file}")
 
 
@@ -180,9 +206,16 @@ def chunk(source, t1, t2, fmt, shift, output, force):
     default=FMT_MP4,
     help="preferred video format",
 )
+@click.option(
+    "--budget",
+    required=False,
+    default=None,
+    type=float,
+    help="download time limit in seconds (lower resolution if estimated longer)",
+)
 @opts_output_force
-# TODO: resolution, exact_resolution, mime_type
-def pull_video(video_id, url, resolution, format, output, force):
+# TODO: exact_resolution
+def pull_video(video_id, url, resolution, format, budget, output, force):
     """Download youtube video file."""
 
     download_kwargs = {
@@ -190,11 +223,94 @@ def pull_video(video_id, url, resolution, format, output, force):
         "force": force,
         "max_resolution": resolution,
         "mime_type": VideoImporter.format_to_mime_type(format),
+        "time_budget": budget,
     }
     video = Video(video_id=video_id, url=url, download_kwargs=download_kwargs)
     click.echo(f"Saved to: {video.filepath}")
 
 
+@click.command(help="Show streams a download would fetch with size/time estimates")
+@opts_video_id_url
+@click.option(
+    "-r",
+    "--resolution",
+    required=False,
+    default=360,
+    type=int,
+    help="Preferred video vertical resolution",
+)
+@click.option(
+    "-t",
+    "--format",
+    required=False,
+    type=str,
+    default=FMT_MP4,
+    help="preferred video format",
+)
+@click.option(
+    "--budget",
+    required=False,
+    default=None,
+    type=float,
+    help="download time limit in seconds",
+)
+def plan_video(video_id, url, resolution, format, budget):
+    """Shows planned download of a youtube video."""
+
+    plan = Video.plan_download(
+        video_id or Video.extract_video_id(url),
+        max_resolution=resolution,
+        mime_type=VideoImporter.format_to_mime_type(format),
+        time_budget=budget,
+    )
+    size, seconds = plan["size"], plan["seconds"]
+    click.echo(
+        f"format={plan['format']} {plan['height']}p "
+        f"{plan['vcodec']}/{plan['acodec']} merge={plan['merge']} "
+        f"size={'-' if size is None else f'{size / 2**20:.1f}MiB'} "
+        f"time={'-' if seconds is None else f'{seconds:.1f}s'}"
+    )
+
+
+@click.command(help="Download time range of a youtube video (without the rest)")
+@opts_video_id_url
+@click.option(
+    "-a", "--t1", required=True, help="left time bracket in seconds or hh:mm:ss"
+)
+@click.option(
+    "-b", "--t2", required=True, help="right time bracket in seconds or hh:mm:ss"
+)
+@click.option(
+    "-r",
+    "--resolution",
+    required=False,
+    default=360,
+    type=int,
+    help="Maximum video vertical resolution",
+)
+@click.option(
+    "--exact",
+    is_flag=True,
+    default=False,
+    help="Frame accurate cut points (re-encodes around them, slower)",
+)
+@opts_output_force
+def pull_clip(video_id, url, t1, t2, resolution, exact, output, force):
+    """Downloads time range of a youtube video."""
+
+    clip = Video.pull_clip(
+        t1,
+        t2,
+        video_id=video_id,
+        url=url,
+        max_resolution=resolution,
+        exact=exact,
+        output_file=output,
+        force=force,
+    )
+    click.echo(f"Saved to {clip.filepath}")
+
+
 @click.command(help="Download audio track of a youtube video")
 @opts_video_id_url
 @opts_output_force
@@ -206,13 +322,28 @@ def pull_video(video_id, url, resolution, format, output, force):
     default=AUDIO_BITRATE_DEFAULT,
     help="Preferred track bitrate",
 )
-def pull_audio(video_id, url, bitrate, output, force):
+@click.option(
+    "-m",
+    "--mode",
+    default=AUDIO_MODE_TRANSCODE,
+    type=click.Choice(AUDIO_MODES),
+    help="Transcode to MP3 or remux (keep original Opus/AAC, no re-encoding)",
+)
+@click.option(
+    "--pcm",
+    is_flag=True,
+    default=False,
+    help="Decode into PCM cache for silence/transcript analysis",
+)
+def pull_audio(video_id, url, bitrate, mode, pcm, output, force):
     """Download audio track part of a youtube video."""
 
     download_kwargs = {
         "output_file": output,
         "force": force,
         "bitrate": bitrate,
+        "mode": mode,
+        "pcm": pcm,
     }
     audio = Video(
         video_id=video_id, url=url, audio_only=True, download_kwargs=download_kwargs
@@ -236,13 +367,127 @@ def pull_audio(video_id, url, bitrate, output, force):
     default=False,
     help="strips audio from the resulting clip",
 )
+@opt_encode_profile
+@opt_proxy
 @opts_output_force
-def cut(source, t1, t2, strip_sound, output, force):
+def cut(source, t1, t2, strip_sound, encode_profile, proxy, output, force):
     """Cuts a clip from provided video file."""
 
     video = Video(filepath=source)
-    vid = video.clip(t1, t2, output_file=output, strip_sound=strip_sound, force=force)
+    video = video.proxy_video() if proxy else video
+    vid = video.clip(
+        t1,
+        t2,
+        output_file=output,
+        strip_sound=strip_sound,
+        force=force,
+        profile=encode_profile,
+    )
     click.echo(f"Saved to {vid.filepath}")
+    if proxy:
+        save_edl(vid, force)
+
+
+@click.command(help="Cut several clips from a video file in one pass")
+@click.option("-s", "--source", required=True, type=str, help="Video file path")
+@click.option(
+    "-l",
+    "--cut_list",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="CSV (t1,t2,name header) or JSON cut list",
+)
+@click.option(
+    "--subs",
+    "subs_file",
+    required=False,
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Transcript JSON file, cut along and saved next to clips",
+)
+@click.option(
+    "--strip_sound",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="strips audio from the resulting clips",
+)
+@click.option(
+    "-d", "--output_dir", required=False, default=None, help="Clips directory"
+)
+@click.option("-f", "--force", is_flag=True, default=False, help="Overwrite files")
+@click.option(
+    "--snap",
+    is_flag=True,
+    default=False,
+    help="Widen cuts to enclosing keyframes (see keyframes command)",
+)
+@opt_encode_profile
+def cut_many(
+    source, cut_list, subs_file, strip_sound, output_dir, force, snap, encode_profile
+):
+    """Cuts clips listed in a cut list from provided video file."""
+
+    video = Video(filepath=source)
+    clips = video.clip_many(
+        Video.load_cut_list(cut_list),
+        output_dir=output_dir,
+        subs=Subs(filepath=subs_file) if subs_file else None,
+        strip_sound=strip_sound,
+        force=force,
+        profile=encode_profile,
+        snap=snap,
+    )
+    for clip in clips:
+        click.echo(f"Saved to {clip.filepath}")
+
+
+@click.command(help="Build (or show cached) keyframe index of a video file")
+@click.option("-s", "--source", required=True, type=str, help="Video file path")
+@click.option(
+    "-f", "--force", is_flag=True, default=False, help="Rescan even if cached"
+)
+def keyframes(source, force):
+    """Lists keyframe timestamps of a video file."""
+
+    index = Video(filepath=source).keyframe_index(force=force)
+    for t in index:
+        click.echo(f"{t:.3f}")
+    if len(index) > 1:
+        interval = (index[-1] - index[0]) / (len(index) - 1)
+        click.echo(f"{len(index)} keyframes, mean interval {interval:.2f}s")
+    else:
+        click.echo(f"{len(index)} keyframes")
+
+
+def save_edl(edited: Video, force: bool) -> None:
+    """Save edit decision list of a proxy preview next to the preview file."""
+
+    target = edited.edl.save(edited.filepath.with_suffix(f".{FMT_EDL}"), force=force)
+    click.echo(f"Edit decision list saved to {target} (apply it with render)")
+
+
+def save_retimed_subs(subs: Subs, edited: Video, force: bool) -> None:
+    """Retime transcript to derived video, save it next to the video file."""
+
+    if edited.kept_intervals is not None:
+        retimed = subs.retime(intervals=edited.kept_intervals)
+    else:
+        retimed = subs.retime(factor=edited.speed_factor)
+
+    target = edited.filepath.with_suffix(f".{FMT_JSON}")
+    retimed.save(target, fmt=FMT_JSON, force=force)
+    click.echo(f"Retimed transcript saved to {target}")
+
+
+opt_subs = click.option(
+    "--subs",
+    "subs_file",
+    required=False,
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Transcript JSON file, retimed to the result and saved next to it",
+)
 
 
 @click.command(help="Alter video playback speed")
@@ -250,32 +495,556 @@ def cut(source, t1, t2, strip_sound, output, force):
 @click.option(
     "-x", "--factor", required=True, type=float, help="Speedup (or slowdown) factor"
 )
+@opt_subs
+@opt_encode_profile
+@opt_proxy
 @opts_output_force
-def modify_speed(source, factor, output, force):
+def modify_speed(source, factor, subs_file, encode_profile, proxy, output, force):
     """Modifies video playback speed to specified factor."""
 
     video = Video(filepath=source)
-    edited = video.modify_speed(factor=factor, output_file=output, force=force)
+    video = video.proxy_video() if proxy else video
+    edited = video.modify_speed(
+        factor=factor, output_file=output, force=force, profile=encode_profile
+    )
     click.echo(f"Saved to {edited.filepath}")
+    if proxy:
+        save_edl(edited, force)
+    if subs_file:
+        save_retimed_subs(Subs(filepath=subs_file), edited, force)
 
 
 @click.command(help="Cuts quiet parts from a video file")
 @click.option("-s", "--source", required=True, type=str, help="Video file path")
+@click.option(
+    "-w", "--window_size", default=0.1, type=float, help="Detection window (seconds)"
+)
+@click.option(
+    "-t", "--threshold", default=0.05, type=float, help="Silence volume threshold"
+)
+@click.option(
+    "-e", "--ease_in", default=0.1, type=float, help="Padding around speech (seconds)"
+)
+@click.option(
+    "-m",
+    "--mode",
+    default=audio_module.MODE_FIXED,
+    type=click.Choice(audio_module.MODES),
+    help="Silence detection: fixed threshold, adaptive to noise floor or "
+    "from transcript cues (requires --subs)",
+)
+@opt_subs
+@click.option(
+    "--refine/--no-refine",
+    default=False,
+    help="Check audio around transcript cue edges (transcript mode)",
+)
+@opt_encode_profile
+@opt_proxy
 @opts_output_force
-def remove_silence(source, output, force):
+def remove_silence(
+    source,
+    window_size,
+    threshold,
+    ease_in,
+    mode,
+    subs_file,
+    refine,
+    encode_profile,
+    proxy,
+    output,
+    force,
+):
     """Cuts silent parts from a video file."""
 
     video = Video(filepath=source)
-    edited = video.cut_silence(output_file=output, force=force)
+    video = video.proxy_video() if proxy else video
+    subs = Subs(filepath=subs_file) if subs_file else None
+    edited = video.cut_silence(
+        output_file=output,
+        force=force,
+        window_size=window_size,
+        volume_threshold=threshold,
+        ease_in=ease_in,
+        mode=mode,
+        subs=subs,
+        refine=refine,
+        profile=encode_profile,
+    )
     click.echo(f"Saved to {edited.filepath}")
+    if proxy:
+        save_edl(edited, force)
+    if subs:
+        save_retimed_subs(subs, edited, force)
+
+
+@click.command(help="Render edit decision list on its source in a single pass")
+@click.option(
+    "-e",
+    "--edl",
+    "edl_file",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Edit decision list JSON file (saved by --proxy previews)",
+)
+@opt_encode_profile
+@opts_output_force
+def render(edl_file, encode_profile, output, force):
+    """Renders recorded edits on the full resolution source."""
+
+    rendered = Video.render_edl(
+        EDL.load(edl_file), output_file=output, force=force, profile=encode_profile
+    )
+    click.echo(f"Saved to {rendered.filepath}")
+
+
+@click.command(help="Preview kept/cut duration for silence detection parameters")
+@click.option(
+    "-s",
+    "--source",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Video/audio file path",
+)
+@click.option(
+    "-w",
+    "--window_size",
+    "window_sizes",
+    multiple=True,
+    default=[0.05, 0.1, 0.2],
+    type=float,
+    help="Detection window (seconds), repeatable",
+)
+@click.option(
+    "-t",
+    "--threshold",
+    "thresholds",
+    multiple=True,
+    default=[0.01, 0.02, 0.05, 0.1],
+    type=float,
+    help="Silence volume threshold, repeatable",
+)
+@click.option(
+    "-e",
+    "--ease_in",
+    "eases",
+    multiple=True,
+    default=[0.1],
+    type=float,
+    help="Padding around speech (seconds), repeatable",
+)
+def silence_preview(source, window_sizes, thresholds, eases):
+    """Evaluates silence detection parameter grid without rendering."""
+
+    click.echo(f"{'window':>8} {'threshold':>10} {'ease_in':>8} {'cuts':>6} kept")
+    for row in audio_module.preview(source, window_sizes, thresholds, eases):
+        click.echo(
+            f"{row['window_size']:>8g} {row['volume_threshold']:>10g} "
+            f"{row['ease_in']:>8g} {row['intervals']:>6} "
+            f"{row['kept']:.2f}s ({row['ratio']:.0%})"
+        )
+
+
+# --- Pipeline ---
+@click.command(help="Turn video into clips (download, cut, clean, titles)")
+@opts_video_id_url
+@click.option(
+    "-c",
+    "--clip",
+    "clips",
+    multiple=True,
+    type=str,
+    help="clip time range 't1-t2' (seconds or hh:mm:ss), derived from "
+    "transcript topics if omitted",
+)
+@click.option(
+    "-r",
+    "--resolution",
+    required=False,
+    default=360,
+    type=int,
+    help="Preferred video vertical resolution",
+)
+@click.option(
+    "--silence/--no-silence",
+    default=True,
+    show_default=True,
+    help="cut quiet parts of clips",
+)
+@click.option(
+    "--titles",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="generate clip titles (paid model usage)",
+)
+@click.option(
+    "-w",
+    "--workers",
+    default=pipeline_module.WORKERS_DEFAULT,
+    show_default=True,
+    type=int,
+    help="concurrent stages/renders",
+)
+@click.option(
+    "-f",
+    "--force",
+    default=False,
+    is_flag=True,
+    show_default=True,
+    help="rerun stages even if outputs are up to date",
+)
+@opt_encode_profile
+def pipeline(
+    video_id, url, clips, resolution, silence, titles, workers, force, encode_profile
+):
+    """Runs podcast -> shorts pipeline for a youtube video."""
+
+    ranges = [tuple(c.split("-", 1)) for c in clips]
+    results = pipeline_module.podcast_pipeline(
+        video_id or Video.extract_video_id(url),
+        ranges=ranges,
+        max_resolution=resolution,
+        remove_silence=silence,
+        titles=titles,
+        workers=workers,
+        force=force,
+        profile=encode_profile,
+    ).run(workers=workers, force=force)
+
+    final = results.get(pipeline_module.STAGE_SILENCE) or results.get(
+        pipeline_module.STAGE_CLIPS, []
+    )
+    for vid in final:
+        click.echo(f"Saved to {vid.filepath}")
+
+
+@click.command(help="List cached, stale and pending work per video")
+@click.option("-i", "--video_id", required=False, default=None, help="Video ID")
+def status(video_id):
+    """Lists recorded operations (and configured pipeline stages not run yet) per
+    video ID."""
+
+    store = StateStore()
+    video_ids = [Video.validate_video_id(video_id)] if video_id else store.video_ids()
+    if not video_ids:
+        click.echo(f"No recorded operations ({store.path})")
+
+    for vid in video_ids:
+        click.echo(vid)
+        records = [
+            record
+            for record in store.status(vid)
+            if record["operation"] != pipeline_module.PIPELINE_OPERATION
+        ]
+        recorded = {r["operation"] for r in records}
+        for record in records:
+            params = ", ".join(f"{k}={v}" for k, v in record["params"].items())
+            click.echo(f"  {record['state']:<8} {record['operation']} {params}")
+        for stage in pipeline_module.recorded_stages(store, vid):
+            operation = pipeline_module.STAGE_OPERATION_PREFIX + stage
+            if operation not in recorded:
+                click.echo(f"  {STATE_PENDING:<8} {operation}")
+
+
+# --- Queue ---
+@click.command(help="Show importer health (success/failure counts, latency)")
+def importers():
+    """Lists recorded importer health."""
+
+    registry = Video.registry()
+    for health in registry.stats():
+        latency = health["latency"]
+        state = "open" if registry.is_open(health) else "closed"
+        click.echo(
+            f"{health['importer']:<12} {health['operation']:<16} "
+            f"ok={health['successes']} failed={health['failures']} "
+            f"latency={'-' if latency is None else f'{latency:.2f}s'} "
+            f"breaker={state}"
+        )
+
+
+@click.command(help="Add job to the processing queue")
+@click.argument("kind", type=click.Choice(jobs_module.JOBS, case_sensitive=True))
+@click.option(
+    "-p",
+    "--param",
+    "params",
+    multiple=True,
+    type=str,
+    help="job parameter 'name=value' (e.g. video_id=..., source=..., t1=...)",
+)
+@click.option(
+    "--priority",
+    default=jobs_module.PRIORITY_DEFAULT,
+    show_default=True,
+    type=int,
+    help="higher priority jobs run first",
+)
+@click.option(
+    "--retries",
+    default=jobs_module.RETRIES_DEFAULT,
+    show_default=True,
+    type=int,
+    help="extra attempts on failure",
+)
+@click.option(
+    "--estimate",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="estimate job duration (downloads), shorter jobs run first",
+)
+def enqueue(kind, params, priority, retries, estimate):
+    """Adds job to the persistent queue (processed by `worker`)."""
+
+    parsed = {}
+    for param in params:
+        if "=" not in param:
+            raise click.BadParameter(f"'name=value' expected: {param}")
+        name, value = param.split("=", 1)
+        flags = {"true": True, "false": False}
+        parsed[name] = flags.get(value.lower(), value)
+
+    cost = jobs_module.estimate_cost(kind, parsed) if estimate else None
+    job_id = jobs_module.JobQueue().put(
+        kind, parsed, priority=priority, retries=retries, cost=cost
+    )
+    click.echo(f"Queued job {job_id}")
+
+
+@click.command(help="Process queued jobs")
+@click.option(
+    "--network",
+    default=jobs_module.CONCURRENCY_DEFAULT[jobs_module.RESOURCE_NETWORK],
+    show_default=True,
+    type=int,
+    help="concurrent network-bound jobs (downloads, API requests)",
+)
+@click.option(
+    "--cpu",
+    default=jobs_module.CONCURRENCY_DEFAULT[jobs_module.RESOURCE_CPU],
+    show_default=True,
+    type=int,
+    help="concurrent CPU-bound jobs (encoding)",
+)
+@click.option(
+    "--drain",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="exit once the queue is empty",
+)
+def worker(network, cpu, drain):
+    """Runs queued jobs until interrupted (SIGINT/SIGTERM finish running jobs)."""
+
+    jobs_module.Worker(
+        jobs_module.JobQueue(),
+        concurrency={
+            jobs_module.RESOURCE_NETWORK: network,
+            jobs_module.RESOURCE_CPU: cpu,
+        },
+    ).run(drain=drain)
+
+
+@click.command(help="List queued/processed jobs")
+@click.option(
+    "-s",
+    "--status",
+    "job_status",
+    default=None,
+    type=click.Choice(
+        [
+            jobs_module.STATUS_QUEUED,
+            jobs_module.STATUS_RUNNING,
+            jobs_module.STATUS_DONE,
+            jobs_module.STATUS_FAILED,
+        ]
+    ),
+    help="filter by status",
+)
+def jobs(job_status):
+    """Lists jobs in the queue."""
+
+    for job in jobs_module.JobQueue().jobs(status=job_status):
+        line = (
+            f"{job['id']:>5} {job['status']:<8} {job['kind']:<15} "
+            f"p={job['priority']} try={job['attempts']}/{job['max_attempts']} "
+            f"{job['params']}"
+        )
+        if job["error"] and job["status"] != jobs_module.STATUS_DONE:
+            line += f" ({job['error']})"
+        click.echo(line)
+
+
+@click.command(help="Serve toolset operations over a local HTTP/JSON API")
+@click.option("--host", default=server_module.HOST_DEFAULT, show_default=True, type=str)
+@click.option("--port", default=server_module.PORT_DEFAULT, show_default=True, type=int)
+@click.option(
+    "--network",
+    default=jobs_module.CONCURRENCY_DEFAULT[jobs_module.RESOURCE_NETWORK],
+    show_default=True,
+    type=int,
+    help="concurrent network-bound requests (downloads, API requests)",
+)
+@click.option(
+    "--cpu",
+    default=jobs_module.CONCURRENCY_DEFAULT[jobs_module.RESOURCE_CPU],
+    show_default=True,
+    type=int,
+    help="concurrent CPU-bound requests (encoding)",
+)
+def serve(host, port, network, cpu):
+    """Runs API server until interrupted (POST /<operation>, GET /status)."""
+
+    server = server_module.Server(
+        (host, port),
+        concurrency={
+            jobs_module.RESOURCE_NETWORK: network,
+            jobs_module.RESOURCE_CPU: cpu,
+        },
+    )
+    click.echo(f"Serving {', '.join(sorted(server.handlers))} on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 
 # --- Misc ---
+@click.command(help="Run offline benchmarks on synthetic media")
+@click.option(
+    "-k",
+    "--case",
+    "cases",
+    multiple=True,
+    type=click.Choice(list(bench_module.CASES), case_sensitive=True),
+    help="benchmark case to run (all by default)",
+)
+@click.option(
+    "-d",
+    "--duration",
+    default=bench_module.DURATION_DEFAULT,
+    show_default=True,
+    type=float,
+    help="synthetic media duration (seconds)",
+)
+@click.option(
+    "-n",
+    "--cues",
+    default=bench_module.CUES_DEFAULT,
+    show_default=True,
+    type=int,
+    help="synthetic transcript cue count",
+)
+@click.option(
+    "-r",
+    "--repeat",
+    default=bench_module.REPEAT_DEFAULT,
+    show_default=True,
+    type=int,
+    help="runs per case",
+)
+@click.option(
+    "-c",
+    "--compare",
+    default=None,
+    type=str,
+    help="compare with stored results of this git revision",
+)
+@click.option(
+    "--save/--no-save",
+    default=True,
+    show_default=True,
+    help=f"append results to {bench_module.RESULTS_FILE.name}",
+)
+def bench(cases, duration, cues, repeat, compare, save):
+    """Times core operations on generated fixtures, stores/compares results."""
+
+    records = bench_module.load()
+    record = bench_module.run(
+        names=list(cases),
+        fixtures=bench_module.Fixtures(duration=duration, cues=cues),
+        repeat=repeat,
+    )
+
+    click.echo(f"revision {record['revision']} (min / median of {repeat} runs)")
+    for name, result in record["results"].items():
+        click.echo(f"  {name:<15} {result['min']:9.4f}s {result['median']:9.4f}s")
+
+    if save:
+        click.echo(f"Saved to {bench_module.save(record)}")
+
+    if compare:
+        base = bench_module.find(compare, records, like=record)
+        if not base:
+            raise click.ClickException(f"No stored results for revision {compare}")
+        click.echo(f"compared to {base['revision']}:")
+        for row in bench_module.compare(base, record):
+            mark = " REGRESSION" if row["regression"] else ""
+            click.echo(
+                f"  {row['name']:<15} {row['base']:9.4f}s -> {row['head']:9.4f}s "
+                f"(x{row['ratio']:.2f}){mark}"
+            )
+
+
 @click.command()
 def test():
     ...
 
 
+# --- Global options ---
+GLOBAL_OPTIONS = [
+    click.Option(
+        ["--profile"],
+        is_flag=True,
+        default=False,
+        help="record timings of major stages, print summary and save trace",
+    ),
+    click.Option(
+        ["--trace_file"],
+        default=str(profiling.DEFAULT_TRACE_PATH),
+        show_default=True,
+        type=click.Path(dir_okay=False),
+        help="Chrome trace (JSON) output file for --profile",
+    ),
+    click.Option(
+        ["--progress", "progress_mode"],
+        default=progress.RENDER_BARS,
+        show_default=True,
+        type=click.Choice(progress.RENDER_MODES),
+        help="download progress: terminal bars, JSON lines (stderr) or none",
+    ),
+]
+"""Options accepted before command name."""
+
+
+def main(profile, trace_file, progress_mode):
+    """Global options handler (runs before the invoked command)."""
+
+    ctx = click.get_current_context()
+    if progress_mode == progress.RENDER_BARS:
+        renderer = progress.RichRenderer()
+        ctx.call_on_close(renderer.close)
+        progress.enable([renderer])
+    elif progress_mode == progress.RENDER_JSON:
+        progress.enable([progress.JsonLinesRenderer()])
+
+    if not profile:
+        return
+
+    profiler = profiling.enable()
+
+    def report():
+        profiling.disable()
+        profiler.print_summary()
+        click.echo(f"Trace saved to {profiler.save(trace_file)}")
+
+    ctx.call_on_close(report)
+
+
 # Command group registration:
 @click.group
 def grp():
@@ -287,8 +1056,24 @@ grp.add_command(convert)
 grp.add_command(chunk)
 
 grp.add_command(pull_video)
+grp.add_command(plan_video)
+grp.add_command(pull_clip)
 grp.add_command(cut)
+grp.add_command(cut_many)
+grp.add_command(keyframes)
 grp.add_command(modify_speed)
 grp.add_command(remove_silence)
+grp.add_command(render)
+grp.add_command(silence_preview)
+
+grp.add_command(pipeline)
+grp.add_command(status)
+grp.add_command(importers)
+
+grp.add_command(enqueue)
+grp.add_command(worker)
+grp.add_command(jobs)
+grp.add_command(serve)
 
+grp.add_command(bench)
 grp.add_command(test)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from . import audio, exceptions, utils
+
+
+EDL_VERSION = 1
+FMT_EDL = "edl.json"
+"""Serialized edit decision list format version and file extension."""
+
+OP_CLIP = "clip"
+OP_KEEP = "keep"
+OP_SILENCE = "silence"
+OP_SPEED = "speed"
+OPERATIONS = [OP_CLIP, OP_KEEP, OP_SILENCE, OP_SPEED]
+"""Edit operations (time range, kept intervals, silence removal, speed factor)."""
+
+
+def select(segments: list[list[float]], start: float, end: float) -> list[list[float]]:
+    """Source ranges behind a time range of concatenated segments.
+
+    - segments (list[list[float]]): source (start, end) ranges, in play order
+    - start (float): range start in concatenated timeline
+    - end (float): range end in concatenated timeline
+    """
+
+    selected, offset = [], 0.0
+    for s, e in segments:
+        length = e - s
+        lo, hi = max(start, offset), min(end, offset + length)
+        if hi > lo:
+            selected.append([s + lo - offset, s + hi - offset])
+        offset += length
+
+    return selected
+
+
+def intersect(
+    segments: list[list[float]], intervals: list[list[float]]
+) -> list[list[float]]:
+    """Parts of segments covered by (sorted, source timeline) intervals."""
+
+    return [
+        [max(s, a), min(e, b)]
+        for s, e in segments
+        for a, b in intervals
+        if min(e, b) > max(s, a)
+    ]
+
+
+class EDL:
+    """Lazy edit decision list: operations recorded against a source video file,
+    fused into a single decode/encode pass on render.
+
+    Operations return a new EDL (the original one is left intact), times are in
+    the timeline produced by the preceding operations.
+
+    - source (Path | str): source video file
+    - edits (list[dict] | None, optional (None)): recorded operations
+    """
+
+    def __init__(self, source: Path | str, edits: list[dict] | None = None) -> EDL:
+        self.source = Path(source).expanduser().absolute()
+        self.edits = list(edits or [])
+
+    def __repr__(self) -> str:
+        ops = ", ".join(edit["op"] for edit in self.edits)
+        return f"EDL({self.source.name}: {ops or 'no edits'})"
+
+    def then(self, op: str, **params) -> EDL:
+        """Append an operation."""
+
+        if op not in OPERATIONS:
+            raise exceptions.ValidationError("Unknown edit operation", op)
+        return EDL(self.source, [*self.edits, {"op": op, **params}])
+
+    def clip(
+        self,
+        t1: str | int | float,
+        t2: str | int | float,
+        strip_sound: bool | None = False,
+    ) -> EDL:
+        """Keep time range (t1 - t2), optionally without sound."""
+
+        t1, t2 = utils.parse_time_value(t1), utils.parse_time_value(t2)
+        if t1 >= t2:
+            raise exceptions.ValidationError("Incorrect time range", (t1, t2))
+        return self.then(OP_CLIP, t1=t1, t2=t2, strip_sound=bool(strip_sound))
+
+    def keep(self, intervals: list[list[float]]) -> EDL:
+        """Keep (sorted) intervals, drop the rest."""
+
+        return self.then(
+            OP_KEEP, intervals=[[float(a), float(b)] for a, b in intervals]
+        )
+
+    def cut_silence(
+        self,
+        window_size: float = 0.1,
+        volume_threshold: float = 0.05,
+        ease_in: float = 0.1,
+        mode: str = audio.MODE_FIXED,
+    ) -> EDL:
+        """Drop silent parts (detected on source audio when planned).
+
+        See audio.detect_speaking for parameters, transcript mode is not supported.
+        """
+
+        if mode not in (audio.MODE_FIXED, audio.MODE_ADAPTIVE):
+            raise exceptions.ValidationError("Unsupported silence mode", mode)
+        return self.then(
+            OP_SILENCE,
+            window_size=window_size,
+            volume_threshold=volume_threshold,
+            ease_in=ease_in,
+            mode=mode,
+        )
+
+    def modify_speed(self, factor: float) -> EDL:
+        """Change playback speed."""
+
+        if not isinstance(factor, (int, float)) or factor <= 0:
+            raise exceptions.ValidationError("Invalid speed factor", factor)
+        return self.then(OP_SPEED, factor=float(factor))
+
+    def plan(self, duration: float) -> dict:
+        """Collapse operations into source segments, speed factor and sound flag.
+
+        - duration (float): source duration
+        """
+
+        segments, factor, strip_sound = [[0.0, duration]], 1.0, False
+        for edit in self.edits:
+            if edit["op"] == OP_CLIP:
+                segments = select(segments, edit["t1"] * factor, edit["t2"] * factor)
+                strip_sound = strip_sound or bool(edit.get("strip_sound"))
+            elif edit["op"] == OP_KEEP:
+                segments = [
+                    part
+                    for start, end in edit["intervals"]
+                    for part in select(segments, max(start, 0) * factor, end * factor)
+                ]
+            elif edit["op"] == OP_SILENCE:
+                params = {k: v for k, v in edit.items() if k != "op"}
+                speaking = audio.detect_speaking(self.source, **params)
+                segments = intersect(segments, speaking)
+            elif edit["op"] == OP_SPEED:
+                factor *= edit["factor"]
+            else:
+                raise exceptions.ValidationError("Unknown edit operation", edit["op"])
+
+        return {"segments": segments, "factor": factor, "strip_sound": strip_sound}
+
+    def to_dict(self) -> dict:
+        """Serializable representation."""
+
+        return {"version": EDL_VERSION, "source": str(self.source), "edits": self.edits}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> EDL:
+        """Restore from to_dict output."""
+
+        if data.get("version") != EDL_VERSION:
+            raise exceptions.ValidationError(
+                "Unsupported EDL version", data.get("version")
+            )
+        edl = cls(data["source"])
+        for edit in data["edits"]:
+            edl = edl.then(**edit)
+        return edl
+
+    def save(self, path: Path | str, force: bool | None = False) -> Path:
+        """Write EDL to JSON file."""
+
+        path = Path(path).expanduser().absolute()
+        utils.check_existing_file(path, force=force)
+        utils.ensure_folder(path)
+        utils.write_to_file(path, json.dumps(self.to_dict(), indent=2))
+        return path
+
+    @classmethod
+    def load(cls, path: Path | str) -> EDL:
+        """Read EDL from JSON file."""
+
+        with open(Path(path).expanduser().absolute()) as f:
+            return cls.from_dict(json.load(f))
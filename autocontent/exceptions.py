@@ -26,3 +26,18 @@ class VideoException(Error):
 class VideoUnavailable(VideoException):
     def __init__(self, msg: str = None) -> None:
         super().__init__(msg=msg or "Video unavailable")
+
+
+class ContentUnavailable(VideoUnavailable):
+    def __init__(self, msg: str = None) -> None:
+        super().__init__(msg=msg or "Video is private, removed or restricted")
+
+
+class NetworkError(Error):
+    def __init__(self, msg: str = None) -> None:
+        super().__init__(msg=msg or "Network unavailable")
+
+
+class OperationCancelled(Error):
+    def __init__(self, msg: str = None) -> None:
+        super().__init__(msg=msg or "Operation cancelled")
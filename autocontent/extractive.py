@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import re
+
+import numpy as np
+
+from . import exceptions
+
+
+SENTENCE_PATTERN = r"(?<=[.!?])\s+"
+TOKEN_PATTERN = r"[a-z0-9']+"
+"""Text splitting patterns."""
+
+STOPWORDS = frozenset(
+    """
+    a about above after again against all am an and any are as at be because been
+    before being below between both but by can could did do does doing down during
+    each few for from further had has have having he her here hers herself him
+    himself his how i if in into is it its itself just like me more most my myself
+    no nor not now of off on once only or other our ours ourselves out over own re
+    same she should so some such than that the their theirs them themselves then
+    there these they this those through to too under until up very was we were
+    what when where which while who whom why will with would you your yours
+    yourself yourselves yeah oh um uh okay gonna know really right thing things
+    going get got mean actually
+    """.split()
+)
+"""Words ignored by term weighting."""
+
+DAMPING_DEFAULT = 0.85
+ITERATIONS_MAX = 100
+TOLERANCE = 1e-6
+"""TextRank power iteration parameters."""
+
+SUMMARY_RATIO_DEFAULT = 0.2
+"""Default share of sentences kept in extractive summary."""
+
+SEGMENT_WINDOW_DEFAULT = 3
+SEGMENT_MIN_UNITS_DEFAULT = 3
+RECORDS_WINDOW_DEFAULT = 12
+RECORDS_MIN_UNITS_DEFAULT = 20
+"""Default topic segmentation parameters (in sentences/transcript records)."""
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences."""
+
+    return [s.strip() for s in re.split(SENTENCE_PATTERN, text.strip()) if s.strip()]
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase text and split it into meaningful terms."""
+
+    return [
+        token
+        for token in re.findall(TOKEN_PATTERN, text.lower())
+        if token not in STOPWORDS and len(token) > 1
+    ]
+
+
+def tfidf_matrix(documents: list[str]) -> np.ndarray:
+    """Build L2-normalized TF-IDF matrix (documents x terms).
+
+    - documents (list[str]): text units (sentences, transcript records, ...)
+    """
+
+    tokenized = [tokenize(doc) for doc in documents]
+    vocabulary = {}
+    rows, cols = [], []
+    for i, tokens in enumerate(tokenized):
+        for token in tokens:
+            rows.append(i)
+            cols.append(vocabulary.setdefault(token, len(vocabulary)))
+
+    tf = np.zeros((len(documents), max(len(vocabulary), 1)), dtype=np.float64)
+    np.add.at(tf, (np.array(rows, dtype=int), np.array(cols, dtype=int)), 1.0)
+
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log((1 + len(documents)) / (1 + df)) + 1.0
+    weighted = np.log1p(tf) * idf
+
+    norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+    return np.divide(weighted, norms, out=np.zeros_like(weighted), where=norms > 0)
+
+
+def similarity_matrix(documents: list[str]) -> np.ndarray:
+    """Pairwise cosine similarity of text units."""
+
+    matrix = tfidf_matrix(documents)
+    return matrix @ matrix.T
+
+
+def textrank(
+    similarity: np.ndarray,
+    damping: float = DAMPING_DEFAULT,
+) -> np.ndarray:
+    """Score graph nodes with PageRank over weighted similarity graph.
+
+    - similarity (np.ndarray): square similarity matrix
+    - damping (float, optional (DAMPING_DEFAULT)): damping factor
+    """
+
+    n = similarity.shape[0]
+    if not n:
+        return np.zeros(0)
+
+    weights = similarity.copy()
+    np.fill_diagonal(weights, 0.0)
+    out_degree = weights.sum(axis=1, keepdims=True)
+    transition = np.divide(
+        weights, out_degree, out=np.full_like(weights, 1.0 / n), where=out_degree > 0
+    )
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(ITERATIONS_MAX):
+        updated = (1 - damping) / n + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < TOLERANCE:
+            return updated
+        scores = updated
+
+    return scores
+
+
+def rank_sentences(text: str) -> list[tuple[str, float]]:
+    """Score every sentence of a text by its centrality."""
+
+    sentences = split_sentences(text)
+    scores = textrank(similarity_matrix(sentences))
+
+    return list(zip(sentences, scores.tolist()))
+
+
+def summarize(
+    text: str,
+    ratio: float = SUMMARY_RATIO_DEFAULT,
+    max_sentences: int | None = None,
+) -> str:
+    """Extractive summary: most central sentences in original order.
+
+    - text (str): Text
+    - ratio (float, optional (SUMMARY_RATIO_DEFAULT)): share of sentences to keep
+    - max_sentences (int | None, optional (None)): upper limit of kept sentences
+    """
+
+    if not 0 < ratio <= 1:
+        raise exceptions.ValidationError("Invalid summary ratio", ratio)
+
+    sentences = split_sentences(text)
+    if len(sentences) <= 1:
+        return text.strip()
+
+    count = max(1, round(len(sentences) * ratio))
+    if max_sentences:
+        count = min(count, max_sentences)
+
+    scores = textrank(similarity_matrix(sentences))
+    keep = np.sort(np.argsort(-scores, kind="stable")[:count])
+
+    return " ".join(sentences[i] for i in keep)
+
+
+def boundaries(
+    units: list[str],
+    window: int = SEGMENT_WINDOW_DEFAULT,
+    min_units: int = SEGMENT_MIN_UNITS_DEFAULT,
+) -> list[int]:
+    """Find topic boundaries (TextTiling-like) between consecutive text units.
+
+    Compares TF-IDF blocks of `window` units on each side of every gap, picks
+    gaps whose similarity dip (depth score) stands out.
+    Outputs indexes of units that start new segments.
+
+    - units (list[str]): text units (sentences, transcript records, ...)
+    - window (int, optional (SEGMENT_WINDOW_DEFAULT)): block size in units
+    - min_units (int, optional (SEGMENT_MIN_UNITS_DEFAULT)): minimal segment size
+    """
+
+    if window < 1 or min_units < 1:
+        raise exceptions.ValidationError("Invalid segmentation parameters")
+
+    n = len(units)
+    if n < 2 * min_units:
+        return []
+
+    matrix = tfidf_matrix(units)
+    cumulative = np.vstack([np.zeros(matrix.shape[1]), np.cumsum(matrix, axis=0)])
+    gaps = np.arange(1, n)
+    left = cumulative[gaps] - cumulative[np.maximum(gaps - window, 0)]
+    right = cumulative[np.minimum(gaps + window, n)] - cumulative[gaps]
+
+    norms = np.linalg.norm(left, axis=1) * np.linalg.norm(right, axis=1)
+    dots = np.einsum("ij,ij->i", left, right)
+    sims = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+    padded = np.pad(sims, window, mode="edge")
+    views = np.lib.stride_tricks.sliding_window_view(padded, window + 1)
+    left_peak = views[: len(sims)].max(axis=1)
+    right_peak = views[window:].max(axis=1)
+    depth = (left_peak - sims) + (right_peak - sims)
+
+    cutoff = depth.mean() - depth.std() / 2
+    result = []
+    for i in np.argsort(-depth, kind="stable"):
+        start = int(gaps[i])
+        if depth[i] <= 0 or depth[i] < cutoff:
+            break
+        if start < min_units or n - start < min_units:
+            continue
+        if any(abs(start - b) < min_units for b in result):
+            continue
+        result.append(start)
+
+    return sorted(result)
+
+
+def segment(
+    text: str,
+    window: int = SEGMENT_WINDOW_DEFAULT,
+    min_units: int = SEGMENT_MIN_UNITS_DEFAULT,
+) -> list[str]:
+    """Split text into topic segments by sentence similarity."""
+
+    sentences = split_sentences(text)
+    edges = [0, *boundaries(sentences, window=window, min_units=min_units)]
+    edges.append(len(sentences))
+
+    return [" ".join(sentences[a:b]) for a, b in zip(edges, edges[1:])]
+
+
+def segment_records(
+    records: list[dict],
+    window: int = RECORDS_WINDOW_DEFAULT,
+    min_units: int = RECORDS_MIN_UNITS_DEFAULT,
+) -> list[list[dict]]:
+    """Split transcript records into topic segments.
+
+    - records (list[dict]): transcript records (text/start/duration)
+    - window (int, optional (RECORDS_WINDOW_DEFAULT)): block size in records
+    - min_units (int, optional (RECORDS_MIN_UNITS_DEFAULT)): minimal segment size
+    """
+
+    units = [str(record["text"]) for record in records]
+    edges = [0, *boundaries(units, window=window, min_units=min_units)]
+    edges.append(len(records))
+
+    return [records[a:b] for a, b in zip(edges, edges[1:]) if b > a]
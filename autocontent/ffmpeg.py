@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import tempfile
+from pathlib import Path
+
+from moviepy.config import get_setting
+
+from . import aio, exceptions, utils
+
+
+LOGLEVEL_ERROR = "error"
+LOGLEVEL_INFO = "info"
+"""ffmpeg log levels."""
+
+STREAM_VIDEO = "video"
+STREAM_AUDIO = "audio"
+"""Probed stream types."""
+
+CANCEL_POLL_INTERVAL = 0.2
+"""Cancellation check interval of ffmpeg runs started via aio.run (seconds)."""
+
+SIDECAR_PROBE = "probe.json"
+"""Sidecar file kind for cached probe results."""
+
+THREADED_OUTPUTS_VERSION = (7, 0)
+"""First ffmpeg release encoding and muxing each output in its own thread."""
+
+RE_VERSION = re.compile(r"^ffmpeg version \D*(\d+)\.(\d+)")
+"""ffmpeg release pattern ("-version" output, git builds have none)."""
+
+RE_INPUT = re.compile(r"^Input #0, (.+?), from ", re.M)
+RE_DURATION = re.compile(r"^\s*Duration: (\d+):(\d+):(\d+(?:\.\d+)?)", re.M)
+RE_START = re.compile(r"start: (-?\d+(?:\.\d+)?)")
+RE_BITRATE = re.compile(r"^\s*Duration: .*bitrate: (\d+) kb/s", re.M)
+RE_STREAM = re.compile(r"^\s*Stream #0:(\d+)\S*: (\w+): (\w+)(.*)$", re.M)
+RE_SIZE = re.compile(r", (\d+)x(\d+)[, ]")
+RE_FPS = re.compile(r", (\d+(?:\.\d+)?)(k?) (?:fps|tbr)")
+RE_SAMPLE_RATE = re.compile(r", (\d+) Hz, ([^,]+)")
+RE_STREAM_BITRATE = re.compile(r", (\d+) kb/s")
+"""ffmpeg input information patterns."""
+
+
+def binary() -> str:
+    """ffmpeg executable (the one moviepy is configured with)."""
+
+    return get_setting("FFMPEG_BINARY")
+
+
+def run(
+    *args: str,
+    loglevel: str = LOGLEVEL_ERROR,
+    check: bool = True,
+) -> subprocess.CompletedProcess:
+    """Run ffmpeg with provided arguments, outputs completed process.
+
+    - args (str): ffmpeg arguments
+    - loglevel (str, optional (LOGLEVEL_ERROR)): ffmpeg log level
+    - check (bool, optional (True)): raise VideoException on non-zero exit code
+    """
+
+    command = [binary(), "-hide_banner", "-nostdin", "-loglevel", loglevel, *args]
+    if aio.cancellable():
+        result = run_cancellable(command)
+    else:
+        result = subprocess.run(command, capture_output=True)
+
+    if check and result.returncode:
+        raise failure(result.returncode, result.stderr)
+
+    return result
+
+
+def failure(returncode: int, stderr: bytes) -> exceptions.VideoException:
+    """Error of a failed ffmpeg run (last line of its error output)."""
+
+    error = stderr.decode(errors="replace").strip().splitlines()
+    return exceptions.VideoException(
+        f"ffmpeg failed ({returncode}): {error[-1] if error else ''}"
+    )
+
+
+_versions = {}
+
+
+def version() -> tuple[int, int] | None:
+    """ffmpeg release (major, minor) of the configured binary (None if unknown)."""
+
+    executable = binary()
+    if executable not in _versions:
+        result = subprocess.run([executable, "-version"], capture_output=True)
+        match = RE_VERSION.match(result.stdout.decode(errors="replace"))
+        _versions[executable] = tuple(map(int, match.groups())) if match else None
+    return _versions[executable]
+
+
+def threaded_outputs() -> bool:
+    """Whether one ffmpeg process encodes its outputs in parallel (unknown
+    releases are git builds, assumed recent)."""
+
+    current = version()
+    return current is None or current >= THREADED_OUTPUTS_VERSION
+
+
+def run_fanout(
+    input_args: list[str],
+    maps: list[list[str]],
+    output_args: list[str],
+    targets: list[Path | str],
+) -> None:
+    """Decode once, encode every output in its own ffmpeg process.
+
+    The decoding process streams raw outputs through named pipes (POSIX only)
+    into one encoder process per target, for releases encoding the outputs of
+    one process sequentially (see threaded_outputs). A failed encoder stops the
+    decoding (its pipe would never be read).
+
+    - input_args (list[str]): decoding arguments (inputs, filter graph)
+    - maps (list[list[str]]): "-map" arguments of each output
+    - output_args (list[str]): encoding arguments shared by the outputs
+    - targets (list[Path | str]): output files
+    """
+
+    command = [binary(), "-hide_banner", "-nostdin", "-loglevel", LOGLEVEL_ERROR]
+    with tempfile.TemporaryDirectory() as directory:
+        pipes = [Path(directory) / f"{i}.nut" for i in range(len(targets))]
+        for pipe in pipes:
+            os.mkfifo(pipe)
+
+        encoders = [
+            subprocess.Popen(
+                [*command, "-y", "-i", str(pipe), *output_args, str(target)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+            for pipe, target in zip(pipes, targets)
+        ]
+        args = [*command, "-y", *input_args]
+        for output_maps, pipe in zip(maps, pipes):
+            args += [*output_maps, "-c:v", "rawvideo", "-c:a", "pcm_s16le"]
+            args += ["-f", "nut", str(pipe)]
+
+        decoder = subprocess.Popen(
+            args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        try:
+            while True:
+                try:
+                    stderr = decoder.communicate(timeout=CANCEL_POLL_INTERVAL)[1]
+                    break
+                except subprocess.TimeoutExpired:
+                    if any(encoder.poll() for encoder in encoders):
+                        decoder.kill()
+                    elif aio.cancellable():
+                        aio.checkpoint()
+        finally:
+            if decoder.returncode != 0:
+                for process in (decoder, *encoders):
+                    process.kill()
+                decoder.communicate()
+            errors = [encoder.communicate()[1] for encoder in encoders]
+
+    # killed processes (negative return codes) failed because of another one
+    for process, error in zip((*encoders, decoder), (*errors, stderr)):
+        if process.returncode > 0:
+            raise failure(process.returncode, error)
+    if decoder.returncode:
+        raise failure(decoder.returncode, stderr)
+
+
+def run_cancellable(command: list[str]) -> subprocess.CompletedProcess:
+    """Run command, killing it once the async caller is cancelled."""
+
+    with subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    ) as process:
+        while True:
+            try:
+                stdout, stderr = process.communicate(timeout=CANCEL_POLL_INTERVAL)
+                break
+            except subprocess.TimeoutExpired:
+                try:
+                    aio.checkpoint()
+                except exceptions.OperationCancelled:
+                    process.kill()
+                    process.communicate()
+                    raise
+
+    return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+
+def parse_info(text: str) -> dict:
+    """Parse ffmpeg input information (stderr of "ffmpeg -i <file>").
+
+    Outputs format, duration, start, bitrate (kb/s) and streams (type, codec and
+    size/fps for video, sample_rate/channels for audio). Unknown values are None.
+
+    - text (str): ffmpeg output
+    """
+
+    input_match = RE_INPUT.search(text)
+    if not input_match:
+        raise exceptions.VideoException("No media information in ffmpeg output")
+
+    duration, start, bitrate = None, 0.0, None
+    if match := RE_DURATION.search(text):
+        hours, minutes, seconds = match.groups()
+        duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+        line = text[match.start() : text.find("\n", match.start())]
+        if start_match := RE_START.search(line):
+            start = float(start_match.group(1))
+    if match := RE_BITRATE.search(text):
+        bitrate = int(match.group(1))
+
+    streams = []
+    for match in RE_STREAM.finditer(text):
+        index, kind, codec, details = match.groups()
+        stream = {"index": int(index), "type": kind.lower(), "codec": codec}
+        if (rate := RE_STREAM_BITRATE.search(details)) is not None:
+            stream["bitrate"] = int(rate.group(1))
+        if stream["type"] == STREAM_VIDEO:
+            size, fps = RE_SIZE.search(details), RE_FPS.search(details)
+            stream["width"] = int(size.group(1)) if size else None
+            stream["height"] = int(size.group(2)) if size else None
+            stream["fps"] = (
+                float(fps.group(1)) * (1000 if fps.group(2) else 1) if fps else None
+            )
+        elif stream["type"] == STREAM_AUDIO:
+            rate = RE_SAMPLE_RATE.search(details)
+            stream["sample_rate"] = int(rate.group(1)) if rate else None
+            stream["channels"] = rate.group(2).strip() if rate else None
+        streams.append(stream)
+
+    return {
+        "format": input_match.group(1),
+        "duration": duration,
+        "start": start,
+        "bitrate": bitrate,
+        "streams": streams,
+    }
+
+
+def probe(file: Path | str, force: bool | None = False) -> dict:
+    """Container metadata of a media file without decoding (see parse_info).
+
+    Cached in a sidecar file, valid while the file size/mtime stay the same.
+
+    - file (Path | str): media file
+    - force (bool | None, optional (False)): probe even if cached
+    """
+
+    file = Path(file).absolute()
+    cache = utils.sidecar_path(file, SIDECAR_PROBE)
+    signature = utils.file_signature(file)
+
+    if not force and cache.is_file():
+        with open(cache) as f:
+            cached = json.load(f)
+        if cached.get("source") == signature:
+            return cached["info"]
+
+    result = run("-i", str(file), loglevel=LOGLEVEL_INFO, check=False)
+    output = result.stderr.decode(errors="replace")
+    try:
+        info = parse_info(output)
+    except exceptions.VideoException:
+        lines = output.strip().splitlines()
+        raise exceptions.VideoException(
+            f"Cannot probe {file.name}: {lines[-1] if lines else ''}"
+        )
+
+    with open(cache, "w") as f:
+        json.dump({"source": signature, "info": info}, f)
+
+    return info
+
+
+def first_stream(info: dict, kind: str) -> dict | None:
+    """First stream of a type (STREAM_VIDEO, STREAM_AUDIO) in probe output."""
+
+    return next((s for s in info["streams"] if s["type"] == kind), None)
+
+
+def trim_graph(ranges: list[tuple[float, float]], audio: bool = True) -> str:
+    """Filter graph splitting single input into trimmed streams.
+
+    Output labels are [v0], [a0], [v1], [a1], ... (timestamps reset to zero).
+
+    - ranges (list[tuple[float, float]]): (start, end) in input timeline
+    - audio (bool, optional (True)): trim audio stream along
+    """
+
+    count = len(ranges)
+    splits = [
+        f"[0:v]split={count}" + "".join(f"[vs{i}]" for i in range(count)),
+    ]
+    if audio:
+        splits.append(
+            f"[0:a]asplit={count}" + "".join(f"[as{i}]" for i in range(count))
+        )
+
+    trims = []
+    for i, (start, end) in enumerate(ranges):
+        trims.append(
+            f"[vs{i}]trim=start={start:.3f}:end={end:.3f},setpts=PTS-STARTPTS[v{i}]"
+        )
+        if audio:
+            trims.append(
+                f"[as{i}]atrim=start={start:.3f}:end={end:.3f},"
+                f"asetpts=PTS-STARTPTS[a{i}]"
+            )
+
+    return ";".join(splits + trims)
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+from pathlib import Path
+from typing import Callable
+
+from . import exceptions, utils
+from .utils import config
+
+
+VIDEO_CODEC_RANK = ["avc1", "h264", "vp8", "vp09", "vp9", "hev1", "hvc1", "av01"]
+AUDIO_CODEC_RANK = ["mp4a", "aac", "opus", "vorbis"]
+"""Codec prefixes by decoding cost in the render path (cheapest first)."""
+
+CONTAINER_CODECS = {
+    "mp4": {
+        "video": ["avc1", "h264", "hev1", "hvc1", "av01"],
+        "audio": ["mp4a", "aac", "opus"],
+    },
+    "webm": {"video": ["vp8", "vp09", "vp9", "av01"], "audio": ["opus", "vorbis"]},
+}
+"""Codec prefixes separate streams may be merged into a container with (stream
+copy), containers missing here only take muxed streams."""
+
+BANDWIDTH_DEFAULT = 2_000_000
+CONFIG_BANDWIDTH = "download_bandwidth"
+"""Download bandwidth assumed by estimates (bytes per second)."""
+
+BANDWIDTH_SMOOTHING = 0.3
+"""Weight of the latest download in the observed bandwidth average."""
+
+FORMATS_TTL = 6 * 3600
+"""Format list cache lifetime (seconds), YouTube reencodes fresh uploads."""
+
+observed_bandwidth = None
+"""Measured download bandwidth of this process (bytes per second)."""
+
+
+def codec_rank(codec: str | None, ranking: list[str]) -> int:
+    """Position of a codec in a ranking (unknown codecs go last)."""
+
+    codec = (codec or "").lower()
+    for i, prefix in enumerate(ranking):
+        if codec.startswith(prefix):
+            return i
+    return len(ranking)
+
+
+def fits(codec: str, ext: str | None, kind: str) -> bool:
+    """Whether a codec of kind ("video", "audio") can be muxed into container ext
+    (any container if None)."""
+
+    if ext is None:
+        return True
+    allowed = CONTAINER_CODECS.get(ext, {}).get(kind, [])
+    return codec_rank(codec, allowed) < len(allowed)
+
+
+def normalize(fmt: dict) -> dict | None:
+    """Compact format description from a yt-dlp format dictionary.
+
+    Outputs None for formats without any media stream (storyboards, ...).
+    """
+
+    vcodec, acodec = fmt.get("vcodec"), fmt.get("acodec")
+    vcodec = None if vcodec in (None, "none") else vcodec
+    acodec = None if acodec in (None, "none") else acodec
+    if not vcodec and not acodec:
+        return None
+
+    return {
+        "id": str(fmt["format_id"]),
+        "ext": fmt.get("ext"),
+        "height": fmt.get("height") if vcodec else None,
+        "vcodec": vcodec,
+        "acodec": acodec,
+        "tbr": fmt.get("tbr"),
+        "abr": fmt.get("abr"),
+        "size": fmt.get("filesize") or fmt.get("filesize_approx"),
+    }
+
+
+def load(
+    video_id: str,
+    fetch: Callable[[], dict],
+    directory: Path | str,
+    force: bool | None = False,
+) -> dict:
+    """Format list of a video, cached in the video directory for FORMATS_TTL.
+
+    - video_id (str): youtube video ID
+    - fetch (callable): outputs video information (yt-dlp info dictionary)
+    - directory (Path | str): cache location
+    - force (bool | None, optional (False)): refetch even if cached
+    """
+
+    cache = Path(directory).absolute() / f".{video_id}.formats.json"
+    if not force and cache.is_file():
+        with open(cache) as f:
+            cached = json.load(f)
+        if time.time() - cached["fetched"] < FORMATS_TTL:
+            return cached
+
+    info = fetch()
+    cached = {
+        "fetched": time.time(),
+        "duration": info.get("duration"),
+        "formats": [fmt for fmt in map(normalize, info.get("formats") or []) if fmt],
+    }
+    utils.ensure_folder(cache)
+    with open(cache, "w") as f:
+        json.dump(cached, f)
+
+    return cached
+
+
+def bandwidth() -> float:
+    """Bandwidth to plan with (config > observed > BANDWIDTH_DEFAULT)."""
+
+    return config.get(CONFIG_BANDWIDTH, observed_bandwidth or BANDWIDTH_DEFAULT)
+
+
+def observe(size: int, seconds: float) -> float:
+    """Update observed bandwidth with a finished download, outputs the average."""
+
+    global observed_bandwidth
+
+    if size > 0 and seconds > 0:
+        rate = size / seconds
+        observed_bandwidth = (
+            rate
+            if observed_bandwidth is None
+            else BANDWIDTH_SMOOTHING * rate
+            + (1 - BANDWIDTH_SMOOTHING) * observed_bandwidth
+        )
+    return observed_bandwidth
+
+
+def size_of(fmt: dict, duration: float | None = None) -> int | None:
+    """Reported or bitrate based (total bitrate, kbit/s) stream size in bytes."""
+
+    if fmt["size"]:
+        return int(fmt["size"])
+    rate = fmt["tbr"] or fmt["abr"]
+    if rate and duration:
+        return int(rate * duration * 125)
+    return None
+
+
+def plan(
+    formats: list[dict],
+    height: int,
+    exact: bool | None = False,
+    ext: str | None = None,
+    duration: float | None = None,
+    rate: float | None = None,
+    budget: float | None = None,
+) -> dict:
+    """Cheapest stream set delivering the target resolution.
+
+    The highest resolution up to height wins. Within it muxed (progressive)
+    streams go first (no merge), then codecs cheapest to decode, then smaller
+    downloads. With a time budget lower resolutions are taken until the
+    estimated download time fits (the lowest one if none does).
+
+    Outputs yt-dlp format selector ("18" or "137+140"), chosen streams and
+    size (bytes)/time (seconds) estimates (None if unknown).
+
+    - formats (list[dict]): normalized formats (see normalize)
+    - height (int): target resolution (horizontal line count)
+    - exact (bool | None, optional (False)): only the target resolution
+    - ext (str | None, optional (None)): output container, muxed streams in
+        other containers are skipped, merged streams must fit it
+        (CONTAINER_CODECS)
+    - duration (float | None, optional (None)): video duration (seconds)
+    - rate (float | None, optional (bandwidth())): bandwidth (bytes per second)
+    - budget (float | None, optional (None)): download time limit (seconds)
+    """
+
+    rate = rate or bandwidth()
+    audio = [
+        fmt
+        for fmt in formats
+        if fmt["acodec"] and not fmt["vcodec"] and fits(fmt["acodec"], ext, "audio")
+    ]
+    best_audio = min(
+        audio,
+        key=lambda a: (codec_rank(a["acodec"], AUDIO_CODEC_RANK), -(a["abr"] or 0)),
+        default=None,
+    )
+
+    candidates = {}
+    for fmt in formats:
+        if not fmt["vcodec"] or not fmt["height"]:
+            continue
+        if fmt["height"] != height if exact else fmt["height"] > height:
+            continue
+        if fmt["acodec"]:
+            if ext and fmt["ext"] != ext:
+                continue
+            streams = [fmt]
+        elif best_audio and fits(fmt["vcodec"], ext, "video"):
+            streams = [fmt, best_audio]
+        else:
+            continue
+        candidates.setdefault(fmt["height"], []).append(streams)
+
+    if not candidates:
+        raise exceptions.ValidationError("No formats for resolution", height)
+
+    def estimate(streams: list[dict]) -> dict:
+        sizes = [size_of(fmt, duration) for fmt in streams]
+        size = None if None in sizes else sum(sizes)
+        return {
+            "format": "+".join(fmt["id"] for fmt in streams),
+            "height": streams[0]["height"],
+            "vcodec": streams[0]["vcodec"],
+            "acodec": streams[-1]["acodec"],
+            "merge": len(streams) > 1,
+            "size": size,
+            "seconds": None if size is None else size / rate,
+        }
+
+    chosen = None
+    for res in sorted(candidates, reverse=True):
+        chosen = min(
+            map(estimate, candidates[res]),
+            key=lambda c: (
+                c["merge"],
+                codec_rank(c["vcodec"], VIDEO_CODEC_RANK),
+                math.inf if c["size"] is None else c["size"],
+            ),
+        )
+        if budget is None or chosen["seconds"] is None or chosen["seconds"] <= budget:
+            break
+
+    return chosen
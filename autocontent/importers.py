@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import inspect
+import math
+import time
+from typing import Any
+
+from . import exceptions, profiling
+from .profiling import CAT_DOWNLOAD
+from .state import StateStore
+
+
+BREAKER_FAILURES = 3
+BREAKER_COOLDOWN = 300.0
+"""Circuit breaker: consecutive failures to open it, seconds until a retry."""
+
+LATENCY_SMOOTHING = 0.3
+"""Weight of the latest call in the (exponential moving average) latency."""
+
+NON_RETRIABLE = (
+    exceptions.ValidationError,
+    exceptions.InvalidFileName,
+    exceptions.InvalidFilePath,
+    exceptions.OperationCancelled,
+    exceptions.ContentUnavailable,
+)
+"""Caller errors, cancellation and unavailable content (private, removed video),
+raised right away (no failover, not counted against the importer)."""
+
+UNATTRIBUTED = (exceptions.NetworkError,)
+"""Errors not caused by the importer (connectivity), failed over but not counted."""
+
+HEALTH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS importer_health (
+    importer TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    successes INTEGER NOT NULL DEFAULT 0,
+    failures INTEGER NOT NULL DEFAULT 0,
+    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+    latency REAL,
+    opened REAL,
+    error TEXT,
+    updated REAL NOT NULL,
+    PRIMARY KEY (importer, operation)
+)
+"""
+"""Importer health table (stored in the state database)."""
+
+
+class ImporterRegistry:
+    """Importer backends tried in order on failure, routed by recorded health.
+
+    Healthy importers with recorded latency go first (fastest first), the rest
+    keep the configured order. An importer failing BREAKER_FAILURES times in a
+    row is skipped for BREAKER_COOLDOWN seconds (then gets a single trial); if
+    every importer's breaker is open, all of them are tried in configured order.
+
+    - importers (dict[str, type]): importer name <-> VideoImporter class
+    - order (list[str] | None, optional (importers order)): failover order
+    - store (StateStore | None, optional (None)): health storage (default state
+        database)
+    - failures (int, optional (BREAKER_FAILURES)): failures opening the breaker
+    - cooldown (float, optional (BREAKER_COOLDOWN)): breaker cooldown (seconds)
+    """
+
+    def __init__(
+        self,
+        importers: dict[str, type],
+        order: list[str] | None = None,
+        store: StateStore | None = None,
+        failures: int = BREAKER_FAILURES,
+        cooldown: float = BREAKER_COOLDOWN,
+    ) -> ImporterRegistry:
+        self.importers = dict(importers)
+        order = order or list(importers)
+        unknown = [name for name in order if name not in self.importers]
+        if unknown:
+            raise exceptions.ValidationError("Unknown importers", unknown)
+
+        self.order = list(order)
+        self.failures = failures
+        self.cooldown = cooldown
+        self.store = store or StateStore()
+        self.store.execute(HEALTH_SCHEMA)
+
+    def supports(self, name: str, operation: str) -> bool:
+        """Whether an importer declares an operation (VideoImporter.operations)
+        and can be instantiated."""
+
+        importer = self.importers[name]
+        return operation in importer.operations and not inspect.isabstract(importer)
+
+    def health(self, name: str, operation: str) -> dict:
+        """Recorded health of an importer operation."""
+
+        rows = self.store.execute(
+            "SELECT * FROM importer_health WHERE importer=? AND operation=?",
+            (name, operation),
+        )
+        if rows:
+            return dict(rows[0])
+        return {
+            "importer": name,
+            "operation": operation,
+            "successes": 0,
+            "failures": 0,
+            "consecutive_failures": 0,
+            "latency": None,
+            "opened": None,
+            "error": None,
+            "updated": None,
+        }
+
+    def is_open(self, health: dict, now: float | None = None) -> bool:
+        """Whether the circuit breaker skips an importer (cooldown not over)."""
+
+        now = time.time() if now is None else now
+        return health["opened"] is not None and now - health["opened"] < self.cooldown
+
+    def ranked(self, operation: str) -> list[str]:
+        """Importers supporting an operation with closed breakers, best first
+        (all supporting ones in configured order if every breaker is open)."""
+
+        supporting = [name for name in self.order if self.supports(name, operation)]
+        candidates = []
+        for position, name in enumerate(supporting):
+            health = self.health(name, operation)
+            if self.is_open(health):
+                continue
+            latency = health["latency"]
+            candidates.append(
+                (math.inf if latency is None else latency, position, name)
+            )
+
+        return [name for *_, name in sorted(candidates)] or supporting
+
+    def record(
+        self,
+        name: str,
+        operation: str,
+        latency: float | None = None,
+        error: BaseException | None = None,
+    ) -> dict:
+        """Update importer health with an attempt outcome."""
+
+        health, now = self.health(name, operation), time.time()
+        if error is None:
+            health["successes"] += 1
+            health["consecutive_failures"] = 0
+            health["opened"] = None
+            health["latency"] = (
+                latency
+                if health["latency"] is None
+                else LATENCY_SMOOTHING * latency
+                + (1 - LATENCY_SMOOTHING) * health["latency"]
+            )
+        else:
+            health["failures"] += 1
+            health["consecutive_failures"] += 1
+            health["error"] = f"{type(error).__name__}: {error}"
+            if health["consecutive_failures"] >= self.failures:
+                health["opened"] = now
+        health["updated"] = now
+
+        fields = [key for key in health if key not in ("importer", "operation")]
+        self.store.execute(
+            f"INSERT OR REPLACE INTO importer_health (importer, operation, "
+            f"{', '.join(fields)}) VALUES (?, ?{', ?' * len(fields)})",
+            (name, operation, *(health[key] for key in fields)),
+        )
+        return health
+
+    def call(self, video_id: str, operation: str, **kwargs) -> Any:
+        """Run importer operation, failing over to the next importer on errors.
+
+        Keyword arguments an importer does not accept are dropped.
+
+        - video_id (str): youtube video ID
+        - operation (str): importer method name (download, download_audio, ...)
+        """
+
+        ranked = self.ranked(operation)
+        if not ranked:
+            raise exceptions.VideoException(
+                f"No available importer supports {operation}"
+            )
+
+        errors = []
+        for name in ranked:
+            method = getattr(self.importers[name](video_id=video_id), operation)
+            accepted = inspect.signature(method).parameters
+            call_kwargs = {k: v for k, v in kwargs.items() if k in accepted}
+
+            start = time.perf_counter()
+            try:
+                with profiling.span(f"{operation}:{name}", CAT_DOWNLOAD):
+                    result = method(**call_kwargs)
+            except NON_RETRIABLE:
+                raise
+            except UNATTRIBUTED as e:
+                errors.append(f"{name}: {e}")
+                continue
+            except Exception as e:
+                self.record(name, operation, error=e)
+                errors.append(f"{name}: {e}")
+                continue
+
+            self.record(name, operation, latency=time.perf_counter() - start)
+            return result
+
+        raise exceptions.VideoUnavailable(
+            f"All importers failed ({operation}): " + "; ".join(errors)
+        )
+
+    def stats(self) -> list[dict]:
+        """Recorded health of all importers."""
+
+        rows = self.store.execute(
+            "SELECT * FROM importer_health ORDER BY operation, importer"
+        )
+        return [dict(row) for row in rows]
@@ -0,0 +1,560 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+from . import exceptions, profiling, text_analysis, utils
+from . import subs as subs_module
+from .edl import EDL
+from .state import DEFAULT_DB_PATH
+from .subs import FMT_COMPRESSED, FMT_JSON, Subs
+from .video import Video
+
+
+JOB_DOWNLOAD = "download"
+JOB_DOWNLOAD_AUDIO = "download_audio"
+JOB_SUBTITLES = "subtitles"
+JOB_CUT = "cut"
+JOB_MODIFY_SPEED = "modify_speed"
+JOB_REMOVE_SILENCE = "remove_silence"
+JOB_RENDER = "render"
+JOB_TITLES = "titles"
+"""Job kinds."""
+
+RESOURCE_NETWORK = "network"
+RESOURCE_CPU = "cpu"
+RESOURCES = [RESOURCE_NETWORK, RESOURCE_CPU]
+"""Resource classes (jobs of a class share a concurrency limit)."""
+
+JOB_RESOURCES = {
+    JOB_DOWNLOAD: RESOURCE_NETWORK,
+    JOB_DOWNLOAD_AUDIO: RESOURCE_NETWORK,
+    JOB_SUBTITLES: RESOURCE_NETWORK,
+    JOB_TITLES: RESOURCE_NETWORK,
+    JOB_CUT: RESOURCE_CPU,
+    JOB_MODIFY_SPEED: RESOURCE_CPU,
+    JOB_REMOVE_SILENCE: RESOURCE_CPU,
+    JOB_RENDER: RESOURCE_CPU,
+}
+"""Job kind <-> resource class mapping."""
+
+JOBS = list(JOB_RESOURCES)
+"""Supported job kinds."""
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+"""Job statuses."""
+
+PRIORITY_DEFAULT = 0
+RETRIES_DEFAULT = 2
+RETRY_DELAY = 5.0
+POLL_INTERVAL = 1.0
+"""Queue defaults (delays in seconds)."""
+
+LEASE_DURATION = 60.0
+"""Claimed job lease (seconds), renewed by the owning worker's heartbeat; jobs
+with an expired lease (crashed worker) are requeued."""
+
+CONCURRENCY_DEFAULT = {
+    RESOURCE_NETWORK: 2,
+    RESOURCE_CPU: max(1, (os.cpu_count() or 2) // 2),
+}
+"""Default worker threads per resource class."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 1,
+    not_before REAL NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    worker TEXT,
+    lease REAL,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+)
+"""
+"""Job queue table schema."""
+
+
+class JobQueue:
+    """Durable (SQLite-backed) job queue.
+
+    - path (Path | str | None, optional (DEFAULT_DB_PATH)): database location
+    """
+
+    def __init__(self, path: Path | str | None = None) -> JobQueue:
+        self.path = Path(path or DEFAULT_DB_PATH).absolute()
+        utils.ensure_folder(self.path)
+        with self.transaction() as conn:
+            conn.execute(SCHEMA)
+            columns = [row["name"] for row in conn.execute("PRAGMA table_info(jobs)")]
+            if "cost" not in columns:  # queues created before cost estimates
+                conn.execute("ALTER TABLE jobs ADD COLUMN cost REAL NOT NULL DEFAULT 0")
+            if "lease" not in columns:  # queues created before leases
+                conn.execute("ALTER TABLE jobs ADD COLUMN worker TEXT")
+                conn.execute("ALTER TABLE jobs ADD COLUMN lease REAL")
+
+    @contextmanager
+    def transaction(self):
+        """Exclusive (write-locked) transaction, safe across worker processes."""
+
+        with closing(
+            sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        ) as conn:
+            conn.row_factory = sqlite3.Row
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> dict:
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        if job["result"] is not None:
+            job["result"] = json.loads(job["result"])
+        return job
+
+    def put(
+        self,
+        kind: str,
+        params: dict | None = None,
+        priority: int | None = PRIORITY_DEFAULT,
+        retries: int | None = RETRIES_DEFAULT,
+        cost: float | None = None,
+    ) -> int:
+        """Enqueue job, returns its ID.
+
+        - kind (str): job kind
+        - params (dict | None, optional (None)): job handler kwargs
+        - priority (int | None, optional (PRIORITY_DEFAULT)): higher goes first
+        - retries (int | None, optional (RETRIES_DEFAULT)): extra attempts on failure
+        - cost (float | None, optional (None)): estimated duration (seconds, see
+            estimate_cost), cheaper jobs of the same priority go first
+        """
+
+        if kind not in JOBS:
+            raise exceptions.ValidationError(msg=f"Unknown job kind: {kind}")
+        if retries is not None and retries < 0:
+            raise exceptions.ValidationError("Invalid retry count", retries)
+
+        now = time.time()
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (kind, params, priority, cost, status, "
+                "max_attempts, created, updated) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    json.dumps(params or {}),
+                    priority or PRIORITY_DEFAULT,
+                    cost or 0,
+                    STATUS_QUEUED,
+                    1 + (RETRIES_DEFAULT if retries is None else retries),
+                    now,
+                    now,
+                ),
+            )
+            return cursor.lastrowid
+
+    def claim(
+        self,
+        kinds: list[str] | None = None,
+        worker: str | None = None,
+        lease: float = LEASE_DURATION,
+    ) -> dict | None:
+        """Take the most urgent queued job (of provided kinds) for execution.
+
+        - kinds (list[str] | None, optional (JOBS)): job kinds to consider
+        - worker (str | None, optional (None)): claiming worker ID
+        - lease (float, optional (LEASE_DURATION)): seconds the job stays owned
+            by the worker without a heartbeat
+        """
+
+        kinds = kinds or JOBS
+        now = time.time()
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status=? AND not_before<=? "
+                f"AND kind IN ({', '.join('?' * len(kinds))}) "
+                "ORDER BY priority DESC, cost, id LIMIT 1",
+                (STATUS_QUEUED, now, *kinds),
+            ).fetchone()
+            if not row:
+                return None
+
+            conn.execute(
+                "UPDATE jobs SET status=?, attempts=attempts+1, worker=?, lease=?, "
+                "updated=? WHERE id=?",
+                (STATUS_RUNNING, worker, now + lease, now, row["id"]),
+            )
+
+        job = self._to_job(row)
+        job.update(
+            status=STATUS_RUNNING,
+            attempts=job["attempts"] + 1,
+            worker=worker,
+            lease=now + lease,
+        )
+        return job
+
+    def heartbeat(self, worker: str, lease: float = LEASE_DURATION) -> int:
+        """Renew leases of the jobs a worker is running, outputs their count."""
+
+        now = time.time()
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease=? WHERE status=? AND worker=?",
+                (now + lease, STATUS_RUNNING, worker),
+            )
+            return cursor.rowcount
+
+    def complete(
+        self, job_id: int, result: Any = None, worker: str | None = None
+    ) -> bool:
+        """Mark job as done, outputs whether the outcome was recorded.
+
+        Only the worker holding the claim may complete the job: once its lease
+        expired and the job was recovered, the (stale) result is dropped.
+
+        - job_id (int): job ID
+        - result (Any, optional (None)): handler result (JSON-serializable)
+        - worker (str | None, optional (None)): claiming worker ID
+        """
+
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status=?, result=?, error=NULL, updated=? "
+                "WHERE id=? AND status=? AND worker IS ?",
+                (
+                    STATUS_DONE,
+                    json.dumps(result, default=str),
+                    time.time(),
+                    job_id,
+                    STATUS_RUNNING,
+                    worker,
+                ),
+            )
+            return cursor.rowcount > 0
+
+    def fail(
+        self,
+        job_id: int,
+        error: str,
+        retry_delay: float = RETRY_DELAY,
+        worker: str | None = None,
+    ) -> str | None:
+        """Requeue failed job with exponential backoff or mark it failed.
+
+        Outputs resulting job status, None if the worker no longer holds the
+        claim (see complete).
+        """
+
+        now = time.time()
+        with self.transaction() as conn:
+            job = conn.execute(
+                "SELECT * FROM jobs WHERE id=? AND status=? AND worker IS ?",
+                (job_id, STATUS_RUNNING, worker),
+            ).fetchone()
+            if not job:
+                return None
+            status = (
+                STATUS_QUEUED
+                if job["attempts"] < job["max_attempts"]
+                else STATUS_FAILED
+            )
+            delay = retry_delay * 2 ** max(job["attempts"] - 1, 0)
+            conn.execute(
+                "UPDATE jobs SET status=?, error=?, not_before=?, updated=? WHERE id=?",
+                (status, error, now + delay, now, job_id),
+            )
+
+        return status
+
+    def recover(self, now: float | None = None) -> int:
+        """Requeue running jobs with an expired lease (their worker crashed or
+        hung), outputs their count. Jobs of live workers are left alone.
+
+        - now (float | None, optional (time.time())): current timestamp
+        """
+
+        now = time.time() if now is None else now
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status=?, worker=NULL, lease=NULL, updated=? "
+                "WHERE status=? AND (lease IS NULL OR lease<?)",
+                (STATUS_QUEUED, now, STATUS_RUNNING, now),
+            )
+            return cursor.rowcount
+
+    def get(self, job_id: int) -> dict | None:
+        """Fetch job."""
+
+        with self.transaction() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id=?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def jobs(self, status: str | None = None) -> list[dict]:
+        """List jobs (with specific status)."""
+
+        with self.transaction() as conn:
+            if status:
+                rows = conn.execute(
+                    "SELECT * FROM jobs WHERE status=? ORDER BY id", (status,)
+                ).fetchall()
+            else:
+                rows = conn.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def pending(self, kinds: list[str] | None = None) -> int:
+        """Amount of queued/running jobs (of provided kinds)."""
+
+        kinds = kinds or JOBS
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?) "
+                f"AND kind IN ({', '.join('?' * len(kinds))})",
+                (STATUS_QUEUED, STATUS_RUNNING, *kinds),
+            ).fetchone()
+        return row[0]
+
+
+def estimate_cost(kind: str, params: dict | None = None) -> float:
+    """Estimated job duration (seconds) for queue ordering, 0 if unknown.
+
+    Downloads are estimated from the planned streams (cached format list).
+    """
+
+    params = params or {}
+    if kind != JOB_DOWNLOAD or "video_id" not in params:
+        return 0
+
+    plan_kwargs = {
+        name: params[name]
+        for name in ("max_resolution", "mime_type", "exact_resolution")
+        if name in params
+    }
+    if params.get("time_budget") is not None:
+        plan_kwargs["time_budget"] = float(params["time_budget"])
+
+    return Video.plan_download(params["video_id"], **plan_kwargs)["seconds"] or 0
+
+
+# --- Job handlers ---
+def _video_result(video: Video) -> dict:
+    return {"filepath": str(video.filepath)}
+
+
+def handle_download(video_id: str, **download_kwargs) -> dict:
+    return _video_result(Video(video_id=video_id, download_kwargs=download_kwargs))
+
+
+def handle_download_audio(video_id: str, **download_kwargs) -> dict:
+    return _video_result(
+        Video(video_id=video_id, audio_only=True, download_kwargs=download_kwargs)
+    )
+
+
+def handle_subtitles(
+    video_id: str, output_file: str | None = None, force: bool | None = False
+) -> dict:
+    target = (
+        Path(output_file)
+        if output_file
+        else subs_module.DEFAULT_DIR / f"{video_id}.{FMT_JSON}"
+    )
+    Subs(video_id=video_id).save(target, fmt=FMT_JSON, force=force)
+    return {"filepath": str(target)}
+
+
+def handle_cut(source: str, t1: str, t2: str, **kwargs) -> dict:
+    return _video_result(Video(filepath=source).clip(t1, t2, **kwargs))
+
+
+def handle_modify_speed(source: str, factor: float | str, **kwargs) -> dict:
+    return _video_result(
+        Video(filepath=source).modify_speed(factor=float(factor), **kwargs)
+    )
+
+
+def handle_remove_silence(source: str, **kwargs) -> dict:
+    return _video_result(Video(filepath=source).cut_silence(**kwargs))
+
+
+def handle_render(edl: str | dict, **kwargs) -> dict:
+    edl = EDL.from_dict(edl) if isinstance(edl, dict) else EDL.load(edl)
+    return _video_result(Video.render_edl(edl, **kwargs))
+
+
+def handle_titles(
+    source: str,
+    t1: str | None = None,
+    t2: str | None = None,
+    title_count: int | str = 5,
+) -> list[str]:
+    subs = Subs(filepath=source)
+    if t1 is not None and t2 is not None:
+        subs = subs.cut(t1, t2)
+
+    context = Subs.format_subs(subs.transcript, FMT_COMPRESSED)
+    return text_analysis.suggest_titles(context, title_count=int(title_count))
+
+
+HANDLERS = {
+    JOB_DOWNLOAD: handle_download,
+    JOB_DOWNLOAD_AUDIO: handle_download_audio,
+    JOB_SUBTITLES: handle_subtitles,
+    JOB_CUT: handle_cut,
+    JOB_MODIFY_SPEED: handle_modify_speed,
+    JOB_REMOVE_SILENCE: handle_remove_silence,
+    JOB_RENDER: handle_render,
+    JOB_TITLES: handle_titles,
+}
+"""Job kind <-> handler mapping."""
+
+
+class Worker:
+    """Queue consumer running jobs with per-resource-class concurrency.
+
+    - queue (JobQueue): job queue
+    - concurrency (dict[str, int] | None, optional (CONCURRENCY_DEFAULT)):
+        threads per resource class
+    - handlers (dict[str, callable] | None, optional (HANDLERS)): job handlers
+    - poll_interval (float, optional (POLL_INTERVAL)): idle polling interval
+    - retry_delay (float, optional (RETRY_DELAY)): base retry backoff
+    - lease (float, optional (LEASE_DURATION)): claimed job lease, renewed
+        every lease / 4 seconds while the worker runs
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        concurrency: dict[str, int] | None = None,
+        handlers: dict[str, Callable[..., Any]] | None = None,
+        poll_interval: float = POLL_INTERVAL,
+        retry_delay: float = RETRY_DELAY,
+        lease: float = LEASE_DURATION,
+    ) -> Worker:
+        self.id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.queue = queue
+        self.concurrency = {**CONCURRENCY_DEFAULT, **(concurrency or {})}
+        self.handlers = handlers or HANDLERS
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.lease = lease
+        self.stopping = threading.Event()
+        self.finished = threading.Event()
+
+        unknown = set(self.concurrency) - set(RESOURCES)
+        if unknown:
+            raise exceptions.ValidationError(msg=f"Unknown resource classes: {unknown}")
+
+    def stop(self, *_) -> None:
+        """Request graceful shutdown (running jobs are allowed to finish)."""
+
+        if not self.stopping.is_set():
+            print("Shutting down after running jobs finish...")
+        self.stopping.set()
+
+    def run_job(self, job: dict) -> None:
+        """Execute claimed job and record its outcome."""
+
+        print(
+            f"[{job['id']}] {job['kind']} {job['params']} (attempt {job['attempts']})"
+        )
+        try:
+            with profiling.span(job["kind"], profiling.CAT_PIPELINE, job=job["id"]):
+                result = self.handlers[job["kind"]](**job["params"])
+        except Exception as e:
+            status = self.queue.fail(
+                job["id"], repr(e), retry_delay=self.retry_delay, worker=self.id
+            )
+            if status is None:
+                print(f"[{job['id']}] failed after losing its lease, dropped: {e!r}")
+            else:
+                print(f"[{job['id']}] failed ({status}): {e!r}")
+        else:
+            if self.queue.complete(job["id"], result, worker=self.id):
+                print(f"[{job['id']}] done")
+            else:
+                print(f"[{job['id']}] done after losing its lease, result dropped")
+
+    def consume(self, resource: str, drain: bool) -> None:
+        """Worker thread loop for a resource class."""
+
+        kinds = [kind for kind, res in JOB_RESOURCES.items() if res == resource]
+
+        while not self.stopping.is_set():
+            job = self.queue.claim(kinds, worker=self.id, lease=self.lease)
+            if job:
+                self.run_job(job)
+                continue
+            if drain and not self.queue.pending(kinds):
+                return
+            self.stopping.wait(self.poll_interval)
+
+    def heartbeat(self) -> None:
+        """Heartbeat thread loop: renew own leases, requeue expired ones."""
+
+        while not self.finished.wait(self.lease / 4):
+            self.queue.heartbeat(self.id, self.lease)
+            recovered = self.queue.recover()
+            if recovered:
+                print(f"Requeued {recovered} abandoned job(s)")
+
+    def run(self, drain: bool | None = False) -> None:
+        """Process jobs until stopped (SIGINT/SIGTERM) or, if drain, queue is empty.
+
+        - drain (bool | None, optional (False)): exit once there's no work left
+        """
+
+        recovered = self.queue.recover()
+        if recovered:
+            print(f"Requeued {recovered} interrupted job(s)")
+        self.finished.clear()
+        heartbeat = threading.Thread(
+            target=self.heartbeat, name="heartbeat", daemon=True
+        )
+        heartbeat.start()
+
+        if threading.current_thread() is threading.main_thread():
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(sig, self.stop)
+
+        threads = [
+            threading.Thread(
+                target=self.consume,
+                args=(resource, bool(drain)),
+                name=f"{resource}-{i}",
+                daemon=True,
+            )
+            for resource, count in self.concurrency.items()
+            for i in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=self.poll_interval)
+        self.finished.set()
+        heartbeat.join()
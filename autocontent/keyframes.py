@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+from pathlib import Path
+
+from . import exceptions, ffmpeg, profiling, utils
+from .profiling import CAT_VIDEO
+
+
+SIDECAR_KEYFRAMES = "keyframes.json"
+"""Sidecar file kind for cached keyframe indexes."""
+
+SNAP_BEFORE = "before"
+SNAP_AFTER = "after"
+SNAP_NEAREST = "nearest"
+SNAP_MODES = [SNAP_BEFORE, SNAP_AFTER, SNAP_NEAREST]
+"""Keyframe snapping directions."""
+
+PACKET_FLAG_KEY = 0x1
+"""Packet flag marking keyframes (framecrc omits flags of plain keyframes)."""
+
+
+def parse_framecrc(text: str) -> list[float]:
+    """Keyframe timestamps (seconds, sorted) from ffmpeg framecrc output.
+
+    Packet lines are "stream, dts, pts, duration, size, crc[, F=flags]".
+
+    - text (str): framecrc output of a single video stream
+    """
+
+    time_base, times = None, []
+    for line in text.splitlines():
+        if line.startswith("#tb "):
+            time_base = Fraction(line.split(":", 1)[1].strip())
+            continue
+        if not line or line.startswith("#"):
+            continue
+
+        fields = [field.strip() for field in line.split(",")]
+        flags = PACKET_FLAG_KEY
+        if len(fields) > 6 and fields[6].startswith("F="):
+            flags = int(fields[6][2:], 16)
+        if flags & PACKET_FLAG_KEY:
+            times.append(int(fields[2]))
+
+    if time_base is None:
+        raise exceptions.VideoException("No time base in framecrc output")
+
+    return sorted(float(pts * time_base) for pts in times)
+
+
+@profiling.timed("build_keyframes", CAT_VIDEO)
+def build(source: Path | str) -> list[float]:
+    """Scan video packets (stream copy, no decoding) for keyframe timestamps."""
+
+    result = ffmpeg.run(
+        "-i", str(source), "-map", "0:v:0", "-c", "copy", "-f", "framecrc", "-"
+    )
+    return parse_framecrc(result.stdout.decode())
+
+
+def load(source: Path | str, force: bool | None = False) -> list[float]:
+    """Keyframe index of a video file, cached next to it (keyed by size/mtime).
+
+    - source (Path | str): video file
+    - force (bool | None, optional (False)): rebuild even if cached
+    """
+
+    source = Path(source).absolute()
+    cache = utils.sidecar_path(source, SIDECAR_KEYFRAMES)
+    signature = utils.file_signature(source)
+
+    if not force and cache.is_file():
+        with open(cache) as f:
+            cached = json.load(f)
+        if cached.get("source") == signature:
+            return cached["keyframes"]
+
+    keyframes = build(source)
+    with open(cache, "w") as f:
+        json.dump({"source": signature, "keyframes": keyframes}, f)
+
+    return keyframes
+
+
+def snap(keyframes: list[float], t: float, mode: str = SNAP_BEFORE) -> float:
+    """Keyframe timestamp closest to t in a direction (bisect lookup).
+
+    Falls back to the first/last keyframe when there is none in the direction.
+
+    - keyframes (list[float]): sorted keyframe timestamps
+    - t (float): time in seconds
+    - mode (str, optional (SNAP_BEFORE)): SNAP_BEFORE, SNAP_AFTER or SNAP_NEAREST
+    """
+
+    if mode not in SNAP_MODES:
+        raise exceptions.ValidationError("Unknown snap mode", mode)
+    if not keyframes:
+        raise exceptions.ValidationError("Empty keyframe index", keyframes)
+
+    before = keyframes[max(bisect_right(keyframes, t) - 1, 0)]
+    after = keyframes[min(bisect_left(keyframes, t), len(keyframes) - 1)]
+    if mode == SNAP_BEFORE:
+        return before
+    if mode == SNAP_AFTER:
+        return after
+    return before if abs(t - before) <= abs(after - t) else after
+
+
+def widen(
+    keyframes: list[float], t1: float, t2: float, end: float | None = None
+) -> tuple[float, float]:
+    """Extend time range to enclosing keyframes (t2 to end past the last one).
+
+    - keyframes (list[float]): sorted keyframe timestamps
+    - t1 (float): range start
+    - t2 (float): range end
+    - end (float | None, optional (None)): media end, t2 kept if unknown
+    """
+
+    start, stop = snap(keyframes, t1, SNAP_BEFORE), snap(keyframes, t2, SNAP_AFTER)
+    if stop < t2:
+        stop = t2 if end is None else max(end, t2)
+    return min(start, t1), stop
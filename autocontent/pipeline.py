@@ -0,0 +1,504 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from . import exceptions, profiling, text_analysis, utils
+from . import subs as subs_module
+from . import video as video_module
+from .state import STATE_CACHED, StateStore
+from .subs import FMT_COMPRESSED, FMT_JSON, Subs
+from .video import FMT_MP4, Video
+
+
+WORKERS_DEFAULT = 4
+"""Default amount of concurrently executed stages/items."""
+
+CLIP_DURATION_MIN = 15.0
+CLIP_DURATION_MAX = 120.0
+"""Auto-segmented clip duration limits (in seconds)."""
+
+TITLE_COUNT_DEFAULT = 5
+"""Amount of titles generated per clip."""
+
+STAGE_VIDEO = "video"
+STAGE_SUBS = "subs"
+STAGE_SEGMENTS = "segments"
+STAGE_CLIPS = "clips"
+STAGE_SILENCE = "silence"
+STAGE_TITLES = "titles"
+STAGES = [
+    STAGE_VIDEO,
+    STAGE_SUBS,
+    STAGE_SEGMENTS,
+    STAGE_CLIPS,
+    STAGE_SILENCE,
+    STAGE_TITLES,
+]
+"""Podcast pipeline stage names."""
+
+STAGE_OPERATION_PREFIX = "stage:"
+"""State store operation name prefix for whole pipeline stages."""
+
+PIPELINE_OPERATION = "pipeline"
+"""State store operation recording stages of the last configured pipeline."""
+
+
+def is_up_to_date(outputs: Iterable[Path], inputs: Iterable[Path] = ()) -> bool:
+    """Checks if all outputs exist and are not older than any of the inputs.
+
+    - outputs (Iterable[Path]): produced files
+    - inputs (Iterable[Path], optional (())): files outputs were derived from
+    """
+
+    outputs = [Path(o) for o in outputs]
+    if not outputs or not all(o.is_file() for o in outputs):
+        return False
+
+    input_times = [Path(i).stat().st_mtime for i in inputs if Path(i).is_file()]
+    if not input_times:
+        return True
+
+    return min(o.stat().st_mtime for o in outputs) >= max(input_times)
+
+
+class Stage:
+    """Pipeline stage (DAG node).
+
+    - name (str): unique stage name
+    - func (callable): stage body, receives dependency results as kwargs
+    - deps (list[str], optional (None)): names of stages this one depends on
+    - outputs (list[Path], optional (None)): files produced by the stage
+    - load (callable, optional (None)): restores stage result from its outputs
+    - params (dict, optional (None)): stage parameters (part of state store key)
+    - json_result (bool, optional (False)): stage result is JSON-serializable
+        and may be restored from state store
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        deps: list[str] | None = None,
+        outputs: list[Path] | None = None,
+        load: Callable[[], Any] | None = None,
+        params: dict | None = None,
+        json_result: bool | None = False,
+    ) -> Stage:
+        self.name = name
+        self.func = func
+        self.deps = list(deps or [])
+        self.outputs = [Path(o) for o in outputs or []]
+        self.load = load
+        self.params = params or {}
+        self.json_result = bool(json_result)
+
+    @property
+    def operation(self) -> str:
+        """State store operation name."""
+
+        return STAGE_OPERATION_PREFIX + self.name
+
+    @property
+    def cacheable(self) -> bool:
+        """Whether stage result can be restored without running it."""
+
+        return bool(self.outputs and self.load) or self.json_result
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name!r}, deps={self.deps})"
+
+
+class Pipeline:
+    """DAG of stages executed concurrently with in-memory result passing.
+
+    Without a state store stages are considered up to date when their output
+    files are newer than their dependencies' outputs; with a store - when
+    a completed run with the same parameters and unchanged input/output files
+    is recorded.
+
+    - stages (list[Stage], optional (None)): stages
+    - store (StateStore, optional (None)): state store for memoization
+    - video_id (str, optional (None)): video ID stage records belong to
+    """
+
+    def __init__(
+        self,
+        stages: list[Stage] | None = None,
+        store: StateStore | None = None,
+        video_id: str | None = None,
+    ) -> Pipeline:
+        if store and not video_id:
+            raise exceptions.ValidationError(msg="video_id is required with store")
+
+        self.store = store
+        self.video_id = video_id
+        self.stages = {}
+        for stage in stages or []:
+            self.add(stage)
+
+    def add(self, stage: Stage) -> Stage:
+        """Register stage."""
+
+        if stage.name in self.stages:
+            raise exceptions.ValidationError(msg=f"Duplicate stage: {stage.name}")
+        self.stages[stage.name] = stage
+
+        return stage
+
+    def order(self) -> list[str]:
+        """Topologically sorted stage names (validates the graph)."""
+
+        for stage in self.stages.values():
+            missing = [d for d in stage.deps if d not in self.stages]
+            if missing:
+                raise exceptions.ValidationError(
+                    msg=f"Stage '{stage.name}' depends on unknown stages: {missing}"
+                )
+
+        ordered, visiting, visited = [], set(), set()
+
+        def visit(name):
+            if name in visited:
+                return
+            if name in visiting:
+                raise exceptions.ValidationError(msg=f"Dependency cycle at '{name}'")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+            ordered.append(name)
+
+        for name in self.stages:
+            visit(name)
+
+        return ordered
+
+    def stage_inputs(self, name: str) -> list[Path]:
+        """Files stage depends on (outputs of its dependencies)."""
+
+        return [o for dep in self.stages[name].deps for o in self.stages[dep].outputs]
+
+    def is_fresh(self, name: str) -> bool:
+        """Checks if stage outputs are up to date with its dependencies' outputs."""
+
+        stage = self.stages[name]
+        if not stage.cacheable:
+            return False
+
+        if self.store:
+            record = self.store.get(self.video_id, stage.operation, stage.params)
+            state = self.store.classify(record, self.stage_inputs(name))
+            return state == STATE_CACHED
+
+        return bool(stage.outputs) and is_up_to_date(
+            stage.outputs, self.stage_inputs(name)
+        )
+
+    def restore(self, name: str) -> Any:
+        """Restore result of an up to date stage."""
+
+        stage = self.stages[name]
+        if stage.load:
+            return stage.load()
+
+        return self.store.get(self.video_id, stage.operation, stage.params)["result"]
+
+    def execute(self, name: str, **kwargs) -> Any:
+        """Run stage body (recording its state, if store is used)."""
+
+        stage = self.stages[name]
+        if not self.store:
+            with profiling.span(name, profiling.CAT_PIPELINE):
+                return stage.func(**kwargs)
+
+        self.store.start(self.video_id, stage.operation, stage.params)
+        try:
+            with profiling.span(name, profiling.CAT_PIPELINE):
+                result = stage.func(**kwargs)
+        except BaseException as e:
+            self.store.fail(self.video_id, stage.operation, stage.params, repr(e))
+            raise
+
+        self.store.finish(
+            self.video_id,
+            stage.operation,
+            stage.params,
+            inputs=self.stage_inputs(name),
+            outputs=stage.outputs,
+            result=result if stage.json_result else None,
+        )
+        return result
+
+    def run(
+        self,
+        workers: int | None = WORKERS_DEFAULT,
+        force: bool | None = False,
+    ) -> dict[str, Any]:
+        """Execute stages, running independent ones concurrently.
+
+        - workers (int | None, optional (WORKERS_DEFAULT)): max concurrent stages
+        - force (bool | None, optional (False)): rerun stages even if up to date
+        """
+
+        order = self.order()
+        if self.store:
+            self.store.finish(self.video_id, PIPELINE_OPERATION, None, result=order)
+        results = {}
+        skipped = set()
+        pending = list(order)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=workers or WORKERS_DEFAULT) as pool:
+            while pending or running:
+                for name in list(pending):
+                    stage = self.stages[name]
+                    if not all(d in results for d in stage.deps):
+                        continue
+                    pending.remove(name)
+
+                    rerun_deps = any(d not in skipped for d in stage.deps)
+                    if not force and not rerun_deps and self.is_fresh(name):
+                        results[name] = self.restore(name)
+                        skipped.add(name)
+                        print(f"[{name}] up to date, skipping")
+                        continue
+
+                    kwargs = {d: results[d] for d in stage.deps}
+                    running[pool.submit(self.execute, name, **kwargs)] = name
+
+                if not running:
+                    if pending:
+                        raise exceptions.Error(f"Unable to schedule stages: {pending}")
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception:
+                        for other in running:
+                            other.cancel()
+                        raise
+                    print(f"[{name}] done")
+
+        return results
+
+    def status(self) -> dict[str, str]:
+        """Current state of every stage (requires state store)."""
+
+        if not self.store:
+            raise exceptions.Error("Stage status requires a state store")
+
+        return {
+            name: self.store.classify(
+                self.store.get(self.video_id, stage.operation, stage.params),
+                self.stage_inputs(name),
+            )
+            for name, stage in self.stages.items()
+        }
+
+
+def recorded_stages(store: StateStore, video_id: str) -> list[str]:
+    """Stages of the pipeline last run for a video (empty if none was run)."""
+
+    record = store.get(video_id, PIPELINE_OPERATION, None)
+    return record["result"] if record else []
+
+
+def map_concurrently(func: Callable, items: list, workers: int | None = None) -> list:
+    """Apply func to every item using a thread pool, preserving order."""
+
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(max_workers=workers or WORKERS_DEFAULT) as pool:
+        return list(pool.map(func, items))
+
+
+def auto_segments(
+    subs: Subs,
+    min_duration: float = CLIP_DURATION_MIN,
+    max_duration: float = CLIP_DURATION_MAX,
+) -> list[tuple[float, float]]:
+    """Derive clip time ranges from transcript topic segments.
+
+    - subs (Subs): source transcript
+    - min_duration (float, optional (CLIP_DURATION_MIN)): drop shorter segments
+    - max_duration (float, optional (CLIP_DURATION_MAX)): drop longer segments
+    """
+
+    ranges = []
+    for segment in text_analysis.segment_subs(subs):
+        first, last = segment.transcript[0], segment.transcript[-1]
+        t1, t2 = first["start"], last["start"] + last["duration"]
+        if min_duration <= t2 - t1 <= max_duration:
+            ranges.append((float(t1), float(t2)))
+
+    return ranges
+
+
+def podcast_pipeline(
+    video_id: str,
+    ranges: list[tuple[float, float]] | None = None,
+    max_resolution: str | None = video_module.RESOLUTION_360,
+    remove_silence: bool | None = True,
+    titles: bool | None = False,
+    workers: int | None = WORKERS_DEFAULT,
+    force: bool | None = False,
+    store: StateStore | None = None,
+    profile: str | None = None,
+) -> Pipeline:
+    """Build podcast -> shorts pipeline.
+
+    video + subs (downloaded concurrently) -> segments -> clips -> silence removal,
+    segments -> titles.
+
+    - video_id (str): youtube video ID
+    - ranges (list[tuple] | None, optional (None)): clip time ranges,
+        derived from transcript topic segmentation when omitted
+    - max_resolution (str | None, optional (RESOLUTION_360)): source resolution
+    - remove_silence (bool | None, optional (True)): cut quiet parts of clips
+    - titles (bool | None, optional (False)): generate titles (paid API usage)
+    - workers (int | None, optional (WORKERS_DEFAULT)): per-stage concurrency
+    - force (bool | None, optional (False)): redo recorded clip/title operations
+    - store (StateStore | None, optional (None)): state store (default location
+        if omitted), finished operations are skipped on reruns
+    - profile (str | None, optional (None)): encode profile (ENCODE_PROFILES)
+    """
+
+    video_id = Video.validate_video_id(video_id)
+    video_file = video_module.DEFAULT_DIR / f"{video_id}.{FMT_MP4}"
+    subs_file = subs_module.DEFAULT_DIR / f"{video_id}.{FMT_JSON}"
+    titles_file = subs_module.DEFAULT_DIR / f"{video_id}-titles.{FMT_JSON}"
+    ranges = [tuple(map(utils.parse_time_value, r)) for r in ranges or []]
+    force = False if force is None else force
+    store = store or StateStore()
+    profile = Video.resolve_profile(profile)
+
+    def clip_file(t1, t2):
+        return video_module.DEFAULT_DIR / f"{video_id}-clip-{t1}-{t2}.{FMT_MP4}"
+
+    def fetch_video():
+        return Video(
+            video_id=video_id,
+            download_kwargs={
+                "max_resolution": max_resolution,
+                "output_file": video_file,
+                "force": True,
+            },
+        )
+
+    def fetch_subs():
+        subs = Subs(video_id=video_id)
+        subs.save(subs_file, fmt=FMT_JSON, force=True)
+        return subs
+
+    def find_segments(subs):
+        return ranges or auto_segments(subs)
+
+    def render_clips(video, segments):
+        def render(segment):
+            t1, t2 = segment
+            target = clip_file(t1, t2)
+            return store.memoize(
+                video_id,
+                "clip",
+                {"t1": t1, "t2": t2, "profile": profile},
+                lambda: video.clip(
+                    t1, t2, output_file=target, force=True, profile=profile
+                ),
+                inputs=[video.filepath],
+                outputs=[target],
+                load=lambda: Video(filepath=target),
+                force=force,
+            )
+
+        return map_concurrently(render, segments, workers=workers)
+
+    def cut_silence(clips):
+        def clean(clip):
+            target = clip.filepath.with_name(f"{clip.filepath.stem}-cleaned.{FMT_MP4}")
+            return store.memoize(
+                video_id,
+                "cut_silence",
+                {"source": clip.filepath.name, "profile": profile},
+                lambda: clip.cut_silence(
+                    output_file=target, force=True, profile=profile
+                ),
+                inputs=[clip.filepath],
+                outputs=[target],
+                load=lambda: Video(filepath=target),
+                force=force,
+            )
+
+        return map_concurrently(clean, clips, workers=workers)
+
+    def suggest_titles(subs, segments):
+        def suggest(segment):
+            def request():
+                chunk = subs.cut(*segment)
+                context = Subs.format_subs(chunk.transcript, FMT_COMPRESSED)
+                return text_analysis.suggest_titles(
+                    context, title_count=TITLE_COUNT_DEFAULT
+                )
+
+            return store.memoize(
+                video_id,
+                "titles",
+                {"t1": segment[0], "t2": segment[1], "count": TITLE_COUNT_DEFAULT},
+                request,
+                inputs=[subs_file],
+                force=force,
+            )
+
+        result = dict(
+            zip(
+                [f"{t1}-{t2}" for t1, t2 in segments],
+                map_concurrently(suggest, segments, workers=workers),
+            )
+        )
+        utils.check_existing_file(titles_file, force=True)
+        utils.ensure_folder(titles_file)
+        utils.write_to_file(titles_file, json.dumps(result, indent=2))
+        return result
+
+    pipeline = Pipeline(
+        [
+            Stage(
+                STAGE_VIDEO,
+                fetch_video,
+                outputs=[video_file],
+                load=lambda: Video(filepath=video_file),
+                params={"max_resolution": max_resolution},
+            ),
+            Stage(
+                STAGE_SUBS,
+                fetch_subs,
+                outputs=[subs_file],
+                load=lambda: Subs(filepath=subs_file),
+            ),
+            Stage(
+                STAGE_SEGMENTS,
+                find_segments,
+                deps=[STAGE_SUBS],
+                params={"ranges": ranges},
+                json_result=True,
+            ),
+            Stage(STAGE_CLIPS, render_clips, deps=[STAGE_VIDEO, STAGE_SEGMENTS]),
+        ],
+        store=store,
+        video_id=video_id,
+    )
+    if remove_silence:
+        pipeline.add(Stage(STAGE_SILENCE, cut_silence, deps=[STAGE_CLIPS]))
+    if titles:
+        pipeline.add(
+            Stage(STAGE_TITLES, suggest_titles, deps=[STAGE_SUBS, STAGE_SEGMENTS])
+        )
+
+    return pipeline
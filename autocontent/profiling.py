@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from rich.console import Console
+from rich.table import Table
+
+from . import utils
+
+
+CAT_DOWNLOAD = "download"
+CAT_AUDIO = "audio"
+CAT_VIDEO = "video"
+CAT_ENCODE = "encode"
+CAT_TRANSCRIPT = "transcript"
+CAT_TEXT = "text"
+CAT_LLM = "llm"
+CAT_PIPELINE = "pipeline"
+"""Span categories."""
+
+DEFAULT_TRACE_PATH = utils.ROOT_DIR / "trace.json"
+"""Default Chrome trace output location."""
+
+_profiler = None
+"""Active profiler (None - instrumentation disabled)."""
+
+
+class Profiler:
+    """Collects timing spans, exports them in Chrome trace format."""
+
+    def __init__(self) -> Profiler:
+        self.origin = time.perf_counter()
+        self.events = []
+        self.lock = threading.Lock()
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        args: dict | None = None,
+    ) -> None:
+        """Store finished span (perf_counter timestamps)."""
+
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args or {},
+        }
+        with self.lock:
+            self.events.append(event)
+
+    def trace(self) -> dict:
+        """Chrome trace (chrome://tracing, Perfetto) JSON object."""
+
+        with self.lock:
+            events = list(self.events)
+
+        threads = {e["tid"] for e in events}
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": f"thread-{i}"},
+            }
+            for i, tid in enumerate(sorted(threads))
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def save(self, path: Path | str) -> Path:
+        """Write Chrome trace to file."""
+
+        path = Path(path).expanduser().absolute()
+        utils.ensure_folder(path)
+        with open(path, "w") as f:
+            json.dump(self.trace(), f, default=str)
+
+        return path
+
+    def summary(self) -> list[dict]:
+        """Aggregated span timings (seconds), slowest first."""
+
+        totals = {}
+        with self.lock:
+            for e in self.events:
+                key = (e["cat"], e["name"])
+                stat = totals.setdefault(key, {"count": 0, "total": 0.0, "max": 0.0})
+                stat["count"] += 1
+                stat["total"] += e["dur"] / 1e6
+                stat["max"] = max(stat["max"], e["dur"] / 1e6)
+
+        rows = [
+            {
+                "category": cat,
+                "name": name,
+                **stat,
+                "mean": stat["total"] / stat["count"],
+            }
+            for (cat, name), stat in totals.items()
+        ]
+        return sorted(rows, key=lambda r: -r["total"])
+
+    def print_summary(self, console: Console | None = None) -> None:
+        """Render summary table."""
+
+        table = Table(title="Profile")
+        for column in ("category", "span", "calls", "total, s", "mean, s", "max, s"):
+            table.add_column(column, justify="left" if column == "span" else "right")
+        for row in self.summary():
+            table.add_row(
+                row["category"],
+                row["name"],
+                str(row["count"]),
+                f"{row['total']:.3f}",
+                f"{row['mean']:.3f}",
+                f"{row['max']:.3f}",
+            )
+
+        (console or Console()).print(table)
+
+
+class Span:
+    """Timing span context manager (active profiler only)."""
+
+    __slots__ = ("profiler", "name", "category", "args", "start")
+
+    def __init__(self, profiler: Profiler, name: str, category: str, args: dict):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> Span:
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *_) -> None:
+        if exc_type:
+            self.args["error"] = exc_type.__name__
+        self.profiler.record(
+            self.name, self.category, self.start, time.perf_counter(), self.args
+        )
+
+
+class NullSpan:
+    """No-op span used when profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> NullSpan:
+        return self
+
+    def __exit__(self, *_) -> None:
+        pass
+
+
+NULL_SPAN = NullSpan()
+"""Shared no-op span instance."""
+
+
+def enable() -> Profiler:
+    """Start collecting spans (replaces active profiler)."""
+
+    global _profiler
+    _profiler = Profiler()
+    return _profiler
+
+
+def disable() -> Profiler | None:
+    """Stop collecting spans, outputs the profiler that was active."""
+
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler
+
+
+def active() -> Profiler | None:
+    """Currently active profiler."""
+
+    return _profiler
+
+
+def span(name: str, category: str = CAT_PIPELINE, **args) -> Span | NullSpan:
+    """Time a block of code.
+
+    - name (str): span name
+    - category (str, optional (CAT_PIPELINE)): span category
+    - args: extra details stored along with the span
+    """
+
+    if _profiler is None:
+        return NULL_SPAN
+    return Span(_profiler, name, category, args)
+
+
+def timed(
+    name: str | None = None, category: str = CAT_PIPELINE
+) -> Callable[[Callable], Callable]:
+    """Decorator timing every call of a function.
+
+    - name (str | None, optional (None)): span name (defaults to qualified name)
+    - category (str, optional (CAT_PIPELINE)): span category
+    """
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            if _profiler is None:
+                return func(*args, **kwargs)
+            with Span(_profiler, span_name, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
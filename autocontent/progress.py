@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, TextIO
+
+from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    TextColumn,
+    TimeRemainingColumn,
+    TransferSpeedColumn,
+)
+
+
+EVENT_START = "start"
+EVENT_PROGRESS = "progress"
+EVENT_STAGE = "stage"
+EVENT_DONE = "done"
+EVENT_ERROR = "error"
+"""Progress event kinds."""
+
+RENDER_BARS = "bars"
+RENDER_JSON = "json"
+RENDER_OFF = "off"
+RENDER_MODES = [RENDER_BARS, RENDER_JSON, RENDER_OFF]
+"""Progress output modes (terminal bars, JSON lines, none)."""
+
+STAGE_DOWNLOAD = "download"
+"""Initial task stage (postprocessing stages are named by the downloader)."""
+
+SPEED_SMOOTHING = 0.3
+"""Weight of the latest sample in the (exponential moving average) speed."""
+
+JSON_INTERVAL = 0.5
+"""Minimum interval between JSON-lines progress events of a task (seconds)."""
+
+_tracker = None
+"""Active tracker (None - progress reporting disabled)."""
+
+
+class Task:
+    """Progress of a single download (bytes, speed, ETA, stage timings).
+
+    Downloads made of several files (separate video/audio streams) count bytes
+    per file, so totals add up across them.
+    """
+
+    def __init__(self, key: str, title: str | None = None) -> Task:
+        self.key = key
+        self.title = title or key
+        self.files = {}  # file name -> [downloaded bytes, total bytes | None]
+        self.speed = None
+        self.started = self.updated = time.monotonic()
+        self.stage, self.stage_started = STAGE_DOWNLOAD, self.started
+        self.stages = {}  # stage name -> seconds spent
+        self.error = None
+
+    @property
+    def done(self) -> int:
+        return sum(done for done, _ in self.files.values())
+
+    @property
+    def total(self) -> int | None:
+        totals = [total for _, total in self.files.values()]
+        return None if not totals or None in totals else sum(totals)
+
+    @property
+    def eta(self) -> float | None:
+        if not self.speed or self.total is None:
+            return None
+        return max(self.total - self.done, 0) / self.speed
+
+    def update(
+        self,
+        done: int,
+        total: int | None = None,
+        file: str | None = None,
+        speed: float | None = None,
+    ) -> None:
+        """Record downloaded byte count of a file (speed measured if omitted)."""
+
+        now, before = time.monotonic(), self.done
+        self.files[file or self.key] = [done, total]
+        if speed is None and now > self.updated:
+            speed = max(self.done - before, 0) / (now - self.updated)
+            if self.speed is not None:
+                speed = SPEED_SMOOTHING * speed + (1 - SPEED_SMOOTHING) * self.speed
+        if speed is not None:
+            self.speed = speed
+        self.updated = now
+
+    def enter(self, stage: str) -> None:
+        """Switch to another stage (time spent in the previous one is stored)."""
+
+        now = time.monotonic()
+        self.stages[self.stage] = (
+            self.stages.get(self.stage, 0) + now - self.stage_started
+        )
+        self.stage, self.stage_started = stage, now
+
+    def event(self, kind: str) -> dict:
+        """Machine-readable task snapshot."""
+
+        event = {
+            "event": kind,
+            "task": self.key,
+            "title": self.title,
+            "stage": self.stage,
+            "bytes": self.done,
+            "total": self.total,
+            "speed": self.speed,
+            "eta": self.eta,
+            "elapsed": time.monotonic() - self.started,
+            "time": time.time(),
+        }
+        if kind in (EVENT_DONE, EVENT_ERROR):
+            event["stages"] = dict(self.stages)
+        if kind == EVENT_ERROR:
+            event["error"] = self.error
+        return event
+
+
+class Tracker:
+    """Aggregates progress of concurrent tasks, forwards events to listeners.
+
+    - listeners (list[callable] | None, optional (None)): event (dict) consumers
+    """
+
+    def __init__(self, listeners: list[Callable] | None = None) -> Tracker:
+        self.listeners = list(listeners or [])
+        self.tasks = {}
+        self.lock = threading.Lock()
+
+    def emit(self, task: Task, kind: str) -> dict:
+        event = task.event(kind)
+        for listener in self.listeners:
+            listener(event)
+        return event
+
+    def start(self, key: str, title: str | None = None) -> Task:
+        """Register (or restart) a task."""
+
+        with self.lock:
+            task = self.tasks[key] = Task(key, title)
+            self.emit(task, EVENT_START)
+        return task
+
+    def update(self, key: str, done: int, total: int | None = None, **kwargs):
+        """Record task progress (see Task.update)."""
+
+        with self.lock:
+            task = self.tasks[key]
+            task.update(done, total, **kwargs)
+            self.emit(task, EVENT_PROGRESS)
+
+    def stage(self, key: str, stage: str) -> None:
+        """Move task to another stage (no-op if already in it)."""
+
+        with self.lock:
+            task = self.tasks[key]
+            if task.stage != stage:
+                task.enter(stage)
+                self.emit(task, EVENT_STAGE)
+
+    def finish(self, key: str, error: BaseException | str | None = None) -> dict:
+        """Close task, outputs its final event (with stage timings)."""
+
+        with self.lock:
+            task = self.tasks[key]
+            task.enter(None)
+            task.stages.pop(None, None)
+            if error is not None:
+                task.error = str(error)
+            return self.emit(task, EVENT_ERROR if error is not None else EVENT_DONE)
+
+    def totals(self) -> dict:
+        """Aggregate over all tasks (bytes, summed speed of running ones, ETA)."""
+
+        with self.lock:
+            tasks = list(self.tasks.values())
+
+        active = [task for task in tasks if task.stage is not None]
+        speed = sum(task.speed or 0 for task in active)
+        remaining = [
+            task.total - task.done for task in active if task.total is not None
+        ]
+        return {
+            "tasks": len(tasks),
+            "active": len(active),
+            "failed": sum(task.error is not None for task in tasks),
+            "bytes": sum(task.done for task in tasks),
+            "speed": speed,
+            "eta": sum(remaining) / speed if speed and remaining else None,
+        }
+
+    def ytdlp_options(self, key: str, options: dict) -> dict:
+        """yt-dlp options with hooks reporting into a task (existing hooks kept)."""
+
+        return {
+            **options,
+            "progress_hooks": [
+                *options.get("progress_hooks", []),
+                self.ytdlp_hook(key),
+            ],
+            "postprocessor_hooks": [
+                *options.get("postprocessor_hooks", []),
+                self.ytdlp_postprocessor_hook(key),
+            ],
+        }
+
+    def ytdlp_hook(self, key: str) -> Callable[[dict], None]:
+        """yt-dlp progress hook reporting into a task."""
+
+        def hook(update: dict) -> None:
+            if update["status"] not in ("downloading", "finished"):
+                return
+            done = update.get("downloaded_bytes") or 0
+            total = update.get("total_bytes") or update.get("total_bytes_estimate")
+            if update["status"] == "finished":
+                total = total or done
+            self.update(
+                key,
+                done,
+                None if total is None else int(total),
+                file=update.get("filename"),
+                speed=update.get("speed"),
+            )
+
+        return hook
+
+    def ytdlp_postprocessor_hook(self, key: str) -> Callable[[dict], None]:
+        """yt-dlp postprocessor hook moving a task through postprocessing stages."""
+
+        def hook(update: dict) -> None:
+            if update["status"] == "started":
+                self.stage(key, update["postprocessor"])
+
+        return hook
+
+
+class JsonLinesRenderer:
+    """Writes events as JSON lines (progress events throttled per task).
+
+    - stream (TextIO | None, optional (sys.stderr)): output stream
+    - interval (float, optional (JSON_INTERVAL)): progress event interval
+    """
+
+    def __init__(
+        self, stream: TextIO | None = None, interval: float = JSON_INTERVAL
+    ) -> JsonLinesRenderer:
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self.last = {}  # task -> last progress event time
+
+    def __call__(self, event: dict) -> None:
+        if event["event"] == EVENT_PROGRESS:
+            now = time.monotonic()
+            if now - self.last.get(event["task"], -self.interval) < self.interval:
+                return
+            self.last[event["task"]] = now
+
+        self.stream.write(json.dumps(event) + "\n")
+        self.stream.flush()
+
+
+class RichRenderer:
+    """Terminal multi-bar display (a bar per task), shown on the first event.
+
+    - console (Console | None, optional (None)): rich console (stderr default)
+    """
+
+    def __init__(self, console: Console | None = None) -> RichRenderer:
+        self.progress = Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+            TimeRemainingColumn(),
+            console=console or Console(stderr=True),
+        )
+        self.bars = {}  # task -> rich task ID
+        self.started = False
+
+    def __enter__(self) -> RichRenderer:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __call__(self, event: dict) -> None:
+        if not self.started:
+            self.progress.start()
+            self.started = True
+
+        key = event["task"]
+        if event["event"] == EVENT_START or key not in self.bars:
+            self.bars[key] = self.progress.add_task(event["title"], total=None)
+
+        self.progress.update(
+            self.bars[key],
+            completed=event["bytes"],
+            total=event["total"],
+            description=f"{event['title']} ({event['stage'] or event['event']})",
+        )
+
+    def close(self) -> None:
+        """Stop the display (bars stay on screen)."""
+
+        if self.started:
+            self.progress.stop()
+            self.started = False
+
+
+def enable(listeners: list[Callable] | None = None) -> Tracker:
+    """Start tracking progress (replaces active tracker)."""
+
+    global _tracker
+    _tracker = Tracker(listeners)
+    return _tracker
+
+
+def disable() -> Tracker | None:
+    """Stop tracking progress, outputs the tracker that was active."""
+
+    global _tracker
+    tracker, _tracker = _tracker, None
+    return tracker
+
+
+def active() -> Tracker | None:
+    """Currently active tracker."""
+
+    return _tracker
+
+
+@contextmanager
+def track(key: str, title: str | None = None) -> Iterator[Tracker | None]:
+    """Report a block as a task of the active tracker (None if disabled).
+
+    - key (str): task key (unique among concurrent tasks)
+    - title (str | None, optional (key)): displayed task name
+    """
+
+    tracker = _tracker
+    if tracker is None:
+        yield None
+        return
+
+    tracker.start(key, title)
+    try:
+        yield tracker
+    except BaseException as e:
+        tracker.finish(key, error=e)
+        raise
+    tracker.finish(key)
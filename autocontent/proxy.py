@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from . import exceptions, ffmpeg, profiling, utils
+from .profiling import CAT_ENCODE
+
+
+PROXY_HEIGHT = 240
+PROXY_PRESET = "ultrafast"
+PROXY_CRF = 32
+PROXY_AUDIO_BITRATE = "64k"
+"""Proxy encode settings (low resolution, low bitrate)."""
+
+PROXY_DIR_NAME = "proxy"
+"""Subdirectory (of the video directory) for outputs rendered from proxies."""
+
+SIDECAR_PROXY = "proxy.mp4"
+"""Sidecar file kind for proxy media."""
+
+
+def proxy_path(source: Path | str) -> Path:
+    """Proxy file location (next to the source)."""
+
+    return utils.sidecar_path(source, SIDECAR_PROXY)
+
+
+def _meta_path(source: Path | str) -> Path:
+    return utils.sidecar_path(source, f"{SIDECAR_PROXY}.json")
+
+
+@profiling.timed("make_proxy", CAT_ENCODE)
+def make_proxy(
+    source: Path | str, height: int = PROXY_HEIGHT, force: bool | None = False
+) -> Path:
+    """Encode (or reuse cached) low resolution proxy of a video file.
+
+    - source (Path | str): video file
+    - height (int, optional (PROXY_HEIGHT)): proxy frame height
+    - force (bool | None, optional (False)): encode even if cached
+    """
+
+    source = Path(source).absolute()
+    target, meta_file = proxy_path(source), _meta_path(source)
+    meta = {"height": height, "source": utils.file_signature(source)}
+
+    if not force and target.is_file() and meta_file.is_file():
+        with open(meta_file) as f:
+            if json.load(f) == meta:
+                return target
+
+    fd, partial = tempfile.mkstemp(
+        prefix=f"{target.name}.", suffix=".part", dir=target.parent
+    )
+    os.close(fd)
+    partial = Path(partial)
+    try:
+        ffmpeg.run(
+            "-y",
+            "-i",
+            str(source),
+            "-vf",
+            f"scale=-2:{height}",
+            "-c:v",
+            "libx264",
+            "-preset",
+            PROXY_PRESET,
+            "-crf",
+            str(PROXY_CRF),
+            "-c:a",
+            "aac",
+            "-b:a",
+            PROXY_AUDIO_BITRATE,
+            "-f",
+            "mp4",
+            str(partial),
+        )
+        partial.replace(target)
+    finally:
+        partial.unlink(missing_ok=True)
+
+    with open(meta_file, "w") as f:
+        json.dump(meta, f)
+
+    return target
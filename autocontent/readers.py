@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import atexit
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from moviepy.editor import VideoFileClip
+
+from . import utils
+from .utils import config
+
+
+READERS_MAX_DEFAULT = 4
+CONFIG_READERS_MAX = "readers_max"
+"""Open reader limit (each reader holds ffmpeg processes and file descriptors)."""
+
+
+class ReaderPool:
+    """Bounded pool of open VideoFileClip readers, reused per source file.
+
+    Readers are leased exclusively (a source leased elsewhere gets a temporary
+    reader, closed on release). Pooled and temporary readers count against the
+    limit: least recently used idle readers are closed to make room, with every
+    reader leased a lease waits for a release. A changed file (size/mtime) gets
+    a fresh reader.
+
+    - max_open (int | None, optional (config or READERS_MAX_DEFAULT)): limit
+    """
+
+    def __init__(self, max_open: int | None = None) -> ReaderPool:
+        self.max_open = max_open or config.get(CONFIG_READERS_MAX, READERS_MAX_DEFAULT)
+        self.hits = self.misses = self.evictions = 0
+        self._readers = OrderedDict()  # (path, size, mtime) -> VideoFileClip
+        self._leased = set()
+        self._open = 0  # pooled, temporary and opening readers
+        self._lock = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self._readers)
+
+    def __enter__(self) -> ReaderPool:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def _key(path: Path | str) -> tuple:
+        path = Path(path).absolute()
+        signature = utils.file_signature(path)
+        return str(path), signature["size"], signature["mtime"]
+
+    @contextmanager
+    def reader(self, path: Path | str) -> Iterator[VideoFileClip]:
+        """Lease an open reader of a video file.
+
+        Derived clips (subclip, fx, ...) share the reader, use them within the
+        block only. Blocks while max_open readers are leased (nested leases in
+        one thread must stay below the limit).
+        """
+
+        key, clip, temporary = self._key(path), None, None
+        with self._lock:
+            while True:
+                if key in self._readers and key not in self._leased:
+                    self.hits += 1
+                    clip = self._readers[key]
+                    self._readers.move_to_end(key)
+                    self._leased.add(key)
+                    break
+                if self._evict(self.max_open - 1):
+                    self.misses += 1
+                    self._open += 1
+                    break
+                self._lock.wait()
+
+        if clip is None:
+            try:
+                opened = VideoFileClip(key[0])
+            except BaseException:
+                self._release()
+                raise
+            with self._lock:
+                if key in self._readers:
+                    temporary = clip = opened
+                else:
+                    self._drop_stale(key)
+                    self._readers[key] = clip = opened
+                    self._leased.add(key)
+
+        try:
+            yield clip
+        finally:
+            if temporary is not None:
+                temporary.close()
+                self._release()
+            else:
+                with self._lock:
+                    self._leased.discard(key)
+                    self._lock.notify_all()
+
+    def _release(self) -> None:
+        with self._lock:
+            self._open -= 1
+            self._lock.notify_all()
+
+    def _drop_stale(self, key: tuple) -> None:
+        for other in list(self._readers):
+            if other[0] == key[0] and other not in self._leased:
+                self._readers.pop(other).close()
+                self._open -= 1
+
+    def _evict(self, limit: int) -> bool:
+        """Close least recently used idle readers until at most limit are open,
+        outputs whether it succeeded."""
+
+        for key in list(self._readers):
+            if self._open <= limit:
+                break
+            if key not in self._leased:
+                self._readers.pop(key).close()
+                self._open -= 1
+                self.evictions += 1
+        return self._open <= limit
+
+    def close(self) -> None:
+        """Close all pooled readers."""
+
+        with self._lock:
+            while self._readers:
+                self._readers.popitem(last=False)[1].close()
+                self._open -= 1
+            self._leased.clear()
+            self._lock.notify_all()
+
+
+POOL = ReaderPool()
+"""Shared reader pool (closed on interpreter exit)."""
+
+atexit.register(POOL.close)
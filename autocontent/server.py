@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import inspect
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+from . import exceptions, profiling, readers
+from .jobs import CONCURRENCY_DEFAULT, HANDLERS, JOB_RESOURCES, RESOURCE_CPU
+from .profiling import CAT_PIPELINE
+from .subs import FMT_TXT, Subs
+
+
+HOST_DEFAULT = "127.0.0.1"
+PORT_DEFAULT = 8765
+"""Default listening address (local only)."""
+
+OP_CHUNK = "chunk"
+"""Subtitle chunk operation (not a queue job kind)."""
+
+CLIENT_ERRORS = (
+    exceptions.ValidationError,
+    exceptions.InvalidFileName,
+    exceptions.InvalidFilePath,
+    FileNotFoundError,
+)
+"""Errors caused by request parameters (400 Bad Request)."""
+
+
+def handle_chunk(
+    source: str,
+    t1: str,
+    t2: str,
+    fmt: str | None = FMT_TXT,
+    shift: bool | None = False,
+    output_file: str | None = None,
+    force: bool | None = False,
+) -> dict:
+    target = Subs.save_chunk(source, t1, t2, fmt, shift, output_file, force)
+    return {"filepath": str(target)}
+
+
+OPERATIONS = {**HANDLERS, OP_CHUNK: handle_chunk}
+OPERATION_RESOURCES = {**JOB_RESOURCES, OP_CHUNK: RESOURCE_CPU}
+"""Served operations (POST /<name> with JSON object of handler kwargs)."""
+
+
+class Server(ThreadingHTTPServer):
+    """Long-lived local JSON API running toolset operations in-process.
+
+    Modules stay imported, video readers (readers.POOL) and file caches stay
+    warm between requests. Requests beyond the concurrency of their resource
+    class wait for a free slot.
+
+    - address (tuple[str, int], optional ((HOST_DEFAULT, PORT_DEFAULT))): listen
+        address (port 0 picks a free one)
+    - concurrency (dict[str, int] | None, optional (CONCURRENCY_DEFAULT)):
+        operations running at once per resource class
+    - handlers (dict[str, callable] | None, optional (OPERATIONS)): operations
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int] = (HOST_DEFAULT, PORT_DEFAULT),
+        concurrency: dict[str, int] | None = None,
+        handlers: dict[str, Callable[..., Any]] | None = None,
+    ) -> Server:
+        super().__init__(address, RequestHandler)
+        self.handlers = handlers or OPERATIONS
+        self.slots = {
+            resource: threading.BoundedSemaphore(limit)
+            for resource, limit in {
+                **CONCURRENCY_DEFAULT,
+                **(concurrency or {}),
+            }.items()
+        }
+        self.started = time.time()
+        self.counts = {"requests": 0, "failed": 0, "queued": 0, "running": 0}
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, **changes: int) -> None:
+        with self.lock:
+            for name, change in changes.items():
+                self.counts[name] += change
+
+    def execute(self, operation: str, params: dict) -> Any:
+        """Run operation once a slot of its resource class is free.
+
+        Parameters not matching the handler signature raise ValidationError.
+        """
+
+        handler = self.handlers[operation]
+        self._count(requests=1)
+        try:
+            inspect.signature(handler).bind(**params)
+        except TypeError as e:
+            self._count(failed=1)
+            raise exceptions.ValidationError(f"Invalid parameters: {e}", params)
+
+        self._count(queued=1)
+        with self.slots[OPERATION_RESOURCES.get(operation, RESOURCE_CPU)]:
+            self._count(queued=-1, running=1)
+            try:
+                with profiling.span(f"serve:{operation}", CAT_PIPELINE):
+                    return handler(**params)
+            except BaseException:
+                self._count(failed=1)
+                raise
+            finally:
+                self._count(running=-1)
+
+    def status(self) -> dict:
+        """Request counters, uptime and reader pool usage."""
+
+        with self.lock:
+            counts = dict(self.counts)
+        pool = readers.POOL
+        return {
+            **counts,
+            "uptime": time.time() - self.started,
+            "operations": sorted(self.handlers),
+            "readers": {
+                "open": len(pool),
+                "hits": pool.hits,
+                "misses": pool.misses,
+                "evictions": pool.evictions,
+            },
+        }
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """JSON request handler (GET /status, POST /<operation>)."""
+
+    server: Server
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def respond(self, status: HTTPStatus, body: dict) -> None:
+        data = json.dumps(body, default=str).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") == "/status":
+            self.respond(HTTPStatus.OK, self.server.status())
+        else:
+            self.respond(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        operation = self.path.strip("/")
+        if operation not in self.server.handlers:
+            self.respond(
+                HTTPStatus.NOT_FOUND, {"error": f"Unknown operation {operation}"}
+            )
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            params = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(params, dict):
+                raise exceptions.ValidationError("JSON object expected", params)
+            result = self.server.execute(operation, params)
+        except (json.JSONDecodeError, *CLIENT_ERRORS) as e:
+            self.respond(HTTPStatus.BAD_REQUEST, {"error": f"{type(e).__name__}: {e}"})
+        except Exception as e:
+            self.respond(
+                HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(e).__name__}: {e}"}
+            )
+        else:
+            self.respond(HTTPStatus.OK, {"result": result})
+
+
+def start(
+    address: tuple[str, int] = (HOST_DEFAULT, PORT_DEFAULT), **server_kwargs
+) -> Server:
+    """Serve in a background (daemon) thread, outputs the running server."""
+
+    server = Server(address, **server_kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def request(
+    url: str, operation: str, params: dict | None = None, timeout: float | None = None
+) -> Any:
+    """Call an operation of a running server, outputs its result.
+
+    - url (str): server URL (Server.url)
+    - operation (str): operation name
+    - params (dict | None, optional (None)): operation kwargs
+    - timeout (float | None, optional (None)): seconds to wait for the response
+    """
+
+    call = urllib.request.Request(
+        f"{url}/{operation}",
+        data=json.dumps(params or {}).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(call, timeout=timeout) as response:
+            return json.load(response)["result"]
+    except urllib.error.HTTPError as e:
+        raise exceptions.Error(
+            f"{operation} failed ({e.code}): {json.load(e)['error']}"
+        )
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from . import utils
+
+
+DEFAULT_DB_PATH = utils.ROOT_DIR / "state.db"
+"""Default pipeline state database location."""
+
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+"""Recorded operation statuses."""
+
+STATE_CACHED = "cached"
+STATE_STALE = "stale"
+STATE_PENDING = "pending"
+STATE_FAILED = "failed"
+"""Operation states (as reported by status)."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS operations (
+    video_id TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    key TEXT NOT NULL,
+    params TEXT NOT NULL,
+    inputs TEXT NOT NULL DEFAULT '[]',
+    outputs TEXT NOT NULL DEFAULT '[]',
+    result TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    updated REAL NOT NULL,
+    PRIMARY KEY (video_id, operation, key)
+)
+"""
+"""State database schema."""
+
+
+def fingerprint(path: Path | str) -> dict:
+    """File fingerprint (path, size, modification time)."""
+
+    path = Path(path).absolute()
+    if not path.is_file():
+        return {"path": str(path), "size": None, "mtime": None}
+
+    stat = path.stat()
+    return {"path": str(path), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def params_key(params: dict | None) -> str:
+    """Stable hash of operation parameters."""
+
+    dump = json.dumps(params or {}, sort_keys=True, default=str)
+    return hashlib.sha1(dump.encode()).hexdigest()[:16]
+
+
+class StateStore:
+    """SQLite-backed record of performed operations (for memoization/resuming).
+
+    - path (Path | str | None, optional (DEFAULT_DB_PATH)): database location
+    """
+
+    def __init__(self, path: Path | str | None = None) -> StateStore:
+        self.path = Path(path or DEFAULT_DB_PATH).absolute()
+        self.lock = threading.Lock()
+        utils.ensure_folder(self.path)
+        self.execute(SCHEMA)
+
+    def execute(self, sql: str, args: Iterable = ()) -> list[sqlite3.Row]:
+        """Execute a single statement, returns fetched rows."""
+
+        with self.lock, closing(sqlite3.connect(self.path)) as conn:
+            conn.row_factory = sqlite3.Row
+            with conn:
+                return conn.execute(sql, tuple(args)).fetchall()
+
+    def get(self, video_id: str, operation: str, params: dict | None) -> dict | None:
+        """Fetch operation record."""
+
+        rows = self.execute(
+            "SELECT * FROM operations WHERE video_id=? AND operation=? AND key=?",
+            (video_id, operation, params_key(params)),
+        )
+        return self._to_record(rows[0]) if rows else None
+
+    def records(self, video_id: str | None = None) -> list[dict]:
+        """All operation records (of a video)."""
+
+        if video_id:
+            rows = self.execute(
+                "SELECT * FROM operations WHERE video_id=? ORDER BY updated",
+                (video_id,),
+            )
+        else:
+            rows = self.execute("SELECT * FROM operations ORDER BY video_id, updated")
+
+        return [self._to_record(row) for row in rows]
+
+    def video_ids(self) -> list[str]:
+        """IDs of videos with recorded operations."""
+
+        rows = self.execute("SELECT DISTINCT video_id FROM operations ORDER BY 1")
+        return [row["video_id"] for row in rows]
+
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> dict:
+        record = dict(row)
+        for field in ("params", "inputs", "outputs", "result"):
+            if record[field] is not None:
+                record[field] = json.loads(record[field])
+        return record
+
+    def _save(
+        self,
+        video_id: str,
+        operation: str,
+        params: dict | None,
+        status: str,
+        inputs: Iterable[Path] = (),
+        outputs: Iterable[Path] = (),
+        result: Any = None,
+        error: str | None = None,
+    ) -> None:
+        self.execute(
+            "INSERT OR REPLACE INTO operations "
+            "(video_id, operation, key, params, inputs, outputs, result, status, "
+            "error, updated) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                video_id,
+                operation,
+                params_key(params),
+                json.dumps(params or {}, sort_keys=True, default=str),
+                json.dumps([fingerprint(i) for i in inputs]),
+                json.dumps([fingerprint(o) for o in outputs]),
+                None if result is None else json.dumps(result, default=str),
+                status,
+                error,
+                time.time(),
+            ),
+        )
+
+    def start(self, video_id: str, operation: str, params: dict | None) -> None:
+        """Record operation start."""
+
+        self._save(video_id, operation, params, STATUS_RUNNING)
+
+    def finish(
+        self,
+        video_id: str,
+        operation: str,
+        params: dict | None,
+        inputs: Iterable[Path] = (),
+        outputs: Iterable[Path] = (),
+        result: Any = None,
+    ) -> None:
+        """Record successful operation along with input/output fingerprints."""
+
+        self._save(
+            video_id, operation, params, STATUS_DONE, inputs, outputs, result=result
+        )
+
+    def fail(
+        self, video_id: str, operation: str, params: dict | None, error: str
+    ) -> None:
+        """Record failed operation."""
+
+        self._save(video_id, operation, params, STATUS_FAILED, error=error)
+
+    def forget(self, video_id: str, operation: str | None = None) -> None:
+        """Delete records of a video (or a specific operation of it)."""
+
+        if operation:
+            self.execute(
+                "DELETE FROM operations WHERE video_id=? AND operation=?",
+                (video_id, operation),
+            )
+        else:
+            self.execute("DELETE FROM operations WHERE video_id=?", (video_id,))
+
+    @staticmethod
+    def classify(record: dict | None, inputs: Iterable[Path] | None = None) -> str:
+        """Decide whether recorded operation may be reused.
+
+        - record (dict | None): operation record
+        - inputs (Iterable[Path] | None, optional (None)): current operation inputs
+            (defaults to recorded ones)
+        """
+
+        if not record or record["status"] == STATUS_RUNNING:
+            return STATE_PENDING
+        if record["status"] == STATUS_FAILED:
+            return STATE_FAILED
+
+        recorded_inputs = record["inputs"]
+        if inputs is not None:
+            current = [fingerprint(i) for i in inputs]
+            if current != recorded_inputs:
+                return STATE_STALE
+
+        for fp in recorded_inputs + record["outputs"]:
+            if fingerprint(fp["path"]) != fp:
+                return STATE_STALE
+
+        return STATE_CACHED
+
+    def memoize(
+        self,
+        video_id: str,
+        operation: str,
+        params: dict | None,
+        compute: Callable[[], Any],
+        inputs: Iterable[Path] = (),
+        outputs: Iterable[Path] = (),
+        load: Callable[[], Any] | None = None,
+        force: bool | None = False,
+    ) -> Any:
+        """Run operation unless an identical one is already recorded.
+
+        Recorded result is reused if parameters match and neither inputs
+        nor outputs have changed since.
+
+        - video_id (str): video the operation belongs to
+        - operation (str): operation name
+        - params (dict | None): operation parameters (JSON-serializable)
+        - compute (callable): performs the operation
+        - inputs (Iterable[Path], optional (())): files operation reads
+        - outputs (Iterable[Path], optional (())): files operation produces
+        - load (callable, optional (None)): restores result from outputs,
+            otherwise compute() result is stored in the database (as JSON)
+        - force (bool | None, optional (False)): ignore recorded state
+        """
+
+        inputs, outputs = list(inputs), list(outputs)
+
+        if not force:
+            record = self.get(video_id, operation, params)
+            if self.classify(record, inputs) == STATE_CACHED:
+                return load() if load else record["result"]
+
+        self.start(video_id, operation, params)
+        try:
+            result = compute()
+        except BaseException as e:
+            self.fail(video_id, operation, params, repr(e))
+            raise
+
+        self.finish(
+            video_id,
+            operation,
+            params,
+            inputs=inputs,
+            outputs=outputs,
+            result=None if load else result,
+        )
+        return result
+
+    def status(self, video_id: str) -> list[dict]:
+        """Records of a video along with their current state."""
+
+        return [
+            {**record, "state": self.classify(record)}
+            for record in self.records(video_id)
+        ]
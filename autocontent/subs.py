@@ -5,10 +5,12 @@ import time
 from copy import deepcopy
 from pathlib import Path
 
+import numpy as np
 from youtube_transcript_api import YouTubeTranscriptApi
 
-from . import exceptions, utils
+from . import aio, exceptions, profiling, utils
 from .exceptions import ValidationError
+from .profiling import CAT_DOWNLOAD, CAT_TRANSCRIPT
 
 
 DEFAULT_DIR = utils.ROOT_DIR / "subs/"
@@ -41,13 +43,13 @@ class Subs:
         - video_id (str, optional (None)): youtube video ID to download transcription from
         - sanitize (bool | None, optional (True)): Sanitize transcription text on load
         """
-        if sum(map(bool, (transcript, filepath, video_id))) != 1:
+        if sum((transcript is not None, bool(filepath), bool(video_id))) != 1:
             raise Exception("Either transcript, filepath or video_id must be provided")
 
         self.filepath = filepath
         self.video_id = video_id
 
-        if transcript:
+        if transcript is not None:
             expected_keys = set(["text", "start", "duration"])
             if (
                 not isinstance(transcript, list)
@@ -62,13 +64,31 @@ class Subs:
         elif filepath:
             self.transcript = self.load_subtitiles(filepath)
         elif video_id:
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-            self.transcript = transcript_list.find_transcript(self.locales).fetch()
+            with profiling.span("transcript", CAT_DOWNLOAD):
+                transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+                self.transcript = transcript_list.find_transcript(self.locales).fetch()
 
         if sanitize:
-            self.transcript = self.sanitize(self.transcript)
+            self.sanitize()
 
     @classmethod
+    async def fetch(
+        cls,
+        video_id: str,
+        sanitize: bool | None = True,
+        timeout: float | None = None,
+    ) -> Subs:
+        """Download transcription without blocking the event loop (aio executor).
+
+        - video_id (str): youtube video ID
+        - sanitize (bool | None, optional (True)): sanitize transcription text
+        - timeout (float | None, optional (None)): seconds to wait for download
+        """
+
+        return await aio.run(cls, video_id=video_id, sanitize=sanitize, timeout=timeout)
+
+    @classmethod
+    @profiling.timed("load", CAT_TRANSCRIPT)
     def load_subtitiles(cls, file: Path | str) -> list[Subs]:
         """Read JSON from file."""
 
@@ -118,6 +138,67 @@ class Subs:
 
         return Subs(transcript=filtered)
 
+    def retime(
+        self,
+        intervals: list[list[float]] | None = None,
+        factor: float | None = None,
+    ) -> Subs:
+        """Remaps cue timestamps onto a derived video timeline.
+
+        Cues falling into removed parts are dropped, ones overlapping them
+        are clipped.
+
+        - intervals (list[list[float]] | None, optional (None)): kept source
+            time ranges (as cut_silence keeps them), sorted
+        - factor (float | None, optional (None)): playback speed factor
+        """
+
+        if (intervals is None) == (factor is None):
+            raise ValidationError(msg="Either intervals or factor must be provided")
+        if factor is not None and factor <= 0:
+            raise ValidationError(msg="Invalid speed factor", value=factor)
+
+        starts = np.array([r["start"] for r in self.transcript], dtype=float)
+        ends = starts + np.array([r["duration"] for r in self.transcript], dtype=float)
+
+        if factor is not None:
+            starts, ends = starts / factor, ends / factor
+        else:
+            starts = self.map_times(starts, intervals)
+            ends = self.map_times(ends, intervals)
+
+        retimed = [
+            {**record, "start": round(start, 3), "duration": round(end - start, 3)}
+            for record, start, end in zip(
+                self.transcript, starts.tolist(), ends.tolist()
+            )
+            if end - start > 0
+        ]
+        return Subs(transcript=retimed, sanitize=False)
+
+    @staticmethod
+    def map_times(times: np.ndarray, intervals: list[list[float]]) -> np.ndarray:
+        """Maps source timestamps onto concatenation of kept intervals.
+
+        Timestamps in removed parts collapse onto the nearest cut point.
+
+        - times (np.ndarray): source timestamps
+        - intervals (list[list[float]]): kept source time ranges, sorted
+        """
+
+        kept = np.array(intervals, dtype=float).reshape(-1, 2)
+        if not len(kept):
+            return np.zeros_like(times)
+
+        lengths = np.maximum(kept[:, 1] - kept[:, 0], 0)
+        offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+
+        index = np.searchsorted(kept[:, 0], times, side="right") - 1
+        i = np.maximum(index, 0)
+        inside = np.clip(times - kept[i, 0], 0, lengths[i])
+        mapped = offsets[i] + inside
+        return np.where(index < 0, 0, mapped)
+
     def shift_left(self) -> None:
         """Shifts transcript timestamps to the left."""
 
@@ -129,6 +210,40 @@ class Subs:
         for record in self.transcript:
             record["start"] -= offset
 
+    @classmethod
+    def save_chunk(
+        cls,
+        source: Path | str,
+        t1: int | float | str,
+        t2: int | float | str,
+        fmt: str | None = FMT_TXT,
+        shift: bool | None = False,
+        output_file: Path | str | None = None,
+        force: bool | None = False,
+    ) -> Path:
+        """Cut subtitle file to a time range and save it, outputs written file.
+
+        - source (Path | str): subtitle JSON file
+        - t1 (int | float | str): left time bracket
+        - t2 (int | float | str): right time bracket
+        - fmt (str | None, optional (FMT_TXT)): output format
+        - shift (bool | None, optional (False)): shift timestamps to 0
+        - output_file (Path | str | None, optional (None)): override output file
+        - force (bool | None, optional (False)): overwrite if exists
+        """
+
+        t1, t2 = utils.parse_time_value(t1), utils.parse_time_value(t2)
+        original = cls(filepath=Path(source).absolute())
+        target_file = original.derive_chunk_filename(
+            t1, t2, fmt, target_file=output_file
+        )
+        subs = original.cut(t1, t2)
+        if shift:
+            subs.shift_left()
+
+        subs.save(target_file, fmt=fmt, force=force)
+        return target_file
+
     def derive_chunk_filename(
         self,
         t1: float,
@@ -166,6 +281,7 @@ class Subs:
         result = deepcopy(records)
 
         for record in result:
+            record["text"] = str(record["text"])
             for character in to_eliminate:
                 record["text"] = record["text"].replace(character, "")
 
@@ -245,6 +361,7 @@ class Subs:
         return "\n".join(f"{i}: {record['text']}" for i, record in enumerate(records))
 
     @classmethod
+    @profiling.timed("format", CAT_TRANSCRIPT)
     def format_subs(cls, records: list[dict[str, int | str]], fmt: str) -> str:
         """Formats subtitles from JSON to appropriate format.
 
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+from moviepy.audio.AudioClip import AudioArrayClip
+from moviepy.editor import VideoClip
+
+from . import utils
+
+
+SYNTHETIC_VIDEO_ID = "synthetic00"
+"""Video ID used in synthetic fixture file names."""
+
+AUDIO_FPS = 44100
+VIDEO_FPS = 24
+VIDEO_SIZE = (320, 240)
+"""Synthetic media parameters."""
+
+SPEECH_DURATION = 1.5
+SILENCE_DURATION = 0.75
+TONE_FREQUENCY = 440.0
+TONE_AMPLITUDE = 0.5
+NOISE_AMPLITUDE = 0.001
+"""Default tone/silence pattern (seconds, relative amplitude)."""
+
+CUE_DURATION = 2.0
+CUE_GAP = 0.5
+CUE_WORDS = 8
+"""Default synthetic transcript cue parameters."""
+
+COLOR_BARS = np.array(
+    [
+        [192, 192, 192],
+        [192, 192, 0],
+        [0, 192, 192],
+        [0, 192, 0],
+        [192, 0, 192],
+        [192, 0, 0],
+        [0, 0, 192],
+    ],
+    dtype=np.uint8,
+)
+"""SMPTE-like test pattern colors."""
+
+
+def speech_pattern(
+    duration: float,
+    fps: int = AUDIO_FPS,
+    speech: float = SPEECH_DURATION,
+    silence: float = SILENCE_DURATION,
+    frequency: float = TONE_FREQUENCY,
+    amplitude: float = TONE_AMPLITUDE,
+    noise: float = NOISE_AMPLITUDE,
+    seed: int = 0,
+) -> np.ndarray:
+    """Stereo audio alternating tone bursts ("speech") and near-silence.
+
+    Outputs (samples, 2) float array in [-1, 1].
+
+    - duration (float): length in seconds
+    - fps (int, optional (AUDIO_FPS)): sample rate
+    - speech (float, optional (SPEECH_DURATION)): tone burst length
+    - silence (float, optional (SILENCE_DURATION)): pause length
+    - frequency (float, optional (TONE_FREQUENCY)): tone frequency
+    - amplitude (float, optional (TONE_AMPLITUDE)): tone amplitude
+    - noise (float, optional (NOISE_AMPLITUDE)): background noise amplitude
+    - seed (int, optional (0)): noise random seed
+    """
+
+    t = np.arange(int(duration * fps)) / fps
+    speaking = (t % (speech + silence)) < speech
+    tone = amplitude * np.sin(2 * np.pi * frequency * t) * speaking
+    rng = np.random.default_rng(seed)
+    mono = tone + noise * rng.uniform(-1, 1, t.shape)
+
+    return np.clip(np.column_stack([mono, mono]), -1, 1)
+
+
+def speech_intervals(
+    duration: float,
+    speech: float = SPEECH_DURATION,
+    silence: float = SILENCE_DURATION,
+) -> list[list[float]]:
+    """Exact speaking intervals of speech_pattern audio."""
+
+    period = speech + silence
+    starts = np.arange(0, duration, period)
+    return [[float(s), float(min(s + speech, duration))] for s in starts]
+
+
+def pattern_frame(t: float, size: tuple[int, int] = VIDEO_SIZE) -> np.ndarray:
+    """Color bars with a moving white stripe (changes every frame)."""
+
+    width, height = size
+    columns = np.arange(width) * len(COLOR_BARS) // width
+    frame = np.repeat(COLOR_BARS[columns][np.newaxis], height, axis=0)
+
+    stripe = int(t * width / 4) % width
+    frame[:, stripe : stripe + max(width // 40, 1)] = 255
+    return frame
+
+
+def write_audio(
+    path: Path | str,
+    duration: float,
+    fps: int = AUDIO_FPS,
+    **pattern_kwargs,
+) -> Path:
+    """Write tone/silence patterned audio file (format from suffix)."""
+
+    path = Path(path).absolute()
+    utils.ensure_folder(path)
+    clip = AudioArrayClip(speech_pattern(duration, fps=fps, **pattern_kwargs), fps=fps)
+    clip.write_audiofile(str(path), fps=fps, logger=None)
+
+    return path
+
+
+def write_video(
+    path: Path | str,
+    duration: float,
+    size: tuple[int, int] = VIDEO_SIZE,
+    fps: int = VIDEO_FPS,
+    audio: bool = True,
+    **pattern_kwargs,
+) -> Path:
+    """Write test pattern video (with tone/silence patterned audio track).
+
+    - path (Path | str): output file
+    - duration (float): length in seconds
+    - size (tuple[int, int], optional (VIDEO_SIZE)): frame width and height
+    - fps (int, optional (VIDEO_FPS)): frame rate
+    - audio (bool, optional (True)): add audio track
+    - pattern_kwargs: speech_pattern parameters
+    """
+
+    path = Path(path).absolute()
+    utils.ensure_folder(path)
+
+    clip = VideoClip(lambda t: pattern_frame(t, size), duration=duration)
+    if audio:
+        samples = speech_pattern(duration, fps=AUDIO_FPS, **pattern_kwargs)
+        clip = clip.set_audio(AudioArrayClip(samples, fps=AUDIO_FPS))
+    clip.write_videofile(
+        str(path), fps=fps, preset="ultrafast", audio=audio, logger=None
+    )
+
+    return path
+
+
+def transcript(
+    cues: int,
+    duration: float = CUE_DURATION,
+    gap: float = CUE_GAP,
+    words: int = CUE_WORDS,
+    seed: int = 0,
+) -> list[dict]:
+    """Transcript records (YouTube JSON structure) with N evenly spaced cues.
+
+    - cues (int): amount of records
+    - duration (float, optional (CUE_DURATION)): cue duration
+    - gap (float, optional (CUE_GAP)): pause between cues
+    - words (int, optional (CUE_WORDS)): words per cue
+    - seed (int, optional (0)): random seed
+    """
+
+    rng = np.random.default_rng(seed)
+    vocabulary = [f"word{i}" for i in range(500)]
+    return [
+        {
+            "text": " ".join(rng.choice(vocabulary, size=words)),
+            "start": round(i * (duration + gap), 3),
+            "duration": duration,
+        }
+        for i in range(cues)
+    ]
+
+
+def write_transcript(path: Path | str, cues: int, **kwargs) -> Path:
+    """Write synthetic transcript JSON file."""
+
+    path = Path(path).absolute()
+    utils.ensure_folder(path)
+    with open(path, "w") as f:
+        json.dump(transcript(cues, **kwargs), f)
+
+    return path
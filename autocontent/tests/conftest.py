@@ -1,14 +1,138 @@
 # TODO: define temp folders, cleanup
+import io
+import os
+import re
+import shutil
+import tempfile
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
 import pytest
 
+from .. import ffmpeg, jobs, state, synthetic, utils, video
+from ..video import FMT_MP4, Video
+
 
 ALLOW_PAID_MODEL_USAGE = False
 """Flag which decides whether to skip tests that make requests to paid models or not."""
 
 
+@pytest.fixture(autouse=True)
+def state_db(tmp_path_factory, monkeypatch):
+    """Keep state (operation records, importer health, jobs) out of the repo root."""
+
+    path = tmp_path_factory.mktemp("state") / "state.db"
+    monkeypatch.setattr(state, "DEFAULT_DB_PATH", path)
+    monkeypatch.setattr(jobs, "DEFAULT_DB_PATH", path)
+    monkeypatch.setattr(Video, "_registry", None)
+    return path
+
+
+@pytest.fixture()
+def video_dir(monkeypatch):
+    """Temporary video directory inside home (required for outputs)."""
+
+    directory = Path(tempfile.mkdtemp(prefix=".autocontent-test-", dir=utils.HOME_DIR))
+    monkeypatch.setattr(video, "DEFAULT_DIR", directory)
+    yield directory
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture()
+def synthetic_source(video_dir):
+    """Factory of synthetic videos (Video) in the temporary video directory.
+
+    - duration (float, optional (9)): length in seconds
+    - size (tuple[int, int], optional (synthetic.VIDEO_SIZE)): frame size
+    - name (str, optional (synthetic.SYNTHETIC_VIDEO_ID)): file name (no suffix)
+    """
+
+    def make(
+        duration: float = 9,
+        size: tuple[int, int] = synthetic.VIDEO_SIZE,
+        name: str = synthetic.SYNTHETIC_VIDEO_ID,
+    ) -> Video:
+        path = video_dir / f"{name}.{FMT_MP4}"
+        return Video(filepath=synthetic.write_video(path, duration, size=size))
+
+    return make
+
+
 @pytest.fixture()
 def monetized():
     """Fixture that skips all cases if associated flag is disabled."""
 
     if not ALLOW_PAID_MODEL_USAGE:
         pytest.skip()
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler with single byte range support (records ranges)."""
+
+    ranges = []
+
+    def log_message(self, *args):
+        pass
+
+    def send_head(self):
+        path = Path(self.translate_path(self.path))
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+        if not match or not path.is_file():
+            return super().send_head()
+
+        size = path.stat().st_size
+        start = int(match.group(1))
+        end = min(int(match.group(2) or size - 1), size - 1)
+        self.ranges.append((start, end))
+
+        with open(path, "rb") as f:
+            f.seek(start)
+            body = io.BytesIO(f.read(end - start + 1))
+        self.send_response(206)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        return body
+
+    def copyfile(self, source, outputfile):
+        try:
+            super().copyfile(source, outputfile)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client seeked elsewhere
+
+
+@pytest.fixture()
+def media_server(tmp_path):
+    """Local HTTP server (with range requests) serving a temporary directory.
+
+    Yields (directory, base url, list of requested byte ranges).
+    """
+
+    ranges = []
+    handler = type("Handler", (RangeRequestHandler,), {"ranges": ranges})
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(handler, directory=str(tmp_path))
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield tmp_path, f"http://127.0.0.1:{server.server_port}", ranges
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture()
+def ffmpeg_on_path(tmp_path_factory, monkeypatch):
+    """Make the configured ffmpeg binary available as "ffmpeg" (for yt-dlp)."""
+
+    if shutil.which("ffmpeg"):
+        return
+    directory = tmp_path_factory.mktemp("bin")
+    (directory / "ffmpeg").symlink_to(ffmpeg.binary())
+    monkeypatch.setenv("PATH", f"{directory}{os.pathsep}{os.environ['PATH']}")
@@ -0,0 +1,137 @@
+#!pytest -s
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from .. import aio, exceptions, ffmpeg, subs, synthetic, video
+from ..subs import Subs
+from ..video import FMT_MP4, YtDlpImporter
+
+
+def wait_for_cancel(started: threading.Event, outcome: list) -> None:
+    started.set()
+    try:
+        while True:
+            aio.checkpoint()
+            time.sleep(0.01)
+    except exceptions.OperationCancelled as e:
+        outcome.append(e)
+
+
+def test_run_concurrently():
+    async def main():
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(aio.run(lambda i=i: time.sleep(0.2) or i) for i in range(4))
+        )
+        return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(main())
+    assert results == [0, 1, 2, 3]
+    assert elapsed < 0.6
+    assert not aio.cancellable()
+
+
+def test_fetch_subs(monkeypatch):
+    cues = synthetic.transcript(3)
+    loop_threads = []
+
+    class Transcripts:
+        def find_transcript(self, locales):
+            return self
+
+        def fetch(self):
+            loop_threads.append(threading.current_thread())
+            return cues
+
+    monkeypatch.setattr(
+        subs.YouTubeTranscriptApi, "list_transcripts", lambda video_id: Transcripts()
+    )
+    fetched = asyncio.run(Subs.fetch(synthetic.SYNTHETIC_VIDEO_ID, sanitize=False))
+    assert fetched.transcript == cues
+    assert loop_threads[0] is not threading.main_thread()
+
+
+@pytest.mark.parametrize("cancel", [False, True])
+def test_cancel_timeout(cancel):
+    started, outcome = threading.Event(), []
+
+    async def main():
+        timeout = None if cancel else 0.1
+        task = asyncio.create_task(
+            aio.run(wait_for_cancel, started, outcome, timeout=timeout)
+        )
+        if cancel:
+            await asyncio.to_thread(started.wait)
+            task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError if cancel else asyncio.TimeoutError):
+        asyncio.run(main())
+    for _ in range(100):
+        if outcome:
+            break
+        time.sleep(0.01)
+    assert isinstance(outcome[0], exceptions.OperationCancelled)
+
+
+def test_cancel_ffmpeg():
+    # endless encode, killed once the caller times out
+    args = ["-f", "lavfi", "-i", "testsrc=size=320x240", "-f", "null", "-"]
+    done = []
+
+    def encode():
+        try:
+            ffmpeg.run(*args)
+        except exceptions.OperationCancelled:
+            done.append(time.perf_counter())
+
+    async def main():
+        await aio.run(encode, timeout=0.2)
+
+    start = time.perf_counter()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(main())
+    for _ in range(100):
+        if done:
+            break
+        time.sleep(0.01)
+    assert done and done[0] - start < 2
+
+
+def test_cancel_download(media_server, ffmpeg_on_path, tmp_path, monkeypatch):
+    directory, base_url, _ = media_server
+    source = synthetic.write_video(
+        directory / f"{synthetic.SYNTHETIC_VIDEO_ID}.{FMT_MP4}", 5
+    )
+    monkeypatch.setattr(video, "DEFAULT_DIR", tmp_path)
+    importer = YtDlpImporter(video_id=synthetic.SYNTHETIC_VIDEO_ID)
+    importer.url = f"{base_url}/{source.name}"
+    started, proceed, outcome = threading.Event(), threading.Event(), []
+
+    def download():
+        started.set()
+        proceed.wait()
+        try:
+            importer.run({"outtmpl": str(tmp_path / "out.mp4"), "quiet": True}, "x")
+        except Exception as e:
+            outcome.append(e)
+
+    async def main():
+        task = asyncio.create_task(aio.run(download))
+        await asyncio.to_thread(started.wait)
+        task.cancel()
+        proceed.set()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(main())
+    for _ in range(100):
+        if outcome:
+            break
+        time.sleep(0.01)
+    assert isinstance(outcome[0], exceptions.OperationCancelled)
+    assert not (tmp_path / "out.mp4").exists()
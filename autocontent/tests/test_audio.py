@@ -0,0 +1,235 @@
+#!pytest -s
+
+import os
+import shutil
+import time
+
+import numpy as np
+import pytest
+from moviepy.editor import AudioFileClip, VideoFileClip
+
+from .. import audio, exceptions, synthetic
+from ..subs import Subs
+from ..video import Video
+
+
+@pytest.fixture(scope="module")
+def audio_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("audio") / f"{synthetic.SYNTHETIC_VIDEO_ID}.mp3"
+    return synthetic.write_audio(path, 5)
+
+
+def test_speaking_intervals():
+    silent = np.array([1, 0, 0, 1, 1, 0, 1, 0, 0], dtype=bool)
+    assert audio.speaking_intervals(silent, 1, 0) == [[1, 3], [5, 6]]
+    assert audio.speaking_intervals(silent, 1, 1.5) == [[-0.5, 7.5]]
+    assert audio.speaking_intervals(~silent, 1, 0) == [[0, 1], [3, 5], [6, 7]]
+    assert audio.speaking_intervals(silent[:1], 1, 0) == []
+
+
+def test_window_peaks():
+    samples = np.array([0.1, -0.5, 0.2, 0.3, -0.1, 0.9, 1.0])
+    assert np.allclose(audio.window_peaks(samples, 2, 1), [0.5, 0.3, 0.9])
+    assert len(audio.window_peaks(samples[:1], 2, 1)) == 0
+
+    with pytest.raises(exceptions.ValidationError):
+        audio.window_peaks(samples, 2, 0.1)
+
+
+@pytest.fixture()
+def fresh_audio_file(audio_file, tmp_path):
+    """Audio file without cached sidecars."""
+
+    path = tmp_path / audio_file.name
+    shutil.copy(audio_file, path)
+    return path
+
+
+def test_load_pcm(audio_file):
+    samples = audio.load_pcm(audio_file)
+    pcm = audio.pcm_path(audio_file)
+
+    assert isinstance(samples, np.memmap)
+    assert pcm.is_file() and pcm.name.startswith(".")
+    assert len(samples) == pytest.approx(5 * audio.PCM_FPS, rel=0.02)
+
+    # cached: not decoded again
+    mtime = pcm.stat().st_mtime_ns
+    audio.load_pcm(audio_file)
+    assert pcm.stat().st_mtime_ns == mtime
+
+    # source changed: decoded again
+    os.utime(audio_file, ns=(time.time_ns(), time.time_ns()))
+    audio.load_pcm(audio_file)
+    assert pcm.stat().st_mtime_ns != mtime
+    assert not list(pcm.parent.glob("*.part"))
+
+
+def test_find_speaking(audio_file):
+    samples = audio.load_pcm(audio_file)
+    intervals = audio.find_speaking(samples, volume_threshold=0.05, ease_in=0)
+    expected = synthetic.speech_intervals(5)
+    assert np.allclose(intervals, expected[: len(intervals)], atol=0.11)
+
+    with AudioFileClip(str(audio_file)) as clip:
+        reference = Video.find_speaking(clip, volume_threshold=0.05, ease_in=0)
+    assert np.allclose(intervals, reference, atol=0.11)
+
+
+def test_load_pcm_invalid(tmp_path):
+    path = tmp_path / "broken.mp3"
+    path.write_bytes(b"not audio")
+
+    with pytest.raises(exceptions.VideoException):
+        audio.load_pcm(path)
+    assert not audio.pcm_path(path).exists()
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_envelope_matches_samples():
+    samples = synthetic.speech_pattern(7.3, fps=audio.PCM_FPS)[:, 0]
+    envelope = audio.Envelope.build(samples)
+
+    assert envelope.duration == pytest.approx(7.3)
+    for window_size in (0.01, 0.05, 0.1, 0.3, 0.7):
+        assert np.allclose(
+            envelope.peaks(window_size),
+            audio.window_peaks(samples, audio.PCM_FPS, window_size),
+        )
+        assert envelope.find_speaking(window_size, 0.05, 0.1) == audio.find_speaking(
+            samples, window_size=window_size, volume_threshold=0.05, ease_in=0.1
+        )
+
+    rms = envelope.level(0.5)["rms"]
+    assert np.allclose(rms[0], np.sqrt(np.mean(samples[:8000] ** 2)), rtol=1e-4)
+
+    assert not envelope.supports(0.015)
+    with pytest.raises(exceptions.ValidationError):
+        envelope.peaks(0.015)
+
+
+def test_envelope_cache(audio_file):
+    envelope = audio.Envelope.load(audio_file)
+    cached = audio.Envelope.load(audio_file)
+
+    assert list(cached.levels) == list(audio.ENVELOPE_LEVELS)
+    assert np.array_equal(cached.peaks(0.1), envelope.peaks(0.1))
+    assert audio.detect_speaking(audio_file, 0.1, 0.05, 0) == envelope.find_speaking(
+        0.1, 0.05, 0
+    )
+    # not a multiple of the base window: evaluated on samples
+    assert audio.detect_speaking(audio_file, 0.125, 0.05, 0)
+
+
+def test_preview(audio_file):
+    rows = audio.preview(audio_file, [0.05, 0.1], [0.05, 0.9], [0, 0.1])
+
+    assert len(rows) == 8
+    strict = [r for r in rows if r["volume_threshold"] == 0.9]
+    assert all(r["kept"] == 0 and r["intervals"] == 0 for r in strict)
+
+    row = next(r for r in rows if r["volume_threshold"] == 0.05 and not r["ease_in"])
+    speech = sum(end - start for start, end in synthetic.speech_intervals(5))
+    assert row["kept"] == pytest.approx(speech - 0.5, abs=0.6)
+    assert 0 < row["ratio"] < 1
+
+
+def test_hysteresis_and_gaps():
+    levels = np.array([-60, -40, -20, -35, -45, -35, -20, -60, -60, -60, -20])
+    speaking = audio.hysteresis(levels, -30, -40)
+    assert speaking.tolist() == [0, 0, 1, 1, 0, 0, 1, 0, 0, 0, 1]
+
+    filled = audio.fill_gaps(speaking, 3)
+    assert filled.tolist() == [0, 0, 1, 1, 1, 1, 1, 0, 0, 0, 1]
+    assert audio.fill_gaps(speaking, 0).tolist() == speaking.tolist()
+
+
+@pytest.mark.parametrize("gain", [0.02, 0.2, 1.0])
+def test_adaptive_gain_independent(gain):
+    samples = synthetic.speech_pattern(12, fps=audio.PCM_FPS, noise=0.002)[:, 0]
+    expected = synthetic.speech_intervals(12)
+
+    intervals = audio.find_speaking(
+        samples * gain, ease_in=0, mode=audio.MODE_ADAPTIVE, volume_threshold=None
+    )
+    assert np.allclose(intervals, expected[: len(intervals)], atol=0.11)
+    assert len(intervals) == len(expected) - 1
+
+    # fixed threshold misses quiet sources
+    fixed = audio.find_speaking(samples * gain, ease_in=0, volume_threshold=0.05)
+    assert bool(fixed) == (gain * synthetic.TONE_AMPLITUDE > 0.05)
+
+
+def test_adaptive_without_pauses():
+    samples = synthetic.speech_pattern(5, fps=audio.PCM_FPS, silence=0)[:, 0]
+    silent = audio.adaptive_silence(
+        audio.window_peaks(samples, audio.PCM_FPS, 0.1), 0.1
+    )
+    assert not silent.any()
+
+    with pytest.raises(exceptions.ValidationError):
+        audio.find_speaking(samples, mode="unknown")
+
+
+def test_cue_intervals():
+    records = [
+        {"text": "a", "start": 0.0, "duration": 2.0},
+        {"text": "b", "start": 1.5, "duration": 1.0},  # overlapping cue
+        {"text": "c", "start": 2.6, "duration": 1.0},  # short pause
+        {"text": "d", "start": 5.0, "duration": 0.5},
+    ]
+    assert audio.cue_intervals(records) == [[0.0, 3.6], [5.0, 5.5]]
+    assert audio.cue_intervals(records, min_gap=0) == [[0, 2.5], [2.6, 3.6], [5, 5.5]]
+    assert audio.cue_intervals([]) == []
+
+    assert audio.transcript_speaking(records, ease_in=1) == [[-1.0, 6.5]]
+
+
+def test_transcript_refine(fresh_audio_file):
+    # cues deliberately late by 0.2s (and ending early)
+    records = [
+        {"text": "x", "start": s + 0.2, "duration": e - s - 0.4}
+        for s, e in synthetic.speech_intervals(5)
+    ]
+    rough = audio.transcript_speaking(records, ease_in=0)
+    refined = audio.transcript_speaking(records, source=fresh_audio_file, ease_in=0)
+
+    expected = synthetic.speech_intervals(5)
+    assert not np.allclose(rough, expected, atol=0.1)
+    assert np.allclose(refined, expected, atol=0.05)
+    assert not audio.pcm_path(fresh_audio_file).exists()
+
+
+def test_read_pcm(fresh_audio_file):
+    fragment = audio.read_pcm(fresh_audio_file, 1.0, 0.5)
+    assert len(fragment) == pytest.approx(0.5 * audio.PCM_FPS, abs=200)
+
+    samples = audio.load_pcm(fresh_audio_file)
+    cached = audio.read_pcm(fresh_audio_file, 1.0, 0.5)
+    assert len(cached) == 0.5 * audio.PCM_FPS
+    assert np.array_equal(cached, samples[audio.PCM_FPS : int(1.5 * audio.PCM_FPS)])
+
+
+def test_cut_silence_transcript(synthetic_source, video_dir):
+    source = synthetic_source(4.6).filepath
+    records = [
+        {"text": "x", "start": s, "duration": e - s}
+        for s, e in synthetic.speech_intervals(4.6)
+    ]
+
+    with pytest.raises(exceptions.ValidationError):
+        Video(filepath=source).cut_silence(mode=audio.MODE_TRANSCRIPT)
+
+    cleaned = Video(filepath=source).cut_silence(
+        output_file=video_dir / f"{synthetic.SYNTHETIC_VIDEO_ID}-cleaned.mp4",
+        ease_in=0,
+        mode=audio.MODE_TRANSCRIPT,
+        subs=Subs(transcript=records),
+    )
+    with VideoFileClip(str(cleaned.filepath)) as clip:
+        assert clip.duration == pytest.approx(3.1, abs=0.1)
+    assert cleaned.kept_intervals == [[0, 1.5], [2.25, 3.75], [4.5, 4.6]]
+
+    retimed = Subs(transcript=records).retime(intervals=cleaned.kept_intervals)
+    assert [r["start"] for r in retimed.transcript] == [0, 1.5, 3.0]
+    assert not audio.pcm_path(source).exists()
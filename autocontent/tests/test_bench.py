@@ -0,0 +1,68 @@
+#!pytest -s
+
+import json
+
+import numpy as np
+import pytest
+from moviepy.editor import AudioFileClip, VideoFileClip
+
+from .. import bench, synthetic
+from ..subs import Subs
+from ..video import Video
+
+
+@pytest.fixture()
+def fixtures(tmp_path):
+    return bench.Fixtures(duration=5, cues=50, directory=tmp_path)
+
+
+def test_speech_pattern():
+    samples = synthetic.speech_pattern(4.5, fps=1000)
+    speaking = np.abs(samples[:, 0]) > 0.01
+
+    assert samples.shape == (4500, 2)
+    assert speaking[:1400].any() and not speaking[1600:2200].any()
+    assert synthetic.speech_intervals(4.5) == [[0.0, 1.5], [2.25, 3.75]]
+
+
+def test_fixtures(fixtures):
+    with open(fixtures.transcript) as f:
+        records = json.load(f)
+    assert len(records) == 50
+    assert Subs(transcript=records).transcript == records
+
+    with VideoFileClip(str(fixtures.video)) as vid:
+        assert vid.duration == pytest.approx(5, abs=0.1)
+        assert tuple(vid.size) == synthetic.VIDEO_SIZE
+        assert vid.audio is not None
+    assert Video(filepath=fixtures.video).video_id == synthetic.SYNTHETIC_VIDEO_ID
+
+    with AudioFileClip(str(fixtures.audio)) as audio:
+        intervals = Video.find_speaking(audio, volume_threshold=0.05, ease_in=0)
+    expected = synthetic.speech_intervals(5)
+    assert np.allclose(intervals, expected[: len(intervals)], atol=0.11)
+
+
+def test_run_and_compare(fixtures, tmp_path):
+    results_file = tmp_path / "results.jsonl"
+    record = bench.run(["subs_load", "subs_cut", "format_srt"], fixtures, repeat=2)
+
+    assert set(record["results"]) == {"subs_load", "subs_cut", "format_srt"}
+    assert all(len(r["runs"]) == 2 for r in record["results"].values())
+
+    bench.save(record, results_file)
+    bench.save({**record, "revision": "other"}, results_file)
+    records = bench.load(results_file)
+    assert bench.find(record["revision"], records, like=record) == record
+    assert bench.find(record["revision"], records, like={**record, "cues": 1}) is None
+
+    slower = json.loads(json.dumps(record))
+    slower["results"]["subs_load"]["min"] *= 2
+    rows = {row["name"]: row for row in bench.compare(record, slower)}
+    assert rows["subs_load"]["regression"]
+    assert not rows["subs_cut"]["regression"]
+
+
+def test_run_unknown_case(fixtures):
+    with pytest.raises(Exception):
+        bench.run(["gibberish"], fixtures)
@@ -0,0 +1,85 @@
+#!pytest -s
+
+import json
+
+import pytest
+from moviepy.editor import VideoFileClip
+
+from .. import audio, edl, exceptions, synthetic, video
+from ..edl import EDL
+from ..video import FMT_MP4, Video
+
+
+@pytest.fixture()
+def source(synthetic_source):
+    """Synthetic video in a temporary video directory."""
+
+    return synthetic_source(9)
+
+
+def test_select():
+    segments = [[0, 2], [5, 6], [8, 10]]
+
+    assert edl.select(segments, 1, 4) == [[1, 2], [5, 6], [8, 9]]
+    assert edl.select(segments, 2, 3) == [[5, 6]]
+    assert edl.select(segments, 6, 7) == []
+
+
+def test_plan(tmp_path):
+    edits = (
+        EDL(tmp_path / "source.mp4")
+        .clip(2, 8)
+        .keep([[-0.5, 1], [3, 5]])
+        .modify_speed(2)
+        .clip(0.25, 1.25, strip_sound=True)
+    )
+
+    assert edits.plan(10) == {
+        "segments": [[2.5, 3], [5, 6.5]],
+        "factor": 2,
+        "strip_sound": True,
+    }
+
+    with pytest.raises(exceptions.ValidationError):
+        edits.then("unknown")
+    with pytest.raises(exceptions.ValidationError):
+        edits.clip(3, 1)
+    with pytest.raises(exceptions.ValidationError):
+        edits.cut_silence(mode=audio.MODE_TRANSCRIPT)
+
+
+def test_plan_silence(tmp_path):
+    path = synthetic.write_audio(tmp_path / "speech.mp3", 5)
+    plan = EDL(path).clip(1, 4).cut_silence(window_size=0.05, ease_in=0).plan(5)
+
+    segments = [[1, 1.5], [2.25, 3.75]]
+    assert len(plan["segments"]) == len(segments)
+    for planned, expected in zip(plan["segments"], segments):
+        assert planned == pytest.approx(expected, abs=0.06)
+
+
+def test_serialize(tmp_path):
+    edits = EDL(tmp_path / "source.mp4").clip("00:00:01", 5).modify_speed(1.5)
+    path = edits.save(tmp_path / f"edits.{edl.FMT_EDL}")
+
+    with open(path) as f:
+        data = json.load(f)
+    assert data["version"] == edl.EDL_VERSION
+    assert [edit["op"] for edit in data["edits"]] == [edl.OP_CLIP, edl.OP_SPEED]
+
+    loaded = EDL.load(path)
+    assert loaded.source == edits.source and loaded.edits == edits.edits
+
+    with pytest.raises(exceptions.ValidationError):
+        EDL.from_dict({**data, "version": 0})
+
+
+def test_render_edl(source):
+    edits = source.edit().clip(1, 8).modify_speed(2).clip(0.5, 3)
+    assert not source.edl.edits
+    assert list(video.DEFAULT_DIR.glob(f"*.{FMT_MP4}")) == [source.filepath]
+
+    rendered = Video.render_edl(edits)
+    assert rendered.edl is edits
+    with VideoFileClip(str(rendered.filepath)) as clip:
+        assert clip.duration == pytest.approx(2.5, abs=0.1)
@@ -0,0 +1,106 @@
+#!pytest -s
+
+import numpy as np
+import pytest
+
+from .. import exceptions, extractive, text_analysis
+from ..subs import Subs
+
+
+TOPIC_WATER = [
+    "Water is an inorganic compound with the chemical formula H2O.",
+    "Water is transparent, tasteless and nearly colorless.",
+    "Oceans hold most of the water on the planet.",
+    "Drinking water must be clean and free of chemical compounds.",
+    "Water covers the planet oceans, rivers and lakes.",
+]
+TOPIC_FOOTBALL = [
+    "Football is played by two teams of eleven players.",
+    "The football team scores by kicking the ball into the goal.",
+    "Players pass the ball across the football pitch.",
+    "The goalkeeper is the only player allowed to touch the ball with hands.",
+    "A football match lasts ninety minutes.",
+]
+"""Sentences of two unrelated topics."""
+
+
+def test_tfidf_matrix_normalized():
+    matrix = extractive.tfidf_matrix(TOPIC_WATER + ["", "the and of"])
+
+    norms = np.linalg.norm(matrix, axis=1)
+    assert np.allclose(norms[:-2], 1.0)
+    assert np.allclose(norms[-2:], 0.0)
+
+
+def test_textrank_prefers_central_node():
+    similarity = np.array(
+        [
+            [1.0, 0.9, 0.9, 0.9],
+            [0.9, 1.0, 0.1, 0.1],
+            [0.9, 0.1, 1.0, 0.1],
+            [0.9, 0.1, 0.1, 1.0],
+        ]
+    )
+    scores = extractive.textrank(similarity)
+
+    assert scores.argmax() == 0
+    assert scores.sum() == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(("ratio", "expected"), [(0.2, 2), (0.5, 5), (1.0, 10)])
+def test_summarize(ratio, expected):
+    text = " ".join(TOPIC_WATER + TOPIC_FOOTBALL)
+    summary = extractive.summarize(text, ratio=ratio)
+    sentences = extractive.split_sentences(summary)
+
+    assert len(sentences) == expected
+    assert all(s in text for s in sentences)
+
+
+def test_summarize_invalid_ratio():
+    with pytest.raises(exceptions.ValidationError):
+        extractive.summarize("abc", ratio=0)
+
+
+def test_segment():
+    segments = extractive.segment(" ".join(TOPIC_WATER + TOPIC_FOOTBALL))
+
+    assert segments == [" ".join(TOPIC_WATER), " ".join(TOPIC_FOOTBALL)]
+
+
+def test_segment_records():
+    records = [
+        {"text": text, "start": float(i), "duration": 1.0}
+        for i, text in enumerate(TOPIC_WATER * 5 + TOPIC_FOOTBALL * 5)
+    ]
+    segments = extractive.segment_records(records)
+
+    assert len(segments) == 2
+    assert segments[0] == records[:25]
+    assert segments[1] == records[25:]
+
+
+def test_segment_short_input():
+    assert extractive.segment("Just one sentence.") == ["Just one sentence."]
+    assert extractive.segment_records([]) == []
+
+
+def test_local_backend():
+    text = " ".join(TOPIC_WATER + TOPIC_FOOTBALL)
+    subs = Subs(
+        transcript=[
+            {"text": text, "start": float(i), "duration": 1.0}
+            for i, text in enumerate(TOPIC_WATER * 5 + TOPIC_FOOTBALL * 5)
+        ]
+    )
+
+    assert text_analysis.segment(text, backend=text_analysis.BACKEND_LOCAL) == (
+        extractive.segment(text)
+    )
+    assert text_analysis.summarize(text, backend=text_analysis.BACKEND_LOCAL) == (
+        extractive.summarize(text)
+    )
+    assert [len(s.transcript) for s in text_analysis.segment_subs(subs)] == [25, 25]
+
+    with pytest.raises(exceptions.ValidationError):
+        text_analysis.segment(text, backend="gibberish")
@@ -0,0 +1,91 @@
+#!pytest -s
+
+import json
+
+import pytest
+
+from .. import exceptions, ffmpeg, synthetic, utils
+
+
+INFO_MP4 = """Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'synthetic00.mp4':
+  Metadata:
+    major_brand     : isom
+  Duration: 00:01:03.01, start: 0.000000, bitrate: 165 kb/s
+  Stream #0:0[0x1](und): Video: h264 (Constrained Baseline) (avc1 / 0x31637661), \
+yuv420p(progressive), 320x240, 27 kb/s, 29.97 fps, 29.97 tbr, 12288 tbn (default)
+      Metadata:
+        handler_name    : VideoHandler
+  Stream #0:1[0x2](und): Audio: aac (LC) (mp4a / 0x6134706D), 44100 Hz, stereo, \
+fltp, 127 kb/s (default)
+At least one output file must be specified
+"""
+
+
+def test_parse_info():
+    info = ffmpeg.parse_info(INFO_MP4)
+
+    assert info["format"] == "mov,mp4,m4a,3gp,3g2,mj2"
+    assert info["duration"] == pytest.approx(63.01)
+    assert info["bitrate"] == 165
+    assert info["streams"] == [
+        {
+            "index": 0,
+            "type": ffmpeg.STREAM_VIDEO,
+            "codec": "h264",
+            "bitrate": 27,
+            "width": 320,
+            "height": 240,
+            "fps": 29.97,
+        },
+        {
+            "index": 1,
+            "type": ffmpeg.STREAM_AUDIO,
+            "codec": "aac",
+            "bitrate": 127,
+            "sample_rate": 44100,
+            "channels": "stereo",
+        },
+    ]
+
+    no_duration = ffmpeg.parse_info(
+        INFO_MP4.replace("00:01:03.01, start: 0.000000", "N/A")
+    )
+    assert no_duration["duration"] is None
+
+    with pytest.raises(exceptions.VideoException):
+        ffmpeg.parse_info("Error opening input file")
+
+
+def test_version(monkeypatch):
+    assert ffmpeg.version() is None or ffmpeg.version() >= (4, 0)
+
+    monkeypatch.setattr(ffmpeg, "_versions", {ffmpeg.binary(): (6, 1)})
+    assert not ffmpeg.threaded_outputs()
+    monkeypatch.setattr(ffmpeg, "_versions", {ffmpeg.binary(): None})
+    assert ffmpeg.threaded_outputs()
+
+
+def test_probe(tmp_path):
+    path = synthetic.write_video(tmp_path / f"{synthetic.SYNTHETIC_VIDEO_ID}.mp4", 2)
+    info = ffmpeg.probe(path)
+
+    assert info["duration"] == pytest.approx(2, abs=0.1)
+    video = ffmpeg.first_stream(info, ffmpeg.STREAM_VIDEO)
+    assert (video["width"], video["height"]) == synthetic.VIDEO_SIZE
+    assert video["fps"] == synthetic.VIDEO_FPS
+    assert ffmpeg.first_stream(info, ffmpeg.STREAM_AUDIO)["codec"]
+
+    # cached while the file is unchanged
+    cache = utils.sidecar_path(path, ffmpeg.SIDECAR_PROBE)
+    with open(cache) as f:
+        cached = json.load(f)
+    cached["info"]["duration"] = 42
+    with open(cache, "w") as f:
+        json.dump(cached, f)
+    assert ffmpeg.probe(path)["duration"] == 42
+    assert ffmpeg.probe(path, force=True)["duration"] == pytest.approx(2, abs=0.1)
+
+    broken = tmp_path / "broken.mp4"
+    broken.write_text("not a video")
+    with pytest.raises(exceptions.VideoException):
+        ffmpeg.probe(broken)
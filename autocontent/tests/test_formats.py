@@ -0,0 +1,104 @@
+#!pytest -s
+
+import pytest
+
+from .. import exceptions, formats
+
+
+INFO = {
+    "duration": 100,
+    "formats": [
+        {"format_id": "sb0", "ext": "mhtml", "vcodec": "none", "acodec": "none"},
+        {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2",
+         "abr": 129.5, "filesize": 1_600_000},
+        {"format_id": "251", "ext": "webm", "vcodec": "none", "acodec": "opus",
+         "abr": 135.0, "filesize": 1_500_000},
+        {"format_id": "18", "ext": "mp4", "vcodec": "avc1.42001E",
+         "acodec": "mp4a.40.2", "height": 360, "tbr": 500},
+        {"format_id": "134", "ext": "mp4", "vcodec": "avc1.4d401e", "acodec": "none",
+         "height": 360, "filesize": 4_000_000},
+        {"format_id": "243", "ext": "webm", "vcodec": "vp9", "acodec": "none",
+         "height": 360, "filesize": 3_000_000},
+        {"format_id": "136", "ext": "mp4", "vcodec": "avc1.4d401f", "acodec": "none",
+         "height": 720, "filesize": 20_000_000},
+        {"format_id": "247", "ext": "webm", "vcodec": "vp9", "acodec": "none",
+         "height": 720, "filesize_approx": 15_000_000},
+        {"format_id": "398", "ext": "mp4", "vcodec": "av01.0.05M.08", "acodec": "none",
+         "height": 720, "filesize": 10_000_000},
+    ],
+}  # fmt: skip
+
+FORMATS = [fmt for fmt in map(formats.normalize, INFO["formats"]) if fmt]
+
+
+def test_normalize():
+    assert len(FORMATS) == len(INFO["formats"]) - 1
+    assert FORMATS[0] == {
+        "id": "140",
+        "ext": "m4a",
+        "height": None,
+        "vcodec": None,
+        "acodec": "mp4a.40.2",
+        "tbr": None,
+        "abr": 129.5,
+        "size": 1_600_000,
+    }
+    assert formats.size_of(FORMATS[2], duration=100) == 500 * 100 * 125
+
+
+def test_plan():
+    # muxed stream wins (no merge)
+    plan = formats.plan(FORMATS, 360, ext="mp4", duration=100, rate=1_000_000)
+    assert plan["format"] == "18" and not plan["merge"]
+    assert plan["size"] == 6_250_000
+    assert plan["seconds"] == pytest.approx(6.25)
+
+    # muxed stream in another container is skipped, merged codecs fit the container
+    plan = formats.plan(FORMATS, 360, ext="webm", duration=100)
+    assert plan["format"] == "243+251" and plan["merge"]
+    assert formats.plan(FORMATS, 360, duration=100)["format"] == "18"
+
+    # closest lower resolution, AV1 is smaller but slower to decode
+    plan = formats.plan(FORMATS, 1080, ext="mp4", rate=1_000_000)
+    assert plan["format"] == "136+140" and plan["height"] == 720
+    assert plan["size"] == 21_600_000
+
+    # resolution lowered to fit the time budget
+    plan = formats.plan(FORMATS, 720, ext="mp4", duration=100, rate=1e6, budget=10)
+    assert plan["format"] == "18"
+    plan = formats.plan(FORMATS, 720, ext="mp4", duration=100, rate=1e6, budget=1)
+    assert plan["height"] == 360
+
+    with pytest.raises(exceptions.ValidationError):
+        formats.plan(FORMATS, 480, exact=True)
+    with pytest.raises(exceptions.ValidationError):
+        formats.plan(FORMATS, 240)
+    with pytest.raises(exceptions.ValidationError):  # no Opus/Vorbis stream
+        formats.plan([fmt for fmt in FORMATS if fmt["id"] != "251"], 720, ext="webm")
+    with pytest.raises(exceptions.ValidationError):  # muxed streams only
+        formats.plan(FORMATS, 720, ext="3gpp")
+
+
+def test_load(tmp_path):
+    fetched = []
+
+    def fetch():
+        fetched.append(1)
+        return INFO
+
+    listing = formats.load("abcdefghijk", fetch, tmp_path)
+    assert listing["duration"] == 100 and listing["formats"] == FORMATS
+    assert formats.load("abcdefghijk", fetch, tmp_path) == listing
+    assert len(fetched) == 1
+
+    formats.load("abcdefghijk", fetch, tmp_path, force=True)
+    assert len(fetched) == 2
+
+
+def test_bandwidth(monkeypatch):
+    monkeypatch.setattr(formats, "observed_bandwidth", None)
+    assert formats.bandwidth() == formats.BANDWIDTH_DEFAULT
+
+    assert formats.observe(10_000_000, 2) == 5_000_000
+    assert formats.observe(1_000_000, 1) == pytest.approx(3_800_000)
+    assert formats.bandwidth() == pytest.approx(3_800_000)
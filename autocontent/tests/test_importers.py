@@ -0,0 +1,199 @@
+#!pytest -s
+
+import shutil
+from pathlib import Path
+
+import pytest
+from yt_dlp.networking.exceptions import TransportError
+from yt_dlp.utils import DownloadError, ExtractorError
+
+from .. import exceptions, ffmpeg, synthetic
+from ..importers import ImporterRegistry
+from ..state import StateStore
+from ..video import (
+    AUDIO_MODE_TRANSCODE,
+    FMT_MP4,
+    PytubeImporter,
+    Video,
+    VideoImporter,
+    YtDlpImporter,
+)
+
+
+TEST_VIDEO_ID = "EngW7tLk6R8"
+"""Test video ID (never downloaded)."""
+
+calls = []
+"""Importer calls made (importer name, kwargs)."""
+
+
+class FlakyImporter(VideoImporter):
+    name = "flaky"
+    fail = True
+    error = exceptions.VideoUnavailable("network error")
+    operations = frozenset({"download"})
+
+    def download(self, output_file=None):
+        calls.append((self.name, {"output_file": output_file}))
+        if self.fail:
+            raise self.error
+        return f"{self.name}.mp4"
+
+    def download_audio(self):
+        raise AssertionError("undeclared operation routed to")
+
+
+class SteadyImporter(FlakyImporter):
+    name = "steady"
+    fail = False
+
+
+class AudioImporter(FlakyImporter):
+    name = "audio"
+    fail = False
+    operations = frozenset({"download", "download_audio"})
+
+    def download_audio(self, bitrate=None):
+        calls.append((self.name, {"bitrate": bitrate}))
+        return f"{self.name}.mp3"
+
+
+@pytest.fixture()
+def registry(tmp_path, monkeypatch):
+    calls.clear()
+    monkeypatch.setattr(FlakyImporter, "fail", True)
+    return ImporterRegistry(
+        {"flaky": FlakyImporter, "steady": SteadyImporter, "audio": AudioImporter},
+        order=["flaky", "steady", "audio"],
+        store=StateStore(tmp_path / "state.db"),
+        failures=2,
+        cooldown=60,
+    )
+
+
+def test_failover(registry):
+    assert registry.call(TEST_VIDEO_ID, "download", output_file="x") == "steady.mp4"
+    assert [name for name, _ in calls] == ["flaky", "steady"]
+
+    flaky = registry.health("flaky", "download")
+    assert (flaky["failures"], flaky["consecutive_failures"]) == (1, 1)
+    assert flaky["error"] == "VideoUnavailable: network error"
+    assert registry.health("steady", "download")["successes"] == 1
+
+    # undeclared operations skipped, unknown kwargs dropped
+    assert registry.call(TEST_VIDEO_ID, "download_audio", force=True) == "audio.mp3"
+    assert registry.health("steady", "download_audio")["failures"] == 0
+
+    with pytest.raises(exceptions.VideoException):
+        registry.call(TEST_VIDEO_ID, "pull_clip")
+    with pytest.raises(exceptions.ValidationError):
+        ImporterRegistry({"steady": SteadyImporter}, order=["missing"])
+
+
+def test_routing(registry):
+    # steady has recorded latency, goes before unmeasured importers
+    registry.call(TEST_VIDEO_ID, "download")
+    assert registry.ranked("download") == ["steady", "flaky", "audio"]
+
+    registry.record("audio", "download", latency=0.0)
+    assert registry.ranked("download")[0] == "audio"
+
+
+def test_circuit_breaker(registry, monkeypatch):
+    registry.call(TEST_VIDEO_ID, "download")
+    assert not registry.is_open(registry.health("flaky", "download"))
+    registry.record("flaky", "download", error=exceptions.VideoUnavailable())
+
+    # two consecutive failures: flaky skipped during cooldown
+    assert registry.is_open(registry.health("flaky", "download"))
+    assert "flaky" not in registry.ranked("download")
+    calls.clear()
+    registry.call(TEST_VIDEO_ID, "download")
+    assert [name for name, _ in calls] == ["steady"]
+
+    # after cooldown: single trial, success closes the breaker
+    health = registry.health("flaky", "download")
+    assert not registry.is_open(health, now=health["opened"] + 61)
+    monkeypatch.setattr(FlakyImporter, "fail", False)
+    registry.record("flaky", "download", latency=1)
+    assert not registry.is_open(registry.health("flaky", "download"))
+    assert "flaky" in registry.ranked("download")
+
+    # every breaker open: importers are still tried in configured order
+    monkeypatch.setattr(FlakyImporter, "fail", True)
+    single = ImporterRegistry({"flaky": FlakyImporter}, store=registry.store, failures=1)
+    for _ in range(2):
+        with pytest.raises(exceptions.VideoUnavailable):
+            single.call(TEST_VIDEO_ID, "download")
+    assert single.is_open(single.health("flaky", "download"))
+    assert single.ranked("download") == ["flaky"]
+
+
+def test_unattributed_errors(registry, monkeypatch):
+    # private/removed video: no failover, importer health untouched
+    monkeypatch.setattr(FlakyImporter, "error", exceptions.ContentUnavailable())
+    with pytest.raises(exceptions.ContentUnavailable):
+        registry.call(TEST_VIDEO_ID, "download")
+    assert [name for name, _ in calls] == ["flaky"]
+
+    # connectivity: failed over, not counted against the importer
+    monkeypatch.setattr(FlakyImporter, "error", exceptions.NetworkError())
+    assert registry.call(TEST_VIDEO_ID, "download") == "steady.mp4"
+    assert registry.health("flaky", "download")["failures"] == 0
+
+
+def test_translate_error():
+    private = ExtractorError("Private video", expected=True)
+    offline = ExtractorError("Unable to download", cause=TransportError("dns"))
+    translated = [
+        YtDlpImporter.translate_error(DownloadError("x", (type(e), e, None)))
+        for e in (private, offline, TransportError("dns"), ValueError())
+    ]
+    assert [type(e) for e in translated] == [
+        exceptions.ContentUnavailable,
+        exceptions.NetworkError,
+        exceptions.NetworkError,
+        exceptions.VideoUnavailable,
+    ]
+
+
+def test_video_importers(tmp_path, monkeypatch):
+    registry = ImporterRegistry(
+        Video.importers, Video.importer_order, store=StateStore(tmp_path / "db")
+    )
+    for name in Video.importer_order:
+        Video.importers[name](video_id=TEST_VIDEO_ID)
+    assert not registry.supports("youtube-dl", "download")
+    assert registry.ranked("download") == Video.importer_order
+    assert registry.ranked("download_audio") == Video.importer_order
+    assert registry.ranked("pull_clip") == ["yt-dlp"]
+
+    # yt-dlp blocked: audio-only stream from pytube, transcoded to MP3
+    source = synthetic.write_video(tmp_path / f"stream.{FMT_MP4}", 1, size=(64, 48))
+
+    class Stream:
+        def download(self, output_path, filename):
+            return shutil.copy(source, Path(output_path) / filename)
+
+    class YouTube:
+        class streams:
+            get_audio_only = Stream
+
+        def register_on_progress_callback(self, callback):
+            pass
+
+    def blocked(self, **kwargs):
+        raise exceptions.VideoUnavailable("blocked")
+
+    monkeypatch.setattr(YtDlpImporter, "download_audio", blocked)
+    monkeypatch.setattr(PytubeImporter, "load", lambda self: YouTube())
+    output = registry.call(
+        TEST_VIDEO_ID,
+        "download_audio",
+        output_file=tmp_path / "audio",
+        mode=AUDIO_MODE_TRANSCODE,
+    )
+    assert output == tmp_path / "audio.mp3"
+    assert ffmpeg.first_stream(ffmpeg.probe(output), ffmpeg.STREAM_AUDIO)
+    assert registry.health("yt-dlp", "download_audio")["failures"] == 1
+    assert registry.health("pytube", "download_audio")["successes"] == 1
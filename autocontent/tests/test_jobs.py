@@ -0,0 +1,197 @@
+#!pytest -s
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from .. import exceptions, jobs
+from ..jobs import JobQueue, Worker
+
+
+@pytest.fixture()
+def queue(tmp_path):
+    return JobQueue(tmp_path / "state.db")
+
+
+def test_put_claim_priority(queue):
+    low = queue.put(jobs.JOB_CUT, {"source": "a"})
+    high = queue.put(jobs.JOB_CUT, {"source": "b"}, priority=10)
+    network = queue.put(jobs.JOB_DOWNLOAD, {"video_id": "c"})
+
+    assert queue.claim([jobs.JOB_CUT])["id"] == high
+    job = queue.claim([jobs.JOB_CUT])
+    assert job["id"] == low
+    assert job["params"] == {"source": "a"}
+    assert job["status"] == jobs.STATUS_RUNNING
+    assert queue.claim([jobs.JOB_CUT]) is None
+    assert queue.claim()["id"] == network
+
+
+def test_claim_cheapest_first(tmp_path):
+    path = tmp_path / "state.db"
+    with sqlite3.connect(path) as conn:  # queue created before cost estimates
+        conn.execute(jobs.SCHEMA.replace("cost REAL NOT NULL DEFAULT 0,", ""))
+
+    queue = JobQueue(path)
+    slow = queue.put(jobs.JOB_DOWNLOAD, {"video_id": "a"}, cost=60)
+    fast = queue.put(jobs.JOB_DOWNLOAD, {"video_id": "b"}, cost=5)
+    urgent = queue.put(jobs.JOB_DOWNLOAD, {"video_id": "c"}, priority=1, cost=600)
+
+    assert [queue.claim()["id"] for _ in range(3)] == [urgent, fast, slow]
+    assert jobs.estimate_cost(jobs.JOB_CUT, {"source": "a"}) == 0
+
+
+@pytest.mark.parametrize(("kind", "retries"), [("gibberish", 0), (jobs.JOB_CUT, -1)])
+def test_put_invalid(queue, kind, retries):
+    with pytest.raises(exceptions.ValidationError):
+        queue.put(kind, retries=retries)
+
+
+def test_retries(queue):
+    job_id = queue.put(jobs.JOB_CUT, retries=1)
+
+    queue.claim()
+    assert queue.fail(job_id, "boom", retry_delay=0) == jobs.STATUS_QUEUED
+    assert queue.claim()["attempts"] == 2
+    assert queue.fail(job_id, "boom", retry_delay=0) == jobs.STATUS_FAILED
+    assert queue.claim() is None
+    assert queue.get(job_id)["error"] == "boom"
+
+
+def test_retry_backoff(queue):
+    job_id = queue.put(jobs.JOB_CUT, retries=1)
+
+    queue.claim()
+    queue.fail(job_id, "boom", retry_delay=60)
+    assert queue.claim() is None
+    assert queue.pending() == 1
+
+
+def test_recover(queue):
+    job_id = queue.put(jobs.JOB_CUT)
+    job = queue.claim(worker="a", lease=10)
+
+    # live lease (other worker running the job) is left alone
+    assert queue.recover() == 0
+    assert queue.claim() is None
+
+    assert queue.heartbeat("a", lease=20) == 1
+    assert queue.heartbeat("b") == 0
+    assert queue.recover(now=job["lease"] + 1) == 0
+
+    assert queue.recover(now=job["lease"] + 11) == 1
+    assert queue.claim(worker="b")["id"] == job_id
+
+    # expired worker finishing late: its outcome is dropped, b keeps the claim
+    assert not queue.complete(job_id, "stale", worker="a")
+    assert queue.fail(job_id, "stale", worker="a") is None
+    assert queue.get(job_id)["status"] == jobs.STATUS_RUNNING
+    assert queue.complete(job_id, "fresh", worker="b")
+    assert not queue.complete(job_id, "again", worker="b")
+    assert queue.get(job_id)["result"] == "fresh"
+
+
+def test_workers_share_queue(queue):
+    started, release = threading.Event(), threading.Event()
+    runs = []
+
+    def handler(source):
+        runs.append(source)
+        started.set()
+        release.wait(5)
+
+    queue.put(jobs.JOB_CUT, {"source": "a"})
+    workers = [
+        Worker(
+            queue,
+            concurrency={jobs.RESOURCE_CPU: 1, jobs.RESOURCE_NETWORK: 0},
+            handlers={jobs.JOB_CUT: handler},
+            poll_interval=0.01,
+            lease=0.2,
+        )
+        for _ in range(2)
+    ]
+    first = threading.Thread(target=workers[0].run, kwargs={"drain": True})
+    first.start()
+    assert started.wait(5)
+
+    # second worker starts while the job runs (beyond its first lease)
+    second = threading.Thread(target=workers[1].run, kwargs={"drain": True})
+    second.start()
+    time.sleep(0.5)
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert runs == ["a"]
+    assert queue.jobs()[0]["status"] == jobs.STATUS_DONE
+
+
+def test_worker_drain(queue):
+    done = []
+    handlers = {
+        jobs.JOB_CUT: lambda source: done.append(source) or {"filepath": source},
+        jobs.JOB_DOWNLOAD: lambda video_id: 1 / 0,
+    }
+    ok = [queue.put(jobs.JOB_CUT, {"source": str(i)}) for i in range(5)]
+    bad = queue.put(jobs.JOB_DOWNLOAD, {"video_id": "x"}, retries=1)
+
+    Worker(queue, handlers=handlers, poll_interval=0.01, retry_delay=0).run(drain=True)
+
+    assert sorted(done) == [str(i) for i in range(5)]
+    assert all(queue.get(i)["status"] == jobs.STATUS_DONE for i in ok)
+    assert queue.get(ok[0])["result"] == {"filepath": "0"}
+    assert queue.get(bad)["status"] == jobs.STATUS_FAILED
+    assert queue.get(bad)["attempts"] == 2
+
+
+def test_worker_concurrency_per_resource(queue):
+    barrier = threading.Barrier(3, timeout=5)
+    handlers = {
+        jobs.JOB_CUT: lambda source: barrier.wait(),
+        jobs.JOB_DOWNLOAD: lambda video_id: barrier.wait(),
+    }
+    queue.put(jobs.JOB_CUT, {"source": "a"})
+    queue.put(jobs.JOB_CUT, {"source": "b"})
+    queue.put(jobs.JOB_DOWNLOAD, {"video_id": "c"})
+
+    Worker(
+        queue,
+        concurrency={jobs.RESOURCE_CPU: 2, jobs.RESOURCE_NETWORK: 1},
+        handlers=handlers,
+        poll_interval=0.01,
+    ).run(drain=True)
+
+    assert len(queue.jobs(status=jobs.STATUS_DONE)) == 3
+
+
+def test_worker_graceful_stop(queue):
+    started, release = threading.Event(), threading.Event()
+
+    def handler(source):
+        started.set()
+        release.wait(5)
+
+    queue.put(jobs.JOB_CUT, {"source": "a"})
+    queue.put(jobs.JOB_CUT, {"source": "b"})
+    worker = Worker(
+        queue,
+        concurrency={jobs.RESOURCE_CPU: 1, jobs.RESOURCE_NETWORK: 0},
+        handlers={jobs.JOB_CUT: handler},
+        poll_interval=0.01,
+    )
+    thread = threading.Thread(target=worker.run)
+    thread.start()
+
+    assert started.wait(5)
+    worker.stop()
+    release.set()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert [j["status"] for j in queue.jobs()] == [
+        jobs.STATUS_DONE,
+        jobs.STATUS_QUEUED,
+    ]
@@ -0,0 +1,57 @@
+#!pytest -s
+
+import pytest
+
+from .. import exceptions, keyframes, synthetic, utils
+from ..keyframes import SNAP_AFTER, SNAP_BEFORE, SNAP_NEAREST
+
+
+FRAMECRC = """#software: Lavf61.1.100
+#tb 0: 1/12288
+#media_type 0: video
+0,          0,          0,      512,     1203, 0x00adc398
+0,        512,        512,      512,      188, 0x4c536308, F=0x0
+0,      24576,      24576,      512,     1289, 0x033b148f
+0,      25088,      25088,      512,      140, 0xbe1e5281, F=0x0
+0,      61440,      61440,      512,     1214, 0xf1220fec, F=0x3
+"""
+
+
+def test_parse_framecrc():
+    assert keyframes.parse_framecrc(FRAMECRC) == [0, 2, 5]
+
+    with pytest.raises(exceptions.VideoException):
+        keyframes.parse_framecrc("0,  0,  0,  512,  1203, 0x00adc398")
+
+
+def test_snap():
+    index = [0.0, 2.0, 5.0]
+
+    assert keyframes.snap(index, 3) == 2
+    assert keyframes.snap(index, 3, SNAP_AFTER) == 5
+    assert keyframes.snap(index, 3, SNAP_NEAREST) == 2
+    assert keyframes.snap(index, 4, SNAP_NEAREST) == 5
+    assert keyframes.snap(index, 2, SNAP_BEFORE) == keyframes.snap(index, 2, SNAP_AFTER)
+    assert keyframes.snap(index, 7, SNAP_AFTER) == 5
+
+    assert keyframes.widen(index, 1, 3) == (0, 5)
+    assert keyframes.widen(index, 3, 6, end=8) == (2, 8)
+    assert keyframes.widen(index, 3, 6) == (2, 6)
+
+    with pytest.raises(exceptions.ValidationError):
+        keyframes.snap(index, 1, "unknown")
+    with pytest.raises(exceptions.ValidationError):
+        keyframes.snap([], 1)
+
+
+def test_load(tmp_path):
+    path = synthetic.write_video(tmp_path / f"{synthetic.SYNTHETIC_VIDEO_ID}.mp4", 12)
+    index = keyframes.load(path)
+
+    # x264 default GOP (250 frames)
+    assert index == pytest.approx([0, 250 / synthetic.VIDEO_FPS], abs=0.01)
+
+    cache = utils.sidecar_path(path, keyframes.SIDECAR_KEYFRAMES)
+    mtime = cache.stat().st_mtime_ns
+    assert keyframes.load(path) == index
+    assert cache.stat().st_mtime_ns == mtime
@@ -0,0 +1,129 @@
+#!pytest -s
+
+import threading
+import time
+
+import pytest
+
+from .. import exceptions
+from ..pipeline import Pipeline, Stage, is_up_to_date, map_concurrently
+
+
+def test_results_passed_between_stages():
+    pipeline = Pipeline(
+        [
+            Stage("sum", lambda a, b: a + b, deps=["a", "b"]),
+            Stage("a", lambda: 1),
+            Stage("b", lambda: 2),
+        ]
+    )
+
+    assert pipeline.order().index("sum") == 2
+    assert pipeline.run() == {"a": 1, "b": 2, "sum": 3}
+
+
+def test_independent_stages_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    pipeline = Pipeline(
+        [
+            Stage("video", lambda: barrier.wait() is not None),
+            Stage("subs", lambda: barrier.wait() is not None),
+        ]
+    )
+
+    assert pipeline.run(workers=2) == {"video": True, "subs": True}
+
+
+@pytest.mark.parametrize(
+    "stages",
+    [
+        [Stage("a", lambda b: b, deps=["b"]), Stage("b", lambda a: a, deps=["a"])],
+        [Stage("a", lambda x: x, deps=["x"])],
+    ],
+)
+def test_invalid_graph(stages):
+    with pytest.raises(exceptions.ValidationError):
+        Pipeline(stages).run()
+
+
+def test_duplicate_stage():
+    with pytest.raises(exceptions.ValidationError):
+        Pipeline([Stage("a", lambda: 1), Stage("a", lambda: 2)])
+
+
+def test_failure_propagates():
+    def fail():
+        raise ValueError("boom")
+
+    calls = []
+    pipeline = Pipeline(
+        [
+            Stage("a", fail),
+            Stage("b", lambda a: calls.append(a), deps=["a"]),
+        ]
+    )
+
+    with pytest.raises(ValueError):
+        pipeline.run()
+    assert not calls
+
+
+def test_up_to_date_stages_skipped(tmp_path):
+    source, derived = tmp_path / "source.txt", tmp_path / "derived.txt"
+    calls = []
+
+    def produce(path, text):
+        def func(**_):
+            calls.append(path.name)
+            path.write_text(text)
+            return text
+
+        return func
+
+    def build():
+        return Pipeline(
+            [
+                Stage(
+                    "source",
+                    produce(source, "a"),
+                    outputs=[source],
+                    load=source.read_text,
+                ),
+                Stage(
+                    "derived",
+                    produce(derived, "b"),
+                    deps=["source"],
+                    outputs=[derived],
+                    load=derived.read_text,
+                ),
+            ]
+        )
+
+    assert build().run() == {"source": "a", "derived": "b"}
+    assert build().run() == {"source": "a", "derived": "b"}
+    assert calls == ["source.txt", "derived.txt"]
+
+    time.sleep(0.01)
+    source.write_text("a")
+    build().run()
+    assert calls[2:] == ["derived.txt"]
+
+    build().run(force=True)
+    assert calls[3:] == ["source.txt", "derived.txt"]
+
+
+def test_is_up_to_date(tmp_path):
+    a, b = tmp_path / "a", tmp_path / "b"
+
+    assert not is_up_to_date([a])
+    a.touch()
+    assert is_up_to_date([a])
+    time.sleep(0.01)
+    b.touch()
+    assert not is_up_to_date([a], [b])
+    assert is_up_to_date([b], [a])
+
+
+def test_map_concurrently():
+    assert map_concurrently(lambda x: x * 2, [1, 2, 3], workers=3) == [2, 4, 6]
+    assert map_concurrently(lambda x: x, []) == []
@@ -0,0 +1,66 @@
+#!pytest -s
+
+import json
+import threading
+
+import pytest
+
+from .. import profiling
+
+
+@pytest.fixture()
+def profiler():
+    yield profiling.enable()
+    profiling.disable()
+
+
+@profiling.timed("work", profiling.CAT_VIDEO)
+def work(x):
+    return x * 2
+
+
+def test_disabled():
+    assert profiling.active() is None
+    assert profiling.span("x") is profiling.NULL_SPAN
+    with profiling.span("x"):
+        pass
+    assert work(2) == 4
+
+
+def test_spans(profiler):
+    with profiling.span("outer", profiling.CAT_ENCODE, size=1):
+        assert work(2) == 4
+    with pytest.raises(ValueError):
+        with profiling.span("failing"):
+            raise ValueError()
+
+    inner, outer, failing = profiler.events
+    assert (inner["name"], inner["cat"]) == ("work", profiling.CAT_VIDEO)
+    assert (outer["name"], outer["args"]) == ("outer", {"size": 1})
+    assert outer["ts"] <= inner["ts"]
+    assert outer["ts"] + outer["dur"] >= inner["ts"] + inner["dur"]
+    assert failing["args"] == {"error": "ValueError"}
+
+
+def test_trace_and_summary(profiler, tmp_path):
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    work(1)
+
+    path = profiler.save(tmp_path / "trace.json")
+    with open(path) as f:
+        trace = json.load(f)
+
+    spans = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert len(spans) == 4
+    assert all({"ts", "dur", "pid", "tid"} <= set(e) for e in spans)
+    assert len([e for e in trace["traceEvents"] if e["ph"] == "M"]) >= 2
+
+    [row] = profiler.summary()
+    assert row["name"] == "work"
+    assert row["count"] == 4
+    assert row["total"] == pytest.approx(row["mean"] * 4)
+    profiler.print_summary()
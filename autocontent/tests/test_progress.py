@@ -0,0 +1,117 @@
+#!pytest -s
+
+import io
+import json
+import threading
+
+import pytest
+from rich.console import Console
+
+from .. import progress
+from ..progress import EVENT_DONE, EVENT_ERROR, EVENT_PROGRESS, EVENT_START
+
+
+@pytest.fixture()
+def events():
+    collected = []
+    progress.enable([collected.append])
+    yield collected
+    progress.disable()
+
+
+def test_task():
+    task = progress.Task("download:x")
+    task.update(100, 1000, file="video", speed=50)
+    task.update(10, 100, file="audio", speed=50)
+
+    assert (task.done, task.total) == (110, 1100)
+    assert task.eta == pytest.approx(990 / 50)
+
+    task.update(20, None, file="extra")
+    assert task.total is None and task.eta is None
+
+    task.enter("Merger")
+    task.enter(None)
+    assert set(task.stages) == {progress.STAGE_DOWNLOAD, "Merger"}
+
+
+def test_track(events):
+    with progress.track("download:a", "a") as tracker:
+        hook = tracker.ytdlp_hook("download:a")
+        hook({"status": "downloading", "downloaded_bytes": 50, "total_bytes": 100})
+        hook({"status": "finished", "downloaded_bytes": 100, "filename": "a.f1"})
+        tracker.ytdlp_postprocessor_hook("download:a")(
+            {"status": "started", "postprocessor": "Merger"}
+        )
+
+    with pytest.raises(ValueError):
+        with progress.track("download:b"):
+            raise ValueError("boom")
+
+    assert [e["event"] for e in events] == [
+        EVENT_START,
+        EVENT_PROGRESS,
+        EVENT_PROGRESS,
+        progress.EVENT_STAGE,
+        EVENT_DONE,
+        EVENT_START,
+        EVENT_ERROR,
+    ]
+    done = events[4]
+    assert done["bytes"] == 150  # file name unknown on the first update
+    assert set(done["stages"]) == {progress.STAGE_DOWNLOAD, "Merger"}
+    assert events[-1]["error"] == "boom"
+
+    progress.disable()
+    with progress.track("download:c") as tracker:
+        assert tracker is None
+
+
+def test_concurrent_totals():
+    tracker = progress.Tracker()
+    barrier = threading.Barrier(4)
+
+    def download(i):
+        key = f"download:{i}"
+        tracker.start(key)
+        barrier.wait()
+        for done in range(0, 1001, 100):
+            tracker.update(key, done, 1000, speed=100)
+        if i:
+            tracker.finish(key)
+
+    threads = [threading.Thread(target=download, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    totals = tracker.totals()
+    assert totals["tasks"] == 4 and totals["active"] == 1
+    assert totals["bytes"] == 4000 and totals["speed"] == 100
+    assert totals["eta"] == 0
+
+
+def test_renderers():
+    stream = io.StringIO()
+    tracker = progress.Tracker([progress.JsonLinesRenderer(stream, interval=60)])
+    tracker.start("download:a")
+    for done in range(10):
+        tracker.update("download:a", done, 10)
+    tracker.finish("download:a")
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["event"] for line in lines] == [
+        EVENT_START,
+        EVENT_PROGRESS,
+        EVENT_DONE,
+    ]
+
+    console = Console(file=io.StringIO(), force_terminal=False)
+    with progress.RichRenderer(console) as renderer:
+        tracker = progress.Tracker([renderer])
+        tracker.start("download:a", "a")
+        tracker.update("download:a", 5, 10)
+        tracker.finish("download:a")
+        assert renderer.progress.tasks[0].completed == 5
+    assert "a (done)" in console.file.getvalue()
@@ -0,0 +1,44 @@
+#!pytest -s
+
+import pytest
+from moviepy.editor import VideoFileClip
+
+from .. import proxy, video
+from ..edl import OP_CLIP, OP_SPEED
+
+
+@pytest.fixture()
+def source(synthetic_source):
+    """Synthetic 640x480 video in a temporary video directory."""
+
+    return synthetic_source(9, size=(640, 480))
+
+
+def test_make_proxy(source):
+    path = proxy.make_proxy(source.filepath)
+
+    with VideoFileClip(str(path)) as clip:
+        assert tuple(clip.size) == (320, proxy.PROXY_HEIGHT)
+        assert clip.duration == pytest.approx(9, abs=0.1)
+
+    mtime = path.stat().st_mtime_ns
+    assert proxy.make_proxy(source.filepath) == path
+    assert path.stat().st_mtime_ns == mtime
+    assert not list(path.parent.glob("*.part"))
+
+
+def test_proxy_workflow(source):
+    preview = source.proxy_video()
+    assert preview.is_proxy and preview.edl.source == source.filepath
+
+    clip = preview.clip(1, 8)
+    fast = clip.modify_speed(factor=2)
+    assert fast.filepath.parent == video.DEFAULT_DIR / proxy.PROXY_DIR_NAME
+    assert [edit["op"] for edit in fast.edl.edits] == [OP_CLIP, OP_SPEED]
+    assert not source.edl.edits
+
+    final = fast.render_edits()
+    assert final.filepath.parent == video.DEFAULT_DIR
+    with VideoFileClip(str(final.filepath)) as clip:
+        assert tuple(clip.size) == (640, 480)
+        assert clip.duration == pytest.approx(3.5, abs=0.1)
@@ -0,0 +1,104 @@
+#!pytest -s
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from .. import readers, synthetic, video
+from ..video import FMT_MP4, PROFILE_DRAFT, Video
+
+
+PROC_SELF = Path("/proc/self")
+
+pytestmark = pytest.mark.skipif(
+    not PROC_SELF.is_dir(), reason="fd/process accounting needs /proc"
+)
+
+
+def open_fds() -> int:
+    return len(os.listdir(PROC_SELF / "fd"))
+
+
+def child_processes() -> int:
+    return sum(
+        len((task / "children").read_text().split())
+        for task in (PROC_SELF / "task").iterdir()
+    )
+
+
+@pytest.fixture()
+def sources(synthetic_source):
+    """Three short synthetic videos in a temporary video directory."""
+
+    return [
+        synthetic_source(1, size=(160, 120), name=f"{synthetic.SYNTHETIC_VIDEO_ID}-{i}")
+        for i in range(3)
+    ]
+
+
+def test_reader_pool(sources):
+    with readers.ReaderPool(max_open=2) as pool:
+        with pool.reader(sources[0].filepath) as first:
+            # leased: a concurrent lease gets its own (temporary) reader
+            with pool.reader(sources[0].filepath) as second:
+                assert second is not first
+            assert len(pool) == 1
+
+        with pool.reader(sources[0].filepath) as again:
+            assert again is first
+        assert (pool.hits, pool.misses) == (1, 2)
+
+        for source in sources[1:]:
+            with pool.reader(source.filepath):
+                pass
+        assert len(pool) == 2 and pool.evictions == 1
+        assert first.reader is None  # least recently used reader closed
+
+    assert len(pool) == 0
+
+
+def test_bound(sources):
+    with readers.ReaderPool(max_open=1) as pool:
+        leased = []
+
+        def lease(source):
+            with pool.reader(source.filepath) as clip:
+                leased.append(clip)
+
+        with pool.reader(sources[0].filepath) as first:
+            # every slot leased: other sources and temporary readers wait
+            threads = [threading.Thread(target=lease, args=(s,)) for s in sources[:2]]
+            for thread in threads:
+                thread.start()
+            threads[0].join(timeout=1)
+            assert not leased and pool._open == 1
+
+        for thread in threads:
+            thread.join()
+        assert len(leased) == 2 and pool._open == len(pool) == 1
+
+
+def test_no_leaks(sources, monkeypatch):
+    pool = readers.ReaderPool(max_open=2)
+    monkeypatch.setattr(Video, "reader_pool", pool)
+    fds, children = open_fds(), child_processes()
+
+    for i in range(100):
+        source = sources[i // 10 % len(sources)]
+        target = video.DEFAULT_DIR / f"{synthetic.SYNTHETIC_VIDEO_ID}-out.{FMT_MP4}"
+        if i % 2:
+            source.modify_speed(
+                2, output_file=target, force=True, profile=PROFILE_DRAFT
+            )
+        else:
+            source.clip(0, 0.5, output_file=target, force=True, profile=PROFILE_DRAFT)
+        # at most max_open readers, each with video and audio ffmpeg processes
+        assert len(pool) <= 2
+        assert child_processes() <= children + 2 * 2
+
+    assert pool.hits > pool.misses
+    pool.close()
+    assert child_processes() == children
+    assert open_fds() == fds
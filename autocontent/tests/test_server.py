@@ -0,0 +1,111 @@
+#!pytest -s
+
+import json
+import threading
+import time
+import urllib.request
+
+import pytest
+
+from .. import bench, exceptions, jobs, readers, server
+from ..video import PROFILE_DRAFT, Video
+
+
+@pytest.fixture()
+def api():
+    running = server.start((server.HOST_DEFAULT, 0))
+    yield running
+    running.shutdown()
+    running.server_close()
+
+
+def test_operations(api, tmp_path, synthetic_source, monkeypatch):
+    fixtures = bench.Fixtures(duration=1, cues=50, directory=tmp_path)
+    target = tmp_path / "chunk.srt"
+    params = {"source": str(fixtures.transcript), "t1": 0, "t2": 30}
+
+    result = server.request(
+        api.url, server.OP_CHUNK, {**params, "fmt": "srt", "output_file": str(target)}
+    )
+    assert result == {"filepath": str(target)} and target.is_file()
+
+    with pytest.raises(exceptions.Error, match="404"):
+        server.request(api.url, "unknown")
+    with pytest.raises(exceptions.Error, match="400"):
+        server.request(api.url, server.OP_CHUNK, {**params, "gibberish": 1})
+    with pytest.raises(exceptions.Error, match="500"):
+        server.request(api.url, server.OP_CHUNK, {**params, "output_file": str(target)})
+
+    # readers stay open between requests
+    monkeypatch.setattr(Video, "reader_pool", readers.POOL)
+    source = synthetic_source(2, size=(160, 120)).filepath
+    hits = readers.POOL.hits
+    for _ in range(2):
+        server.request(
+            api.url,
+            jobs.JOB_CUT,
+            {"source": str(source), "t1": 0, "t2": 1, "force": True}
+            | {"profile": PROFILE_DRAFT},
+        )
+    assert readers.POOL.hits > hits
+
+    with urllib.request.urlopen(f"{api.url}/status") as response:
+        status = json.load(response)
+    assert status["requests"] == 5 and status["failed"] == 2
+    assert status["running"] == status["queued"] == 0
+    assert server.OP_CHUNK in status["operations"]
+
+
+def test_queueing():
+    release, running = threading.Event(), threading.Semaphore(0)
+
+    def slow() -> str:
+        running.release()
+        release.wait()
+        return "ok"
+
+    api = server.start(
+        (server.HOST_DEFAULT, 0),
+        concurrency={jobs.RESOURCE_CPU: 1},
+        handlers={jobs.JOB_CUT: slow},
+    )
+    results = []
+    clients = [
+        threading.Thread(
+            target=lambda: results.append(server.request(api.url, jobs.JOB_CUT))
+        )
+        for _ in range(3)
+    ]
+    try:
+        for client in clients:
+            client.start()
+        running.acquire()
+        while api.status()["queued"] < 2:
+            time.sleep(0.01)
+        assert api.status()["running"] == 1
+
+        release.set()
+        for client in clients:
+            client.join()
+        assert results == ["ok"] * 3
+    finally:
+        release.set()
+        api.shutdown()
+        api.server_close()
+
+
+def test_parameter_errors():
+    def measure(value) -> int:
+        return len(value)  # TypeError for numbers: handler bug, not a bad request
+
+    api = server.start((server.HOST_DEFAULT, 0), handlers={jobs.JOB_CUT: measure})
+    try:
+        assert server.request(api.url, jobs.JOB_CUT, {"value": "abc"}) == 3
+        with pytest.raises(exceptions.Error, match="400"):
+            server.request(api.url, jobs.JOB_CUT, {"other": "abc"})
+        with pytest.raises(exceptions.Error, match="500.*TypeError"):
+            server.request(api.url, jobs.JOB_CUT, {"value": 1})
+        assert api.status()["failed"] == 2
+    finally:
+        api.shutdown()
+        api.server_close()
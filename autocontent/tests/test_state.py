@@ -0,0 +1,135 @@
+#!pytest -s
+
+import time
+
+import pytest
+
+from ..pipeline import Pipeline, Stage, recorded_stages
+from ..state import (
+    STATE_CACHED,
+    STATE_FAILED,
+    STATE_PENDING,
+    STATE_STALE,
+    StateStore,
+    params_key,
+)
+
+
+TEST_ENTITY_ID = "EngW7tLk6R8"
+"""Test entity ID (video)."""
+
+
+@pytest.fixture()
+def store(tmp_path):
+    return StateStore(tmp_path / "state.db")
+
+
+def test_params_key():
+    assert params_key({"a": 1, "b": 2}) == params_key({"b": 2, "a": 1})
+    assert params_key({"a": 1}) != params_key({"a": 2})
+    assert params_key(None) == params_key({})
+
+
+def test_memoize(store, tmp_path):
+    source, target = tmp_path / "source", tmp_path / "target"
+    source.write_text("source")
+    calls = []
+
+    def compute():
+        calls.append(1)
+        target.write_text("target")
+        return [1, 2]
+
+    def run(**kwargs):
+        return store.memoize(
+            TEST_ENTITY_ID,
+            "op",
+            {"x": 1},
+            compute,
+            inputs=[source],
+            outputs=[target],
+            **kwargs,
+        )
+
+    assert run() == [1, 2]
+    assert run() == [1, 2]
+    assert run(load=target.read_text) == "target"
+    assert len(calls) == 1
+
+    time.sleep(0.01)
+    source.write_text("changed")
+    assert store.status(TEST_ENTITY_ID)[0]["state"] == STATE_STALE
+    run()
+    assert len(calls) == 2
+
+    target.unlink()
+    run()
+    assert len(calls) == 3
+
+    run(force=True)
+    assert len(calls) == 4
+    assert store.status(TEST_ENTITY_ID)[0]["state"] == STATE_CACHED
+
+
+def test_memoize_failure(store):
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        store.memoize(TEST_ENTITY_ID, "op", None, fail)
+
+    [record] = store.status(TEST_ENTITY_ID)
+    assert record["state"] == STATE_FAILED
+    assert "boom" in record["error"]
+    assert store.memoize(TEST_ENTITY_ID, "op", None, lambda: 1) == 1
+
+
+def test_classify(store):
+    assert store.classify(None) == STATE_PENDING
+
+    store.start(TEST_ENTITY_ID, "op", None)
+    assert store.classify(store.get(TEST_ENTITY_ID, "op", None)) == STATE_PENDING
+
+    store.finish(TEST_ENTITY_ID, "op", None)
+    assert store.classify(store.get(TEST_ENTITY_ID, "op", None)) == STATE_CACHED
+
+    store.forget(TEST_ENTITY_ID)
+    assert store.records() == []
+
+
+def test_pipeline_resumes_from_store(store, tmp_path):
+    output = tmp_path / "output"
+    calls = []
+
+    def produce():
+        calls.append("a")
+        output.write_text("a")
+        return "a"
+
+    def derive(a):
+        calls.append("b")
+        return {"derived": a}
+
+    def fail(b):
+        raise ValueError("boom")
+
+    def build(last=fail):
+        return Pipeline(
+            [
+                Stage("a", produce, outputs=[output], load=output.read_text),
+                Stage("b", derive, deps=["a"], json_result=True),
+                Stage("c", last, deps=["b"]),
+            ],
+            store=store,
+            video_id=TEST_ENTITY_ID,
+        )
+
+    assert recorded_stages(store, TEST_ENTITY_ID) == []
+    with pytest.raises(ValueError):
+        build().run()
+    assert recorded_stages(store, TEST_ENTITY_ID) == ["a", "b", "c"]
+    assert build().status() == {"a": STATE_CACHED, "b": STATE_CACHED, "c": STATE_FAILED}
+
+    results = build(last=lambda b: b["derived"] * 2).run()
+    assert results == {"a": "a", "b": {"derived": "a"}, "c": "aa"}
+    assert calls == ["a", "b"]
@@ -4,6 +4,7 @@ import pytest
 import random
 from string import ascii_lowercase
 
+from ..exceptions import ValidationError
 from ..subs import Subs
 from ..utils import print
 
@@ -19,8 +20,8 @@ SAMPLE_TRANSCRIPT = [
 
 
 def test_init():
-    sssss = Subs(transcript=[{"text": 123, "start": 123, "duration": 123}])
-    print(sssss.transcript)
+    subs = Subs(transcript=[{"text": 123, "start": 123, "duration": 123}])
+    assert subs.transcript[0]["text"] == "123"
 
 
 @pytest.mark.parametrize(("lines"), list(range(1, 10)))
@@ -43,3 +44,34 @@ def test_format_compressed():
     text = Subs.format_compressed([{"text": "abc"}, {"text": "def"}, {"text": "ghi"}])
 
     assert text == "0: abc\n1: def\n2: ghi"
+
+
+def test_retime_intervals():
+    subs = Subs(
+        transcript=[
+            {"text": "a", "start": 0.5, "duration": 1.0},  # kept as is
+            {"text": "b", "start": 2.5, "duration": 1.0},  # head removed
+            {"text": "c", "start": 4.2, "duration": 0.5},  # removed
+            {"text": "d", "start": 5.5, "duration": 3.0},  # spans a removed part
+        ]
+    )
+    retimed = subs.retime(intervals=[[0, 2], [3, 4], [6, 7], [8, 10]])
+
+    assert [(r["text"], r["start"], r["duration"]) for r in retimed.transcript] == [
+        ("a", 0.5, 1.0),
+        ("b", 2.0, 0.5),
+        ("d", 3.0, 1.5),
+    ]
+    assert subs.transcript[1]["start"] == 2.5
+
+
+def test_retime_factor():
+    retimed = Subs(transcript=SAMPLE_TRANSCRIPT).retime(factor=2)
+
+    assert [r["start"] for r in retimed.transcript] == [i / 2 for i in range(10)]
+    assert all(r["duration"] == 0.5 for r in retimed.transcript)
+
+    with pytest.raises(ValidationError):
+        Subs(transcript=SAMPLE_TRANSCRIPT).retime()
+    with pytest.raises(ValidationError):
+        Subs(transcript=SAMPLE_TRANSCRIPT).retime(factor=0)
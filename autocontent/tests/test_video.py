@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
 import pytest
 from pathlib import Path
 
-from .. import exceptions, utils, video
+from moviepy.editor import VideoFileClip
+
+from .. import exceptions, ffmpeg, progress, synthetic, utils, video
+from ..importers import ImporterRegistry
+from ..state import StateStore
+from ..subs import Subs
 from ..video import Video, YtDlpImporter, FMT_MP4
 
 
@@ -36,6 +42,14 @@ def use_dir():
     cleanup()
 
 
+@pytest.fixture()
+def synthetic_video(use_dir) -> Video:
+    """Short test pattern video in the temporary directory."""
+
+    path = video.DEFAULT_DIR / f"{synthetic.SYNTHETIC_VIDEO_ID}.{FMT_MP4}"
+    return Video(filepath=synthetic.write_video(path, 6))
+
+
 @pytest.fixture()
 def debug_json_opts():
     return {
@@ -174,6 +188,65 @@ def test_download_audio(use_dir, debug_json_opts):
     assert bool(info["audio_channels"])
 
 
+def test_pull_clip(use_dir, media_server, ffmpeg_on_path):
+    directory, base_url, ranges = media_server
+    source = synthetic.write_video(
+        directory / f"{synthetic.SYNTHETIC_VIDEO_ID}.{FMT_MP4}", 60
+    )
+    target = video.DEFAULT_DIR / f"{synthetic.SYNTHETIC_VIDEO_ID}-clip-40.0-45.0.mp4"
+
+    importer = YtDlpImporter(video_id=synthetic.SYNTHETIC_VIDEO_ID)
+    importer.url = f"{base_url}/{source.name}"
+    events = []
+    progress.enable([events.append])
+    try:
+        path = importer.pull_clip(40, 45)
+    finally:
+        progress.disable()
+
+    assert path == target
+    assert events[0]["event"] == progress.EVENT_START
+    assert events[-1]["event"] == progress.EVENT_DONE
+    assert events[-1]["bytes"] == target.stat().st_size
+    assert Video(filepath=path).duration == pytest.approx(5, abs=0.2)
+    # seeked into the file instead of reading it from the beginning
+    assert max(start for start, _ in ranges) > source.stat().st_size // 3
+
+    with pytest.raises(exceptions.ValidationError):
+        importer.pull_clip(5, 1, output_file=target, force=True)
+
+
+def test_audio_options(tmp_path):
+    target = tmp_path / f"{TEST_VIDEO_ID}.mp3"
+    transcode = YtDlpImporter.construct_audio_options(
+        target, 128, video.AUDIO_MODE_TRANSCODE, False, {}
+    )
+    remux = YtDlpImporter.construct_audio_options(
+        target, 128, video.AUDIO_MODE_REMUX, True, {"quiet": False}
+    )
+
+    assert transcode["format"] == remux["format"] == video.AUDIO_FORMAT_SELECTOR
+    assert transcode["postprocessors"][0]["preferredcodec"] == video.AUDIO_FMT_MP3
+    assert transcode["postprocessors"][0]["preferredquality"] == "128"
+    assert remux["postprocessors"] == [
+        {"key": "FFmpegExtractAudio", "preferredcodec": "best"}
+    ]
+    assert "audioformat" not in remux and remux["overwrites"]
+    assert transcode["nopostoverwrites"] and not remux["nopostoverwrites"]
+    assert remux["outtmpl"] == str(tmp_path / TEST_VIDEO_ID)
+    assert not remux["quiet"]
+
+    with pytest.raises(exceptions.ValidationError):
+        YtDlpImporter.construct_audio_options(target, 128, "unknown", False, {})
+
+    # remux: existing file of any codec-dependent extension, checked pre-download
+    target.with_suffix(f".{video.AUDIO_FMT_OPUS}").touch()
+    with pytest.raises(Exception, match="already exists"):
+        YtDlpImporter(video_id=TEST_VIDEO_ID).download_audio(
+            target, mode=video.AUDIO_MODE_REMUX
+        )
+
+
 @pytest.mark.parametrize(
     (
         "source",
@@ -195,3 +268,163 @@ def test_extract_video_id(source, expected):
             Video.extract_video_id(source)
     else:
         assert Video.extract_video_id(source) == expected
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json"])
+def test_load_cut_list(tmp_path, fmt):
+    path = tmp_path / f"cuts.{fmt}"
+    if fmt == "csv":
+        path.write_text("t1,t2,name\n0,1.5,intro\n00:00:02,00:00:04,\n")
+    else:
+        records = [{"t1": 0, "t2": 1.5, "name": "intro"}, {"t1": "2", "t2": 4}]
+        path.write_text(json.dumps(records))
+
+    assert Video.load_cut_list(path) == [
+        {"t1": 0, "t2": 1.5, "name": "intro"},
+        {"t1": 2, "t2": 4, "name": None},
+    ]
+
+    path.write_text(json.dumps([{"t1": 3, "t2": 1}]) if fmt == "json" else "t1,t2\n3,1")
+    with pytest.raises(exceptions.ValidationError):
+        Video.load_cut_list(path)
+
+
+def test_clip_many(synthetic_video):
+    cuts = [
+        {"t1": 1.0, "t2": 2.5, "name": "first"},
+        {"t1": 3.0, "t2": 5.0, "name": None},
+        {"t1": 2.0, "t2": 3.0, "name": "overlapping"},
+    ]
+    subs = Subs(transcript=synthetic.transcript(3, duration=1.5, gap=0.5))
+
+    clips = synthetic_video.clip_many(cuts, subs=subs)
+
+    names = [clip.filepath.name for clip in clips]
+    assert names == [
+        f"{synthetic.SYNTHETIC_VIDEO_ID}-first.mp4",
+        f"{synthetic.SYNTHETIC_VIDEO_ID}-clip-3.0-5.0.mp4",
+        f"{synthetic.SYNTHETIC_VIDEO_ID}-overlapping.mp4",
+    ]
+    for clip, cut in zip(clips, cuts):
+        with VideoFileClip(str(clip.filepath)) as vid:
+            assert vid.duration == pytest.approx(cut["t2"] - cut["t1"], abs=0.1)
+            assert vid.audio is not None
+
+    first = Subs(filepath=clips[0].filepath.with_suffix(".json")).transcript
+    assert [(r["start"], r["duration"]) for r in first] == [(1.0, 0.5)]
+
+    with pytest.raises(Exception):
+        synthetic_video.clip_many(cuts[:1])
+    with pytest.raises(exceptions.ValidationError, match="Duplicate"):
+        synthetic_video.clip_many([{**cut, "name": "same"} for cut in cuts], force=True)
+    assert not (video.DEFAULT_DIR / f"{synthetic.SYNTHETIC_VIDEO_ID}-same.mp4").exists()
+    assert synthetic_video.clip_many(cuts[:1], strip_sound=True, force=True)
+
+
+def test_probe(synthetic_video):
+    assert synthetic_video.duration == pytest.approx(6, abs=0.1)
+    assert synthetic_video.has_audio
+    assert Video.check_video_file(synthetic_video.filepath, validate=True)
+
+    silent = Video(
+        filepath=synthetic.write_video(
+            video.DEFAULT_DIR / f"{synthetic.SYNTHETIC_VIDEO_ID}-silent.mp4",
+            1,
+            audio=False,
+        )
+    )
+    assert not silent.has_audio
+
+    with pytest.raises(exceptions.ValidationError):
+        synthetic_video.clip_many([{"t1": 7.0, "t2": 8.0, "name": None}])
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes are POSIX only")
+def test_clip_many_fanout(synthetic_video, monkeypatch):
+    # ffmpeg encoding outputs sequentially: one encoder process per clip
+    monkeypatch.setattr(ffmpeg, "version", lambda: (6, 1))
+    cuts = [{"t1": 1.0, "t2": 2.5, "name": "a"}, {"t1": 3.0, "t2": 5.0, "name": "b"}]
+
+    for strip_sound in (False, True):
+        clips = synthetic_video.clip_many(cuts, strip_sound=strip_sound, force=True)
+        for clip, cut in zip(clips, cuts):
+            with VideoFileClip(str(clip.filepath)) as vid:
+                assert vid.duration == pytest.approx(cut["t2"] - cut["t1"], abs=0.1)
+                assert (vid.audio is None) == strip_sound
+
+    # failed encoder stops the decoding, failed decoding stops the encoders
+    source = ["-i", str(synthetic_video.filepath)]
+    target = video.DEFAULT_DIR / "fanout.mp4"
+    with pytest.raises(exceptions.VideoException, match="ffmpeg failed"):
+        ffmpeg.run_fanout(source, [[]], ["-c:v", "unknown"], [target])
+    with pytest.raises(exceptions.VideoException, match="ffmpeg failed"):
+        ffmpeg.run_fanout(["-i", "missing.mp4"], [[]], [], [target])
+    assert not target.exists()
+
+
+def test_clip_many_snap(synthetic_video):
+    assert synthetic_video.keyframe_index() == [0]
+    assert synthetic_video.snap_to_keyframe("00:00:03") == 0
+
+    (clip,) = synthetic_video.clip_many(
+        [{"t1": 1.0, "t2": 2.0, "name": None}], snap=True
+    )
+    assert clip.filepath.name.startswith(f"{synthetic.SYNTHETIC_VIDEO_ID}-clip-0.0-")
+    assert clip.duration == pytest.approx(6, abs=0.1)
+
+
+def test_encode_profiles(monkeypatch):
+    assert Video.resolve_profile() == video.PROFILE_DEFAULT
+    monkeypatch.setitem(utils.config.data, video.CONFIG_ENCODE_PROFILE, "draft")
+    assert Video.resolve_profile() == video.PROFILE_DRAFT
+    assert Video.resolve_profile(video.PROFILE_PUBLISH) == video.PROFILE_PUBLISH
+
+    with pytest.raises(exceptions.ValidationError):
+        Video.resolve_profile("unknown")
+
+    kwargs = Video.write_kwargs(video.PROFILE_DRAFT)
+    assert kwargs["preset"] == "ultrafast"
+    assert kwargs["ffmpeg_params"] == ["-crf", "30"]
+    assert "-b:a" not in Video.encode_args(video.PROFILE_DRAFT, with_audio=False)
+
+    overrides = {video.PROFILE_DRAFT: {"threads": 2, "crf": 28}}
+    monkeypatch.setitem(utils.config.data, video.CONFIG_ENCODE_OVERRIDES, overrides)
+    kwargs = Video.write_kwargs()
+    assert (kwargs["threads"], kwargs["ffmpeg_params"]) == (2, ["-crf", "28"])
+    args = Video.encode_args()
+    assert args[args.index("-threads") + 1] == "2"
+    assert Video.write_kwargs(video.PROFILE_PUBLISH)["threads"] == 0
+
+    overrides[video.PROFILE_DRAFT] = {"thread": 2}
+    with pytest.raises(exceptions.ValidationError):
+        Video.encode_args()
+
+
+def test_clip_profiles(synthetic_video):
+    sizes = {}
+    for profile in (video.PROFILE_DRAFT, video.PROFILE_PUBLISH):
+        clip = synthetic_video.clip(
+            0,
+            3,
+            output_file=video.DEFAULT_DIR / f"{synthetic.SYNTHETIC_VIDEO_ID}-{profile}",
+            profile=profile,
+        )
+        sizes[profile] = clip.filepath.stat().st_size
+
+    assert sizes[video.PROFILE_DRAFT] != sizes[video.PROFILE_PUBLISH]
+
+
+def test_clip_downloaded(use_dir, tmp_path, monkeypatch):
+    source = synthetic.write_video(
+        video.DEFAULT_DIR / f"{synthetic.SYNTHETIC_VIDEO_ID}.{FMT_MP4}", 2
+    )
+    registry = ImporterRegistry(Video.importers, store=StateStore(tmp_path / "db"))
+    monkeypatch.setattr(Video, "_registry", registry)
+    monkeypatch.setattr(YtDlpImporter, "download", lambda self, **kwargs: source)
+
+    downloaded = Video(video_id=synthetic.SYNTHETIC_VIDEO_ID)
+    assert downloaded.edl.source == source
+
+    clip = downloaded.clip(0, 1, profile=video.PROFILE_DRAFT)
+    assert clip.filepath.is_file()
+    assert clip.edl.source == source
@@ -8,11 +8,13 @@ import jinja2
 import openai
 from ai21 import Segmentation, Summarize
 
-from . import exceptions
+from . import exceptions, extractive, profiling
 from .prompt_templates import (
     BEST_TITLE,
     VIDEO_TITLE_GENERATION,
 )
+from .profiling import CAT_LLM, CAT_TEXT
+from .subs import Subs
 from .utils import config
 
 
@@ -30,6 +32,14 @@ SOURCE_TYPE_URL = "URL"
 SOURCE_TYPE_TEXT = "TEXT"
 """Requests source types."""
 
+BACKEND_AI21 = "ai21"
+BACKEND_LOCAL = "local"
+BACKENDS = [BACKEND_AI21, BACKEND_LOCAL]
+"""Segmentation/summarization backends."""
+
+CONFIG_TEXT_BACKEND = "text_backend"
+"""Config option name for default segmentation/summarization backend."""
+
 ENGINE_DAVINCI = "text-davinci-003"
 ENGINE_3_TURBO = "gpt-3.5-turbo"
 ENGINE_4 = "gpt-4"
@@ -61,7 +71,18 @@ def ensure_key(lib) -> callable:
     return decorator
 
 
+def resolve_backend(backend: str | None = None) -> str:
+    """Pick segmentation/summarization backend (argument > config > AI21)."""
+
+    backend = backend or config.get(CONFIG_TEXT_BACKEND, BACKEND_AI21)
+    if backend not in BACKENDS:
+        raise exceptions.ValidationError(msg=f"Unknown text backend: {backend}")
+
+    return backend
+
+
 @ensure_key(ai21)
+@profiling.timed("ai21_segmentation", CAT_LLM)
 def _request_segmentation(
     source: str,
     source_type: str = SOURCE_TYPE_TEXT,
@@ -72,8 +93,28 @@ def _request_segmentation(
     return [_["segmentText"] for _ in results["segments"]]
 
 
-def segment(text: str) -> list[str]:
-    """Attempt to segment text into topics."""
+@ensure_key(ai21)
+@profiling.timed("ai21_summarize", CAT_LLM)
+def _request_summary(
+    source: str,
+    source_type: str = SOURCE_TYPE_TEXT,
+) -> str:
+    """Summarization request helper."""
+
+    request = Summarize.execute(source=source, sourceType=source_type)
+    return request.summary
+
+
+def segment(text: str, backend: str | None = None) -> list[str]:
+    """Attempt to segment text into topics.
+
+    - text (str): Text
+    - backend (str | None, optional (None)): "ai21" or "local" (config default)
+    """
+
+    if resolve_backend(backend) == BACKEND_LOCAL:
+        with profiling.span("segment", CAT_TEXT):
+            return extractive.segment(text)
 
     return _request_segmentation(text)
 
@@ -84,18 +125,43 @@ def segment_from_url(url: str) -> list[str]:
     return _request_segmentation(url, source_type=SOURCE_TYPE_URL)
 
 
-@ensure_key(ai21)
+def segment_subs(subs: Subs) -> list[Subs]:
+    """Split transcript into topic segments locally (no API requests).
+
+    - subs (Subs): transcript
+    """
+
+    with profiling.span("segment_subs", CAT_TEXT, records=len(subs.transcript)):
+        segments = extractive.segment_records(subs.transcript)
+
+    return [Subs(transcript=records, sanitize=False) for records in segments]
+
+
 def summarize(
     text: str,
     source_type: str = SOURCE_TYPE_TEXT,
-) -> list[str]:
-    """Summarize text."""
+    backend: str | None = None,
+) -> str:
+    """Summarize text.
 
-    request = Summarize.execute(source=text, sourceType=source_type)
-    return request.summary
+    - text (str): Text (or URL, see source_type)
+    - source_type (str, optional (SOURCE_TYPE_TEXT)): source type (AI21 only)
+    - backend (str | None, optional (None)): "ai21" or "local" (config default)
+    """
+
+    if resolve_backend(backend) == BACKEND_LOCAL:
+        if source_type != SOURCE_TYPE_TEXT:
+            raise exceptions.ValidationError(
+                msg=f"Local backend supports only {SOURCE_TYPE_TEXT} sources"
+            )
+        with profiling.span("summarize", CAT_TEXT):
+            return extractive.summarize(text)
+
+    return _request_summary(text, source_type=source_type)
 
 
 @ensure_key(openai)
+@profiling.timed("openai_completion", CAT_LLM)
 def completion(
     prompt: str,
     engine: str = ENGINE_DAVINCI,
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import itertools
 import os
-import progressbar
 import re
 import uuid
 from datetime import datetime, timedelta
@@ -118,6 +116,24 @@ def derive_filepath(
     return vpath
 
 
+def sidecar_path(file: Path | str, kind: str) -> Path:
+    """Hidden cache file stored next to a media file (".<name>.<kind>").
+
+    - file (Path | str): media file
+    - kind (str): sidecar kind (suffix)
+    """
+
+    file = Path(file).expanduser().absolute()
+    return file.with_name(f".{file.name}.{kind}")
+
+
+def file_signature(file: Path | str) -> dict:
+    """Cheap change detection signature of a file (size, modification time)."""
+
+    stat = Path(file).stat()
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
 def write_to_file(file: Path | str, contents: str) -> None:
     """Writes contents to file.
 
@@ -184,30 +200,6 @@ def dialog_confirm(message: str | None = None) -> bool:
             return False
 
 
-class ProgressBar:
-    def __init__(self, key_total, key_progress) -> ProgressBar:
-        self.key_total = key_total
-        self.key_progress = key_progress
-        self.bar = progressbar.ProgressBar()
-
-    def __call__(self, update):
-        if not self.bar.max_value:
-            self.bar.max_value = update[self.key_total]
-        self.bar.update(update[self.key_progress])
-
-
-class Spinner:
-    def __init__(self, title_former: callable | None = None) -> Spinner:
-        self.title_former = title_former
-        self.spinner = itertools.cycle(["-", "\\", "|", "/"])
-
-    def __call__(self, update) -> None:
-        text = "... "
-        if self.title_former:
-            text = self.title_former(update) + text
-        print(text + next(self.spinner), end="\r")
-
-
 class Config:
     """User config file (TOML) manager."""
 
@@ -234,6 +226,12 @@ class Config:
         # TODO: ...
         return str(value)
 
+    def get(self, option_name: str, default: Any = None) -> Any:
+        """Get optional parameter value (without prompting for it)."""
+
+        value = self.data.get(option_name)
+        return default if value is None else value
+
     def __call__(self, option_name) -> Any:
         if self.data.get(option_name) is None:
             if dialog_confirm(
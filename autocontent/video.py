@@ -1,8 +1,13 @@
 from __future__ import annotations
 from __future__ import unicode_literals
 
+import csv
+import json
 import math
+import os
 import re
+import tempfile
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -11,15 +16,32 @@ from moviepy.editor import (
     concatenate_videoclips,
     TextClip,
     vfx,
-    VideoFileClip,
 )
 from pytube import exceptions as pytube_exc, YouTube
-from pytube.cli import on_progress
-from yt_dlp import YoutubeDL as ytdlp
-from yt_dlp.utils import DownloadError
+from urllib.error import URLError
 
-from . import exceptions, utils
-from .utils import DEBUG, Spinner
+from yt_dlp import YoutubeDL as ytdlp
+from yt_dlp.networking.exceptions import TransportError
+from yt_dlp.utils import download_range_func, DownloadError, ExtractorError
+
+from . import (
+    aio,
+    audio,
+    exceptions,
+    ffmpeg,
+    formats,
+    keyframes,
+    profiling,
+    progress,
+    proxy,
+    readers,
+    utils,
+)
+from .importers import ImporterRegistry
+from .edl import EDL
+from .profiling import CAT_AUDIO, CAT_DOWNLOAD, CAT_ENCODE, CAT_VIDEO
+from .subs import FMT_JSON, Subs
+from .utils import config, DEBUG
 
 
 VIDEO_URL_BASE = "https://youtu.be/"
@@ -61,8 +83,67 @@ AUDIO_BITRATE_DEFAULT = 192
 """Default audio bitrate value."""
 
 AUDIO_FMT_MP3 = "mp3"
+AUDIO_FMT_M4A = "m4a"
+AUDIO_FMT_OPUS = "opus"
+AUDIO_FMT_OGG = "ogg"
 """Audio format constants."""
 
+AUDIO_MODE_TRANSCODE = "transcode"
+AUDIO_MODE_REMUX = "remux"
+AUDIO_MODES = [AUDIO_MODE_TRANSCODE, AUDIO_MODE_REMUX]
+"""Audio download modes (re-encode to MP3, keep original Opus/AAC stream)."""
+
+AUDIO_REMUX_FORMATS = [AUDIO_FMT_M4A, AUDIO_FMT_OPUS, AUDIO_FMT_OGG]
+"""Remux mode output formats (YouTube AAC, Opus and Vorbis streams)."""
+
+AUDIO_FORMAT_SELECTOR = "bestaudio[vcodec=none]/bestaudio/worst[acodec!=none]"
+"""yt-dlp audio format selector (audio-only first, smallest muxed fallback)."""
+
+CUT_LIST_CSV = "csv"
+CUT_LIST_JSON = "json"
+CUT_LIST_FORMATS = [CUT_LIST_CSV, CUT_LIST_JSON]
+"""Cut list file formats (records of t1, t2 and optional name)."""
+
+CLIP_VIDEO_CODEC = "libx264"
+CLIP_AUDIO_CODEC = "aac"
+"""Codecs used by ffmpeg based rendering."""
+
+PROFILE_DRAFT = "draft"
+PROFILE_DEFAULT = "default"
+PROFILE_PUBLISH = "publish"
+ENCODE_PROFILES = {
+    PROFILE_DRAFT: {
+        "preset": "ultrafast",
+        "crf": 30,
+        "threads": 0,
+        "audio_bitrate": "96k",
+    },
+    PROFILE_DEFAULT: {
+        "preset": "medium",
+        "crf": 23,
+        "threads": 0,
+        "audio_bitrate": "192k",
+    },
+    PROFILE_PUBLISH: {
+        "preset": "slow",
+        "crf": 18,
+        "threads": 0,
+        "audio_bitrate": "256k",
+    },
+}
+"""Encode profiles (x264 preset and constant rate factor, encoder threads -
+0 lets ffmpeg pick by core count, audio bitrate)."""
+
+CONFIG_ENCODE_PROFILE = "encode_profile"
+"""Config option name for default encode profile."""
+
+CONFIG_ENCODE_OVERRIDES = "encode_overrides"
+"""Config option name for profile field overrides (table per profile name, e.g.
+[encode_overrides.draft] threads = 2)."""
+
+CONFIG_IMPORTER_ORDER = "importer_order"
+"""Config option name for importer failover order (list of importer names)."""
+
 MIME_TYPE_MHTML = "video/" + FMT_MHTML
 MIME_TYPE_3GPP = "video/" + FMT_3GPP
 MIME_TYPE_WEBM = "video/" + FMT_WEBM
@@ -93,6 +174,9 @@ class VideoImporter(ABC):
     DEFAULT_MIME_TYPE = MIME_TYPE_MP4
     DEFAULT_FORMAT = FMT_MP4
 
+    operations = frozenset()
+    """Operations (method names) the importer implements, see ImporterRegistry."""
+
     def __init__(self, video_id=None, url=None) -> None:
         if not bool(video_id) ^ bool(url):
             raise Exception("Either video_id or url must be provided")
@@ -155,6 +239,54 @@ class VideoImporter(ABC):
 class PytubeImporter(VideoImporter):
     """Youtube video importer via pytube."""
 
+    operations = frozenset({"download", "download_audio"})
+
+    @staticmethod
+    def stream_format(stream) -> dict:
+        """Format description of a pytube stream (see formats.normalize)."""
+
+        return {
+            "id": str(stream.itag),
+            "ext": stream.subtype,
+            "height": int(stream.resolution[:-1]) if stream.resolution else None,
+            "vcodec": stream.video_codec if stream.includes_video_track else None,
+            "acodec": stream.audio_codec if stream.includes_audio_track else None,
+            "tbr": stream.bitrate / 1000 if stream.bitrate else None,
+            "abr": None,
+            "size": None,
+        }
+
+    def load(self) -> YouTube:
+        """pytube video object (stream listing)."""
+
+        try:
+            vid = YouTube(self.url)
+            vid.check_availability()
+            return vid
+        # except pytube_exc as exc1:
+        # raise Exception(f"Invalid video link: {url} ({str(exc1)})")
+        except pytube_exc.VideoUnavailable as exc1:
+            raise exceptions.ContentUnavailable(str(exc1))
+        except URLError as exc2:
+            raise exceptions.NetworkError(str(exc2))
+        except pytube_exc.PytubeError as exc3:
+            raise Exception(f"Failed to load video ({str(exc3)})")
+
+    def progress_callback(self, tracker: progress.Tracker | None, key: str):
+        """pytube progress callback (cancellation checkpoint, progress task)."""
+
+        def on_progress(stream, chunk, remaining) -> None:
+            aio.checkpoint()
+            if tracker:
+                tracker.update(
+                    key,
+                    stream.filesize - remaining,
+                    stream.filesize,
+                    file=str(stream.itag),
+                )
+
+        return on_progress
+
     def download(
         self,
         max_resolution: str | None = RESOLUTION_360,
@@ -166,43 +298,107 @@ class PytubeImporter(VideoImporter):
         if mime_type not in MIME_TYPES:
             raise Exception(f"Invalid mime_type: {mime_type}")
 
-        try:
-            vid = YouTube(self.url, on_progress_callback=on_progress)
-        # except pytube_exc as exc1:
-        # raise Exception(f"Invalid video link: {url} ({str(exc1)})")
-        except pytube_exc.PytubeError as exc2:
-            raise Exception(f"Failed to load video ({str(exc2)})")
-
-        # FIXME: for resolutions >360p we must manually merge audio and video streams
-        if RESOLUTION_MAP[max_resolution] > RESOLUTION_MAP[RESOLUTION_360]:
-            raise Exception(
-                "Audio for resolutions higher than 360p is not currently supported"
-            )
-
-        # streams = sorted(
-        streams = [
-            stream
-            for stream in vid.streams
-            if stream.resolution == max_resolution
-            and stream.audio_codec == AUDIO_CODEC_MP4A
-            and stream.mime_type == mime_type
-            and stream.type == "video"
-            # and stream.is_progressive
-        ]
-        # key=lambda s: -bool(s.is_progressive),
-        # )
-
-        if not len(streams):
-            if exact_resolution:
-                raise Exception("Video streams with specified parameters not found")
-            # TODO: retry lower quality streams (exact_resolution = False)
+        vid = self.load()
+        fmt = self.mime_type_to_format(mime_type)
+        streams = {str(stream.itag): stream for stream in vid.streams}
+        selection = formats.plan(
+            [self.stream_format(stream) for stream in vid.streams],
+            self.resolution_to_height(max_resolution or RESOLUTION_360),
+            exact=exact_resolution,
+            ext=fmt,
+            duration=vid.length,
+        )
 
         self.filepath = (
-            Path(output_file).absolute() if output_file else self.default_filepath()
+            Path(output_file).absolute() if output_file else self.default_filepath(fmt)
         )
         utils.check_existing_file(self.filepath, force=force)
         utils.ensure_folder(self.filepath)
-        streams[0].download(output_path=str(DEFAULT_DIR), filename=str(self.filepath))
+
+        chosen = [streams[itag] for itag in selection["format"].split("+")]
+        key = f"download:{self.video_id}"
+        with progress.track(key, self.video_id) as tracker:
+            vid.register_on_progress_callback(self.progress_callback(tracker, key))
+
+            if len(chosen) == 1:
+                chosen[0].download(
+                    output_path=str(self.filepath.parent), filename=self.filepath.name
+                )
+                return self.filepath
+
+            # adaptive streams: merge video and audio (stream copy)
+            with tempfile.TemporaryDirectory(dir=self.filepath.parent) as tmp:
+                parts = [
+                    stream.download(output_path=tmp, filename=f"{i}.{stream.subtype}")
+                    for i, stream in enumerate(chosen)
+                ]
+                if tracker:
+                    tracker.stage(key, "merge")
+                with profiling.span("merge", CAT_VIDEO):
+                    ffmpeg.run(
+                        "-y",
+                        *("-i", parts[0], "-i", parts[1]),
+                        *("-map", "0:v:0", "-map", "1:a:0", "-c", "copy"),
+                        str(self.filepath),
+                    )
+
+        return self.filepath
+
+    def download_audio(
+        self,
+        output_file: Path | str | None = None,
+        bitrate: int | None = None,
+        force: bool | None = False,
+        mode: str | None = AUDIO_MODE_TRANSCODE,
+        pcm: bool | None = False,
+    ) -> Path:
+        """Download audio-only (AAC) stream, transcoded to MP3 unless remuxed.
+
+        - output_file (Path | str | None, optional (None)): override output location
+        - bitrate (int | None, optional (None)): MP3 bitrate (transcode mode)
+        - force (bool | None, optional (False)): overwrite if exists
+        - mode (str | None, optional (AUDIO_MODE_TRANSCODE)): MP3 transcode or
+            remux (keep the AAC stream in an m4a container)
+        - pcm (bool | None, optional (False)): decode into analysis PCM cache
+        """
+
+        mode = mode or AUDIO_MODE_TRANSCODE
+        if mode not in AUDIO_MODES:
+            raise exceptions.ValidationError("Unknown audio mode", mode)
+
+        vid = self.load()
+        stream = vid.streams.get_audio_only()
+        if stream is None:
+            raise exceptions.VideoUnavailable("No audio stream")
+
+        fmt = AUDIO_FMT_MP3 if mode == AUDIO_MODE_TRANSCODE else AUDIO_FMT_M4A
+        output_file = (
+            Path(output_file).with_suffix(f".{fmt}").absolute()
+            if output_file
+            else self.default_filepath(fmt)
+        )
+        utils.check_existing_file(output_file, force=bool(force))
+        utils.ensure_folder(output_file)
+
+        key = f"download_audio:{self.video_id}"
+        with progress.track(key, self.video_id) as tracker:
+            vid.register_on_progress_callback(self.progress_callback(tracker, key))
+            with tempfile.TemporaryDirectory(dir=output_file.parent) as tmp:
+                part = stream.download(output_path=tmp, filename=f"audio.{FMT_MP4}")
+                if tracker:
+                    tracker.stage(key, mode)
+                codec = ["-c:a", "copy"]
+                if mode == AUDIO_MODE_TRANSCODE:
+                    codec = ["-c:a", "libmp3lame"]
+                    codec += ["-b:a", f"{bitrate or AUDIO_BITRATE_DEFAULT}k"]
+                with profiling.span(mode, CAT_AUDIO):
+                    ffmpeg.run("-y", "-i", part, "-vn", *codec, str(output_file))
+
+        if pcm:
+            with profiling.span("decode_pcm", CAT_AUDIO):
+                audio.load_pcm(output_file)
+
+        return output_file
 
 
 class YoutubeDlImporter(VideoImporter):
@@ -241,6 +437,21 @@ class YoutubeDlImporter(VideoImporter):
 class YtDlpImporter(VideoImporter):
     """Youtube cideo importer via yt-dlp"""
 
+    operations = frozenset({"download", "download_audio", "pull_clip"})
+
+    @staticmethod
+    def translate_error(error: DownloadError) -> exceptions.Error:
+        """Map yt-dlp error: content (private, removed video), network or other."""
+
+        cause = error.exc_info[1] if error.exc_info else None
+        if isinstance(cause, ExtractorError):
+            if cause.expected:
+                return exceptions.ContentUnavailable(str(cause))
+            cause = cause.cause or cause
+        if isinstance(cause, TransportError):
+            return exceptions.NetworkError(str(cause))
+        return exceptions.VideoUnavailable(str(error))
+
     @classmethod
     def construct_options(
         cls,
@@ -249,6 +460,7 @@ class YtDlpImporter(VideoImporter):
         fmt: str,
         output_file: str,
         additional_options: dict,
+        selector: str | None = None,
     ) -> dict:
         """Prepares options dictionary for ytdlp context.
 
@@ -257,15 +469,15 @@ class YtDlpImporter(VideoImporter):
         - fmt (str): video format
         - output_file (str): output location
         - additional_options (dict): extra YoutubeDL options
+        - selector (str | None, optional (None)): format selector (planned format
+            IDs), resolution based by default
         """
 
-        # TODO: add progress hooks
-
         cmpr = "=" if exact else "<="
         res_str = f"[height{cmpr}{height}]"
 
         options = {
-            "format": f"bestvideo{res_str}+bestaudio/best{res_str}",
+            "format": selector or f"bestvideo{res_str}+bestaudio/best{res_str}",
             "merge_output_format": fmt or cls.DEFAULT_FORMAT,
             "outtmpl": str(output_file),
             "noplaylist": True,
@@ -279,24 +491,139 @@ class YtDlpImporter(VideoImporter):
 
         return options
 
+    @profiling.timed("extract_info", CAT_DOWNLOAD)
     def extract_info(self):
         """Fetches information JSON for video."""
 
         with ytdlp() as ydl:
             try:
                 return ydl.extract_info(self.url, download=False)
-            except DownloadError:
-                raise exceptions.VideoUnavailable()
+            except DownloadError as e:
+                raise self.translate_error(e)
+
+    def run(self, options: dict, operation: str) -> dict | None:
+        """Run yt-dlp download, progress reported as task "<operation>:<video_id>".
+
+        Outputs the information dictionary of the downloaded video.
+
+        - options (dict): YoutubeDL options
+        - operation (str): progress task name prefix
+        """
 
+        key = f"{operation}:{self.video_id}"
+        if aio.cancellable():
+            options = {
+                **options,
+                "progress_hooks": [*options.get("progress_hooks", []), aio.checkpoint],
+            }
+        with progress.track(key, self.video_id) as tracker:
+            if tracker:
+                options = tracker.ytdlp_options(key, options)
+            with ytdlp(options) as ydl:
+                try:
+                    return ydl.extract_info(self.url, download=True)
+                except DownloadError as e:
+                    raise self.translate_error(e)
+
+    def format_list(self, force: bool | None = False) -> dict:
+        """Cached format list of the video (see formats.load)."""
+
+        return formats.load(self.video_id, self.extract_info, DEFAULT_DIR, force)
+
+    def plan_formats(
+        self,
+        max_resolution: str | None = RESOLUTION_360,
+        mime_type: str | None = MIME_TYPE_MP4,
+        exact_resolution: bool | None = False,
+        time_budget: float | None = None,
+    ) -> dict:
+        """Pick streams to download along with size/time estimates (formats.plan).
+
+        - max_resolution (str | None, optional (RESOLUTION_360)): maximum resolution
+        - mime_type (str | None, optional (MIME_TYPE_MP4)): video format
+        - exact_resolution (bool | None, optional (False)): aim for specific resolution
+        - time_budget (float | None, optional (None)): download time limit (seconds),
+            lower resolutions are picked if the estimate exceeds it
+        """
+
+        listing = self.format_list()
+        return formats.plan(
+            listing["formats"],
+            self.resolution_to_height(max_resolution or RESOLUTION_360),
+            exact=exact_resolution,
+            ext=self.mime_type_to_format(mime_type or MIME_TYPE_MP4),
+            duration=listing["duration"],
+            budget=time_budget,
+        )
+
+    @classmethod
+    def construct_audio_options(
+        cls,
+        output_file: Path,
+        bitrate: int | str,
+        mode: str,
+        force: bool,
+        additional_options: dict,
+    ) -> dict:
+        """Prepares options dictionary for ytdlp audio download.
+
+        - output_file (Path): output location (extension picked by the codec in
+            remux mode)
+        - bitrate (int | str): MP3 bitrate (transcode mode)
+        - mode (str): AUDIO_MODE_TRANSCODE or AUDIO_MODE_REMUX
+        - force (bool): overwrite existing file
+        - additional_options (dict): extra YoutubeDL options
+        """
+
+        if mode not in AUDIO_MODES:
+            raise exceptions.ValidationError("Unknown audio mode", mode)
+
+        # remux: "best" keeps the stream codec (Opus, AAC) and only changes container
+        extract = {"key": "FFmpegExtractAudio", "preferredcodec": "best"}
+        if mode == AUDIO_MODE_TRANSCODE:
+            extract.update(preferredcodec=AUDIO_FMT_MP3, preferredquality=str(bitrate))
+
+        options = {
+            "format": AUDIO_FORMAT_SELECTOR,
+            # FIXME: outtmpl: for some reason extension is duplicated otherwise
+            "outtmpl": str(output_file.parent / output_file.stem),
+            "noplaylist": True,
+            "forcejson": False,
+            "quiet": True,
+            "overwrites": force,
+            "nopostoverwrites": not force,
+            "postprocessors": [extract],
+        }
+        if mode == AUDIO_MODE_TRANSCODE:
+            options.update(audioformat=AUDIO_FMT_MP3, merge_output_format=AUDIO_FMT_MP3)
+        options.update(additional_options or {})
+
+        return options
+
+    @profiling.timed("download_audio", CAT_DOWNLOAD)
     def download_audio(
         self,
         output_file: Path | str | None = None,
         bitrate: int | None = None,
         force: bool | None = None,
         additional_options: dict(str, str) | None = None,
-    ):
-        bitrate = str(bitrate or AUDIO_BITRATE_DEFAULT)
+        mode: str | None = AUDIO_MODE_TRANSCODE,
+        pcm: bool | None = False,
+    ) -> Path:
+        """Download audio-only stream (smallest muxed stream if there's none).
+
+        - output_file (Path | str | None, optional (None)): override output location
+        - bitrate (int | None, optional (None)): MP3 bitrate (transcode mode)
+        - force (bool | None, optional (None)): overwrite if exists
+        - additional_options (dict, optional (None)): extra YoutubeDL options
+        - mode (str | None, optional (AUDIO_MODE_TRANSCODE)): MP3 transcode or
+            remux (keep original codec, no re-encoding)
+        - pcm (bool | None, optional (False)): decode into analysis PCM cache
+        """
+
+        bitrate = bitrate or AUDIO_BITRATE_DEFAULT
         force = False if force is None else force
+        mode = mode or AUDIO_MODE_TRANSCODE
 
         output_file = self.validate_filename(
             Path(output_file)
@@ -305,38 +632,29 @@ class YtDlpImporter(VideoImporter):
             fmt=AUDIO_FMT_MP3,
         )
         utils.ensure_folder(output_file)
-        utils.check_existing_file(output_file, force=force)
+        if mode == AUDIO_MODE_TRANSCODE:
+            utils.check_existing_file(output_file, force=force)
+        elif not force:  # remux: extension depends on the stream codec
+            for fmt in AUDIO_REMUX_FORMATS:
+                utils.check_existing_file(output_file.with_suffix(f".{fmt}"))
+
+        options = self.construct_audio_options(
+            output_file, bitrate, mode, force, additional_options
+        )
+        info = self.run(options, "download_audio")
 
-        options = {
-            "format": "bestaudio/best",
-            "audioformat": AUDIO_FMT_MP3,
-            "merge_output_format": AUDIO_FMT_MP3,
-            # FIXME: outtmpl: for some reason extension is duplicated otherwise
-            "outtmpl": str(output_file.parent / output_file.stem),
-            "noplaylist": True,
-            "forcejson": False,
-            "quiet": True,
-            "postprocessors": [
-                {
-                    "key": "FFmpegExtractAudio",
-                    "preferredcodec": AUDIO_FMT_MP3,
-                    "preferredquality": bitrate,
-                }
-            ],
-            "postprocessor_hooks": [
-                Spinner(title_former=lambda x: f"{x['postprocessor']} ({x['status']})")
-            ],
-        }
-        options.update(additional_options or {})
+        # final name (after postprocessing), extension depends on the codec
+        downloads = (info or {}).get("requested_downloads") or []
+        if downloads and downloads[-1].get("filepath"):
+            output_file = Path(downloads[-1]["filepath"])
 
-        with ytdlp(options) as ydl:
-            try:
-                ydl.download(self.url)
-            except DownloadError as e:
-                raise exceptions.VideoUnavailable(str(e))
+        if pcm:
+            with profiling.span("decode_pcm", CAT_AUDIO):
+                audio.load_pcm(output_file)
 
         return output_file
 
+    @profiling.timed("download", CAT_DOWNLOAD)
     def download(
         self,
         max_resolution: str | None = RESOLUTION_360,
@@ -345,8 +663,9 @@ class YtDlpImporter(VideoImporter):
         output_file: Path | str | None = None,
         force: bool | None = False,
         additional_options: dict(str, str) | None = None,
+        time_budget: float | None = None,
     ):
-        """Download from best video stream according to provided parameters.
+        """Download cheapest streams delivering requested resolution (plan_formats).
 
         - max_resolution (str | None, optional (RESOLUTION_360)): maximum resolution
         - mime_type (str | None, optional (MIME_TYPE_MP4)): video format
@@ -354,6 +673,7 @@ class YtDlpImporter(VideoImporter):
         - output_file (Path | str | None, optional (None)): override output location
         - force (bool | None (False)): overwrite flag
         - additional options (dict): extra YoutubeDL options
+        - time_budget (float | None, optional (None)): download time limit (seconds)
         """
 
         mime_type = mime_type or MIME_TYPE_MP4
@@ -366,19 +686,80 @@ class YtDlpImporter(VideoImporter):
             default_path=DEFAULT_DIR / f"{self.video_id}.{fmt}",
             force=force,
         )
+        exact = False if exact_resolution is None else exact_resolution
+        selection = self.plan_formats(max_resolution, mime_type, exact, time_budget)
         options = self.construct_options(
             height=self.resolution_to_height(max_resolution or RESOLUTION_360),
-            exact=False if exact_resolution is None else exact_resolution,
+            exact=exact,
             fmt=fmt,
             output_file=output_file,
             additional_options=additional_options or {},
+            selector=selection["format"],
         )
 
-        with ytdlp(options) as ydl:
-            try:
-                ydl.download(self.url)
-            except DownloadError as e:
-                raise exceptions.VideoUnavailable(str(e))
+        start = time.perf_counter()
+        self.run(options, "download")
+
+        if output_file.is_file():
+            formats.observe(output_file.stat().st_size, time.perf_counter() - start)
+
+        return output_file
+
+    @profiling.timed("pull_clip", CAT_DOWNLOAD)
+    def pull_clip(
+        self,
+        t1: str | int | float,
+        t2: str | int | float,
+        max_resolution: str | None = RESOLUTION_360,
+        exact: bool | None = False,
+        output_file: Path | str | None = None,
+        force: bool | None = False,
+        additional_options: dict(str, str) | None = None,
+    ) -> Path:
+        """Download time range (t1 - t2) only, without fetching the whole video.
+
+        ffmpeg reads the remote streams with HTTP range requests: it starts from
+        the keyframe preceding t1 and stream copies, exact re-encodes around the
+        cut points instead (slower, frame accurate).
+
+        - t1 (str | int | float): range start
+        - t2 (str | int | float): range end
+        - max_resolution (str | None, optional (RESOLUTION_360)): maximum resolution
+        - exact (bool | None, optional (False)): force keyframes at cut points
+        - output_file (Path | str | None, optional (None)): override output location
+        - force (bool | None, optional (False)): overwrite flag
+        - additional_options (dict, optional (None)): extra YoutubeDL options
+        """
+
+        t1, t2 = utils.parse_time_value(t1), utils.parse_time_value(t2)
+        if t1 >= t2:
+            raise exceptions.ValidationError("Incorrect time range", (t1, t2))
+
+        force = False if force is None else force
+        output_file = utils.derive_filepath(
+            output_file,
+            entity_id=self.video_id,
+            fmt=FMT_MP4,
+            default_path=DEFAULT_DIR
+            / f"{self.video_id}-clip-{float(t1)}-{float(t2)}.{FMT_MP4}",
+            force=force,
+        )
+        options = self.construct_options(
+            height=self.resolution_to_height(max_resolution or RESOLUTION_360),
+            exact=False,
+            fmt=FMT_MP4,
+            output_file=output_file,
+            additional_options={
+                "download_ranges": download_range_func(None, [(t1, t2)]),
+                "force_keyframes_at_cuts": bool(exact),
+                "overwrites": force,
+            },
+        )
+        # single stream without resolution metadata (direct media links)
+        options["format"] += "/best"
+        options.update(additional_options or {})
+
+        self.run(options, "pull_clip")
 
         return output_file
 
@@ -386,13 +767,15 @@ class YtDlpImporter(VideoImporter):
 class Video:
     """Video model."""
 
-    # TODO: cycle through importers on fail?
     importers = {
         "pytube": PytubeImporter,
         "youtube-dl": YoutubeDlImporter,
         "yt-dlp": YtDlpImporter,
     }
+    importer_order = ["yt-dlp", "pytube"]
     default_importer = YtDlpImporter
+    reader_pool = readers.POOL
+    _registry = None
 
     def __init__(
         self,
@@ -408,6 +791,10 @@ class Video:
         download_kwargs = download_kwargs or {}
         self.filepath = None
         self.video_id = None
+        self.kept_intervals = None  # source time ranges kept (cut_silence result)
+        self.speed_factor = None  # source playback speed factor (modify_speed result)
+        self.is_proxy = False  # low resolution stand-in of edl.source
+        self.edl = None  # edit decision list which produced this file
 
         if filepath:
             # TODO: handle situations when there's no ID in the name present...
@@ -419,6 +806,7 @@ class Video:
                 self.download_audio(**download_kwargs)
             else:
                 self.download_video(**download_kwargs)
+        self.edl = EDL(self.filepath)
 
     def download_video(
         self,
@@ -428,6 +816,7 @@ class Video:
         output_file: Path | str | None = None,
         force: bool | None = False,
         additional_options: dict(str, str) | None = None,
+        time_budget: float | None = None,
     ) -> None:
         """Download video.
 
@@ -439,16 +828,33 @@ class Video:
         - output_file (Path | str | None, optional (None)): override output location
         - force (bool | None, optional (False)): overwrite if exists
         - additional_options (dict): additional downloader options
+        - time_budget (float | None, optional (None)): download time limit
+            (seconds), lower resolutions are picked to fit the estimate
         """
 
-        self.filepath = self.default_importer(self.video_id).download(
+        self.filepath = self.registry().call(
+            self.video_id,
+            "download",
             max_resolution=max_resolution or RESOLUTION_360,
             mime_type=mime_type or MIME_TYPE_MP4,
             exact_resolution=False if exact_resolution is None else exact_resolution,
             output_file=output_file,
             force=False if force is None else force,
             additional_options=additional_options or {},
+            time_budget=time_budget,
         )
+        self.edl = EDL(self.filepath)
+
+    @classmethod
+    def plan_download(cls, video_id: str, **plan_kwargs) -> dict:
+        """Streams a download would fetch, with size (bytes) and time (seconds)
+        estimates, from the cached format list (see YtDlpImporter.plan_formats).
+
+        - video_id (str): youtube video ID
+        - plan_kwargs: max_resolution, mime_type, exact_resolution, time_budget
+        """
+
+        return YtDlpImporter(video_id=video_id).plan_formats(**plan_kwargs)
 
     def download_audio(
         self,
@@ -456,6 +862,8 @@ class Video:
         bitrate: int | None = None,
         force: bool | None = False,
         additional_options: dict(str, str) | None = None,
+        mode: str | None = AUDIO_MODE_TRANSCODE,
+        pcm: bool | None = False,
     ) -> None:
         """Download audio track.
 
@@ -463,15 +871,88 @@ class Video:
         - bitrate (int | None, optional (None)): desired audio bitrate
         - force (bool | None, optional (False)): overwrite if exists
         - additional_options (dict, optional (None)): additional importer options
+        - mode (str | None, optional (AUDIO_MODE_TRANSCODE)): MP3 transcode or
+            remux (keep original Opus/AAC stream, much faster)
+        - pcm (bool | None, optional (False)): also decode into analysis PCM cache
         """
 
-        self.filepath = self.default_importer(self.video_id).download_audio(
+        self.filepath = self.registry().call(
+            self.video_id,
+            "download_audio",
             output_file=output_file,
             bitrate=bitrate,
             force=force,
             additional_options=additional_options,
+            mode=mode,
+            pcm=pcm,
+        )
+        self.edl = EDL(self.filepath)
+
+    @classmethod
+    def pull_clip(
+        cls,
+        t1: str | int | float,
+        t2: str | int | float,
+        video_id: str | None = None,
+        url: str | None = None,
+        **pull_kwargs,
+    ) -> Video:
+        """Download time range of a video only (see YtDlpImporter.pull_clip).
+
+        - t1 (str | int | float): range start
+        - t2 (str | int | float): range end
+        - video_id (str | None, optional (None)): youtube video ID
+        - url (str | None, optional (None)): youtube video URL
+        - pull_kwargs: max_resolution, exact, output_file, force, additional_options
+        """
+
+        video_id = video_id or cls.extract_video_id(url)
+        return cls(
+            filepath=cls.registry().call(
+                video_id, "pull_clip", t1=t1, t2=t2, **pull_kwargs
+            )
+        )
+
+    @classmethod
+    async def fetch(
+        cls,
+        video_id: str | None = None,
+        url: str | None = None,
+        audio_only: bool | None = None,
+        timeout: float | None = None,
+        **download_kwargs,
+    ) -> Video:
+        """Download video (or its audio) without blocking the event loop.
+
+        Runs in the aio executor, cancelling the awaiting task (or running out
+        of time) stops the download. Other blocking methods can be awaited via
+        aio.run (e.g. await aio.run(video.clip, t1, t2)).
+
+        - video_id (str | None, optional (None)): youtube video ID
+        - url (str | None, optional (None)): youtube video URL
+        - audio_only (bool | None, optional (None)): download audio track only
+        - timeout (float | None, optional (None)): seconds to wait for download
+        - download_kwargs: download_video/download_audio arguments
+        """
+
+        return await aio.run(
+            cls,
+            video_id=video_id,
+            url=url,
+            audio_only=audio_only,
+            download_kwargs=download_kwargs,
+            timeout=timeout,
         )
 
+    @classmethod
+    def registry(cls) -> ImporterRegistry:
+        """Importer registry (failover in importer_order, config overrides it)."""
+
+        if Video._registry is None:
+            order = config.get(CONFIG_IMPORTER_ORDER, cls.importer_order)
+            Video._registry = ImporterRegistry(cls.importers, order)
+        return Video._registry
+
     @classmethod
     def video_id_to_url(cls, video_id: str) -> str:
         """Validate and transform youtube video ID to valid url."""
@@ -499,9 +980,67 @@ class Video:
 
         return video_id
 
+    @staticmethod
+    def resolve_profile(profile: str | None = None) -> str:
+        """Pick encode profile (argument > config > PROFILE_DEFAULT)."""
+
+        profile = profile or config.get(CONFIG_ENCODE_PROFILE, PROFILE_DEFAULT)
+        if profile not in ENCODE_PROFILES:
+            raise exceptions.ValidationError(msg=f"Unknown encode profile: {profile}")
+
+        return profile
+
+    @classmethod
+    def profile_settings(cls, profile: str | None = None) -> dict:
+        """Encode profile fields with config overrides applied."""
+
+        profile = cls.resolve_profile(profile)
+        overrides = config.get(CONFIG_ENCODE_OVERRIDES, {}).get(profile, {})
+        unknown = set(overrides) - set(ENCODE_PROFILES[profile])
+        if unknown:
+            raise exceptions.ValidationError(
+                msg=f"Unknown encode profile fields ({profile}): {sorted(unknown)}"
+            )
+
+        return {**ENCODE_PROFILES[profile], **overrides}
+
+    @classmethod
+    def write_kwargs(cls, profile: str | None = None) -> dict:
+        """moviepy write_videofile arguments for an encode profile."""
+
+        settings = cls.profile_settings(profile)
+        kwargs = {
+            "preset": settings["preset"],
+            "ffmpeg_params": ["-crf", str(settings["crf"])],
+            "audio_bitrate": settings["audio_bitrate"],
+            "threads": settings["threads"],
+        }
+        if aio.cancellable():  # async callers: stop encoding once cancelled
+            kwargs["logger"] = aio.CheckpointLogger()
+        return kwargs
+
     @classmethod
-    def check_video_file(cls, filepath: str) -> Path:
-        """Check if video file exists and in correct format."""
+    def encode_args(
+        cls, profile: str | None = None, with_audio: bool = True
+    ) -> list[str]:
+        """ffmpeg output arguments for an encode profile."""
+
+        settings = cls.profile_settings(profile)
+        args = ["-c:v", CLIP_VIDEO_CODEC, "-preset", settings["preset"]]
+        args += ["-crf", str(settings["crf"]), "-threads", str(settings["threads"])]
+        if with_audio:
+            args += ["-c:a", CLIP_AUDIO_CODEC, "-b:a", settings["audio_bitrate"]]
+
+        return args
+
+    @classmethod
+    def check_video_file(cls, filepath: str, validate: bool | None = False) -> Path:
+        """Check if video file exists and in correct format.
+
+        - filepath (str): video file
+        - validate (bool | None, optional (False)): probe container (cached),
+            require a video stream
+        """
 
         filepath = Path(filepath).absolute()
 
@@ -510,9 +1049,50 @@ class Video:
             raise Exception(f"Incorrect file format (supported: {formats})")
         if not filepath.is_file():
             raise Exception("File not found")
+        if validate and not ffmpeg.first_stream(
+            ffmpeg.probe(filepath), ffmpeg.STREAM_VIDEO
+        ):
+            raise exceptions.VideoException(f"No video stream in {filepath.name}")
 
         return filepath
 
+    def probe(self, force: bool | None = False) -> dict:
+        """Container metadata (duration, streams, codecs) without decoding.
+
+        Cached next to the file, see ffmpeg.probe for the output format.
+
+        - force (bool | None, optional (False)): probe even if cached
+        """
+
+        return ffmpeg.probe(self.filepath, force=force)
+
+    @property
+    def duration(self) -> float | None:
+        """Duration in seconds (from probe)."""
+
+        return self.probe()["duration"]
+
+    @property
+    def has_audio(self) -> bool:
+        """Whether the file has an audio stream (from probe)."""
+
+        return ffmpeg.first_stream(self.probe(), ffmpeg.STREAM_AUDIO) is not None
+
+    def keyframe_index(self, force: bool | None = False) -> list[float]:
+        """Keyframe timestamps (seconds, sorted), scanned once and cached.
+
+        - force (bool | None, optional (False)): rescan even if cached
+        """
+
+        return keyframes.load(self.filepath, force=force)
+
+    def snap_to_keyframe(
+        self, t: str | int | float, mode: str = keyframes.SNAP_BEFORE
+    ) -> float:
+        """Keyframe timestamp closest to t (mode: keyframes.SNAP_MODES)."""
+
+        return keyframes.snap(self.keyframe_index(), utils.parse_time_value(t), mode)
+
     def clip(
         self,
         t1: str | int | float,
@@ -520,8 +1100,9 @@ class Video:
         output_file: Path | str | None = None,
         strip_sound: bool | None = False,
         force: bool | None = False,
+        profile: str | None = None,
     ) -> Video:
-        """Cut clip from a video file."""
+        """Cut clip from a video file (profile - see ENCODE_PROFILES)."""
 
         t1 = utils.parse_time_value(t1)
         t2 = utils.parse_time_value(t2)
@@ -532,25 +1113,151 @@ class Video:
             output_file,
             self.video_id,
             FMT_MP4,
-            DEFAULT_DIR / f"{self.video_id}-clip-{float(t1)}-{float(t2)}.{FMT_MP4}",
+            self.output_dir()
+            / f"{self.video_id}-clip-{float(t1)}-{float(t2)}.{FMT_MP4}",
             False if force is None else force,
         )
 
-        with VideoFileClip(str(self.filepath)) as vid:
+        with self.reader_pool.reader(self.filepath) as vid:
             subclip = vid.subclip(t1, t2)
             if strip_sound:
                 subclip = subclip.without_audio()
-            subclip.write_videofile(str(output_file))
+            with profiling.span("clip", CAT_ENCODE, duration=t2 - t1):
+                subclip.write_videofile(str(output_file), **self.write_kwargs(profile))
+
+        return self.derive(output_file, self.edl.clip(t1, t2, strip_sound))
+
+    @classmethod
+    def load_cut_list(cls, file: Path | str) -> list[dict]:
+        """Read cut list (CSV with t1,t2[,name] header or JSON list of records).
+
+        Outputs records with parsed t1/t2 (seconds) and name (None if absent).
+        """
+
+        file = Path(file).expanduser().absolute()
+        fmt = file.suffix[1:].lower()
+        if fmt not in CUT_LIST_FORMATS:
+            raise exceptions.ValidationError("Unsupported cut list format", file.name)
+
+        with open(file, newline="") as f:
+            records = json.load(f) if fmt == CUT_LIST_JSON else list(csv.DictReader(f))
+
+        cuts = []
+        for record in records:
+            t1 = utils.parse_time_value(record["t1"])
+            t2 = utils.parse_time_value(record["t2"])
+            if t1 >= t2:
+                raise exceptions.ValidationError(
+                    "Incorrect time range in cut list", (t1, t2)
+                )
+            cuts.append({"t1": t1, "t2": t2, "name": record.get("name") or None})
+
+        return cuts
+
+    def clip_many(
+        self,
+        cuts: list[dict],
+        output_dir: Path | str | None = None,
+        subs: Subs | None = None,
+        strip_sound: bool | None = False,
+        force: bool | None = False,
+        profile: str | None = None,
+        snap: bool | None = False,
+    ) -> list[Video]:
+        """Cut several clips decoding the source once, encoding them in parallel.
+
+        ffmpeg releases before 7.0 encode the outputs of one process sequentially,
+        there every clip gets its own encoder process fed from the single decode
+        (named pipes, POSIX only, otherwise sequential).
+
+        Clip subtitles (shifted to clip start) are saved next to each clip.
+
+        - cuts (list[dict]): records of t1, t2 and name (see load_cut_list)
+        - output_dir (Path | str | None, optional (None)): clips directory
+        - subs (Subs | None, optional (None)): source transcript to cut along
+        - strip_sound (bool | None, optional (False)): drop audio
+        - force (bool | None, optional (False)): overwrite existing files
+        - profile (str | None, optional (None)): encode profile (ENCODE_PROFILES)
+        - snap (bool | None, optional (False)): widen cuts to enclosing keyframes
+        """
+
+        if not cuts:
+            raise exceptions.ValidationError("Empty cut list", cuts)
+        duration = self.duration
+        for cut in cuts:
+            if duration is not None and cut["t1"] >= duration:
+                raise exceptions.ValidationError("Cut starts after video end", cut)
+        if snap:
+            index = self.keyframe_index()
+            snapped = []
+            for cut in cuts:
+                t1, t2 = keyframes.widen(index, cut["t1"], cut["t2"], duration)
+                snapped.append({**cut, "t1": t1, "t2": t2})
+            cuts = snapped
+
+        output_dir = Path(output_dir or self.output_dir())
+        targets = []
+        for cut in cuts:
+            name = cut.get("name") or f"clip-{float(cut['t1'])}-{float(cut['t2'])}"
+            if self.video_id not in name:
+                name = f"{self.video_id}-{name}"
+            targets.append(
+                utils.derive_filepath(
+                    output_dir / f"{name}.{FMT_MP4}",
+                    self.video_id,
+                    FMT_MP4,
+                    output_dir,
+                    False if force is None else force,
+                )
+            )
+        duplicates = sorted({t.name for t in targets if targets.count(t) > 1})
+        if duplicates:
+            raise exceptions.ValidationError("Duplicate clip names", duplicates)
+
+        # seek close to the first cut instead of decoding from the beginning
+        offset = min(cut["t1"] for cut in cuts)
+        ranges = [(cut["t1"] - offset, cut["t2"] - offset) for cut in cuts]
+        audio_found = not strip_sound and self.has_audio
+
+        input_args = ["-ss", f"{offset:.3f}", "-i", str(self.filepath)]
+        input_args += ["-filter_complex", ffmpeg.trim_graph(ranges, audio=audio_found)]
+        output_args = self.encode_args(profile, with_audio=audio_found)
+        maps = [
+            ["-map", f"[v{i}]", *(["-map", f"[a{i}]"] if audio_found else [])]
+            for i in range(len(targets))
+        ]
+
+        with profiling.span("clip_many", CAT_ENCODE, count=len(cuts)):
+            if ffmpeg.threaded_outputs() or not hasattr(os, "mkfifo"):
+                args = ["-y", *input_args]
+                for output_maps, target in zip(maps, targets):
+                    args += [*output_maps, *output_args, str(target)]
+                ffmpeg.run(*args)
+            else:
+                ffmpeg.run_fanout(input_args, maps, output_args, targets)
+
+        clips = []
+        for cut, target in zip(cuts, targets):
+            clip = self.derive(target, self.edl.clip(cut["t1"], cut["t2"], strip_sound))
+            clip.kept_intervals = [[cut["t1"], cut["t2"]]]
+            if subs is not None:
+                clip_subs = subs.cut(cut["t1"], cut["t2"]).retime(
+                    intervals=clip.kept_intervals
+                )
+                clip_subs.save(target.with_suffix(f".{FMT_JSON}"), FMT_JSON, force)
+            clips.append(clip)
 
-        return Video(filepath=str(output_file))
+        return clips
 
     def modify_speed(
         self,
         factor: float | None = None,
         output_file: Path | str | None = None,
         force: bool | None = False,
+        profile: str | None = None,
     ) -> Video:
-        """Produces clip with a modified playback speed."""
+        """Produces clip with a modified playback speed (profile - see
+        ENCODE_PROFILES)."""
 
         if (
             not isinstance(factor, (int, float))
@@ -564,16 +1271,21 @@ class Video:
             output_file,
             self.video_id,
             FMT_MP4,
-            DEFAULT_DIR / f"{self.video_id}-spd-{factor}x.{FMT_MP4}",
+            self.output_dir() / f"{self.video_id}-spd-{factor}x.{FMT_MP4}",
             False if force is None else force,
         )
 
-        clip = VideoFileClip(str(self.filepath)).fx(vfx.speedx, factor)
-        clip.write_videofile(str(output_file))
+        with self.reader_pool.reader(self.filepath) as vid:
+            clip = vid.fx(vfx.speedx, factor)
+            with profiling.span("modify_speed", CAT_ENCODE, factor=factor):
+                clip.write_videofile(str(output_file), **self.write_kwargs(profile))
 
-        return Video(filepath=output_file)
+        edited = self.derive(output_file, self.edl.modify_speed(factor))
+        edited.speed_factor = factor
+        return edited
 
     @classmethod
+    @profiling.timed("find_speaking", CAT_AUDIO)
     def find_speaking(
         cls,
         audio_clip: AudioFileClip,
@@ -598,70 +1310,180 @@ class Video:
             v = s.max_volume()
             silent_windows.append(v < volume_threshold)
 
-        speaking_start = 0
-        speaking_end = 0
-        active_intervals = []
-        for i in range(1, len(silent_windows)):
-            e1 = silent_windows[i - 1]
-            e2 = silent_windows[i]
-
-            if e1 and not e2:
-                speaking_start = i * window_size
-
-            if not e1 and e2:
-                speaking_end = i * window_size
-                new_speaking_interval = [
-                    speaking_start - ease_in,
-                    speaking_end + ease_in,
-                ]
-
-                # With tiny windows, this can sometimes overlap the previous window, so merge.
-                need_to_merge = (
-                    len(active_intervals) > 0
-                    and active_intervals[-1][1] > new_speaking_interval[0]
-                )
-                if need_to_merge:
-                    merged_interval = [
-                        active_intervals[-1][0],
-                        new_speaking_interval[1],
-                    ]
-                    active_intervals[-1] = merged_interval
-                else:
-                    active_intervals.append(new_speaking_interval)
-
-        return active_intervals
+        return audio.speaking_intervals(silent_windows, window_size, ease_in)
 
     def cut_silence(
         self,
         output_file: Path | str | None = None,
         force: bool | None = False,
+        window_size: float = 0.1,
+        volume_threshold: float = 0.05,
+        ease_in: float = 0.1,
+        mode: str = audio.MODE_FIXED,
+        subs: Subs | None = None,
+        refine: bool | None = False,
+        profile: str | None = None,
     ) -> Video:
         """Cuts silent parts of a video.
 
+        Silence is detected on the loudness envelope cached next to the source
+        file (see audio.Envelope), so re-running with other thresholds is cheap.
+
         - output_file (Path | str | None, optional (None)): override output file
         - force (bool | None, optional (False)): overwrite if already exists
+        - window_size (float, optional (0.1)): (in seconds) silence detection window
+        - volume_threshold (float, optional (0.05)): silence volume threshold
+        - ease_in (float, optional (0.1)): (in seconds) padding around speech
+        - mode (str, optional (MODE_FIXED)): silence detection mode, adaptive
+            ignores volume_threshold and estimates it from the noise floor
+        - subs (Subs | None, optional (None)): transcript (MODE_TRANSCRIPT only)
+        - refine (bool | None, optional (False)): check audio around transcript
+            cue edges (MODE_TRANSCRIPT only)
+        - profile (str | None, optional (None)): encode profile (ENCODE_PROFILES)
         """
 
+        if mode == audio.MODE_TRANSCRIPT and subs is None:
+            raise exceptions.ValidationError("Transcript mode requires subs", mode)
+
         output_file = utils.derive_filepath(
             output_file,
             self.video_id,
             FMT_MP4,
-            DEFAULT_DIR / f"{self.video_id}-cleaned.{FMT_MP4}",
+            self.output_dir() / f"{self.video_id}-cleaned.{FMT_MP4}",
             False if force is None else force,
         )
 
-        vid = VideoFileClip(str(self.filepath))
-        intervals = self.find_speaking(
-            vid.audio, window_size=0.1, volume_threshold=0.05, ease_in=0.1
-        )
+        if mode == audio.MODE_TRANSCRIPT:
+            intervals = audio.transcript_speaking(
+                subs.transcript,
+                source=self.filepath if refine else None,
+                volume_threshold=volume_threshold,
+                ease_in=ease_in,
+            )
+        else:
+            intervals = audio.detect_speaking(
+                self.filepath,
+                window_size=window_size,
+                volume_threshold=volume_threshold,
+                ease_in=ease_in,
+                mode=mode,
+            )
         print("Keeping intervals: " + str(intervals))
-        clips = [vid.subclip(max(start, 0), end) for [start, end] in intervals]
-
-        edited_vid = concatenate_videoclips(clips)
-        edited_vid.write_videofile(str(output_file))
+        with self.reader_pool.reader(self.filepath) as vid:
+            kept = [
+                [max(start, 0), min(end, vid.duration)]
+                for [start, end] in intervals
+                if start < vid.duration
+            ]
+            with profiling.span("subclips", CAT_VIDEO, count=len(kept)):
+                clips = [vid.subclip(start, end) for [start, end] in kept]
+                edited_vid = concatenate_videoclips(clips)
+
+            with profiling.span("cut_silence", CAT_ENCODE):
+                edited_vid.write_videofile(
+                    str(output_file), **self.write_kwargs(profile)
+                )
 
         print(f"Initial video duration: {vid.duration:.2f} seconds")
         print(f"Edited video duration: {edited_vid.duration:.2f} seconds")
         print(f"Diff: {(vid.duration - edited_vid.duration):.2f} seconds")
 
-        return Video(filepath=output_file)
+        edited = self.derive(output_file, self.edl.keep(kept))
+        edited.kept_intervals = kept
+        return edited
+
+    def output_dir(self) -> Path:
+        """Default directory for derived files (previews from proxies kept apart)."""
+
+        return DEFAULT_DIR / proxy.PROXY_DIR_NAME if self.is_proxy else DEFAULT_DIR
+
+    def derive(self, filepath: Path | str, edl: EDL) -> Video:
+        """Video for a file produced from this one (edl: edits applied so far)."""
+
+        derived = Video(filepath=filepath)
+        derived.is_proxy = self.is_proxy
+        derived.edl = edl
+        return derived
+
+    def edit(self) -> EDL:
+        """Lazy edit decision list continuing from this file's edits.
+
+        Operations on the returned EDL are only recorded, render_edl applies
+        them all to the source file in a single decode/encode pass.
+        """
+
+        return self.edl
+
+    def proxy_video(
+        self, height: int = proxy.PROXY_HEIGHT, force: bool | None = False
+    ) -> Video:
+        """Low resolution proxy (cached next to the file) for previewing edits.
+
+        Operations on the proxy (and its derivatives) are recorded, render_edits
+        replays them on the full resolution file in a single render.
+
+        - height (int, optional (PROXY_HEIGHT)): proxy frame height
+        - force (bool | None, optional (False)): re-encode even if cached
+        """
+
+        preview = Video(filepath=proxy.make_proxy(self.filepath, height, force))
+        preview.is_proxy = True
+        preview.edl = self.edl
+        return preview
+
+    def render_edits(
+        self,
+        output_file: Path | str | None = None,
+        force: bool | None = False,
+        profile: str | None = None,
+    ) -> Video:
+        """Replay recorded edits on the (full resolution) source in one render.
+
+        See render_edl for parameters.
+        """
+
+        return self.render_edl(self.edl, output_file, force, profile)
+
+    @classmethod
+    def render_edl(
+        cls,
+        edl: EDL,
+        output_file: Path | str | None = None,
+        force: bool | None = False,
+        profile: str | None = None,
+    ) -> Video:
+        """Render edit decision list in a single decode/encode pass of its source.
+
+        - edl (EDL): edit decision list
+        - output_file (Path | str | None, optional (None)): override output file
+        - force (bool | None, optional (False)): overwrite if already exists
+        - profile (str | None, optional (None)): encode profile (ENCODE_PROFILES)
+        """
+
+        video_id = cls.extract_video_id(edl.source.name)
+        output_file = utils.derive_filepath(
+            output_file,
+            video_id,
+            FMT_MP4,
+            DEFAULT_DIR / f"{video_id}-render.{FMT_MP4}",
+            False if force is None else force,
+        )
+
+        with cls.reader_pool.reader(edl.source) as vid:
+            plan = edl.plan(vid.duration)
+            if not plan["segments"]:
+                raise exceptions.ValidationError("Edits leave nothing to render")
+
+            edited = concatenate_videoclips(
+                [vid.subclip(start, end) for start, end in plan["segments"]]
+            )
+            if plan["factor"] != 1:
+                edited = edited.fx(vfx.speedx, plan["factor"])
+            if plan["strip_sound"]:
+                edited = edited.without_audio()
+            with profiling.span("render_edl", CAT_ENCODE, edits=len(edl.edits)):
+                edited.write_videofile(str(output_file), **cls.write_kwargs(profile))
+
+        rendered = Video(filepath=output_file)
+        rendered.edl = edl
+        return rendered